@@ -7,17 +7,29 @@ from app.data.repositories.google_sheets_repository import GoogleSheetsTransacao
 from app.data.repositories.google_sheets_credito_repository import GoogleSheetsCreditoRepository
 from app.data.repositories.google_sheets_configuracao_repository import GoogleSheetsConfiguracaoRepository
 from app.data.repositories.google_sheets_api_repository import GoogleSheetsAPIRepository
+from app.data.repositories.sqlite_transacao_repository import SqliteTransacaoRepository
+from app.data.repositories.sqlite_credito_repository import SqliteCreditoRepository
+from app.data.sheets_connection import SheetsConnectionManager
+from app.data.write_behind import flush_write_behind_queues
 from app.use_cases.listar_transacoes_paginadas import ListarTransacoesPaginadas
 from app.use_cases.criar_transacao import CriarTransacao
 from app.use_cases.atualizar_transacao import AtualizarTransacao
 from app.use_cases.deletar_transacao import DeletarTransacao
+from app.use_cases.criar_transacoes_em_lote import CriarTransacoesEmLote
+from app.use_cases.atualizar_transacoes_em_lote import AtualizarTransacoesEmLote
+from app.use_cases.deletar_transacoes_em_lote import DeletarTransacoesEmLote
 from app.use_cases.listar_transacoes_credito_paginadas import ListarTransacoesCreditoPaginadas
 from app.use_cases.criar_transacao_credito import CriarTransacaoCredito
 from app.use_cases.atualizar_transacao_credito import AtualizarTransacaoCredito
 from app.use_cases.deletar_transacao_credito import DeletarTransacaoCredito
-from app.use_cases.verificar_saude import VerificarSaude
-from app.use_cases.saldos import ObterSaldoGeral, ObterSaldoPorConta
+from app.use_cases.criar_transacoes_credito_em_lote import CriarTransacoesCreditoEmLote
+from app.use_cases.atualizar_transacoes_credito_em_lote import AtualizarTransacoesCreditoEmLote
+from app.use_cases.deletar_transacoes_credito_em_lote import DeletarTransacoesCreditoEmLote
+from app.use_cases.gravar_alteracoes_pendentes import GravarAlteracoesPendentes
+from app.use_cases.verificar_saude import VerificarSaude, VerificarProntidao
+from app.use_cases.saldos import ObterSaldos, ObterSaldoPorConta
 from app.use_cases.configuracoes import (
+    ListarConfiguracoes,
     ListarCategorias, CriarCategoria, DeletarCategoria,
     ListarStatus, ListarMeses,
     ListarContas, CriarConta, AtualizarConta, DeletarConta,
@@ -25,6 +37,16 @@ from app.use_cases.configuracoes import (
 )
 
 
+# ==================== CONEXÃO ====================
+
+@lru_cache()
+def get_sheets_connection() -> SheetsConnectionManager:
+    """
+    Factory para obter a conexão com o Google Sheets compartilhada por todos os repositórios
+    """
+    return SheetsConnectionManager(get_settings())
+
+
 # ==================== TRANSAÇÕES ====================
 
 @lru_cache()
@@ -33,7 +55,10 @@ def get_transacao_repository():
     Factory para obter instância do repositório de transações
     """
     settings = get_settings()
-    return GoogleSheetsTransacaoRepository(settings)
+    repository = GoogleSheetsTransacaoRepository(settings, get_sheets_connection())
+    if settings.read_backend == "sqlite":
+        return SqliteTransacaoRepository(settings, repository)
+    return repository
 
 
 def get_listar_transacoes_use_case() -> ListarTransacoesPaginadas:
@@ -68,14 +93,48 @@ def get_deletar_transacao_use_case() -> DeletarTransacao:
     return DeletarTransacao(repository)
 
 
+def get_criar_transacoes_em_lote_use_case() -> CriarTransacoesEmLote:
+    """
+    Factory para obter instância do caso de uso de criar transações em lote
+    """
+    repository = get_transacao_repository()
+    return CriarTransacoesEmLote(repository)
+
+
+def get_atualizar_transacoes_em_lote_use_case() -> AtualizarTransacoesEmLote:
+    """
+    Factory para obter instância do caso de uso de atualizar transações em lote
+    """
+    repository = get_transacao_repository()
+    return AtualizarTransacoesEmLote(repository)
+
+
+def get_deletar_transacoes_em_lote_use_case() -> DeletarTransacoesEmLote:
+    """
+    Factory para obter instância do caso de uso de deletar transações em lote
+    """
+    repository = get_transacao_repository()
+    return DeletarTransacoesEmLote(repository)
+
+
 def get_verificar_saude_use_case() -> VerificarSaude:
     """
-    Factory para obter instância do caso de uso de verificar saúde
+    Factory para obter instância do caso de uso de verificar saúde (deep)
     """
     repository = get_transacao_repository()
     return VerificarSaude(repository)
 
 
+@lru_cache()
+def get_verificar_prontidao_use_case() -> VerificarProntidao:
+    """
+    Factory para obter instância do caso de uso de verificar prontidão
+    
+    A instância é única para que o resultado da última verificação seja reaproveitado.
+    """
+    return VerificarProntidao(get_transacao_repository, get_settings())
+
+
 # ==================== TRANSAÇÕES DE CRÉDITO ====================
 
 @lru_cache()
@@ -84,7 +143,10 @@ def get_transacao_credito_repository():
     Factory para obter instância do repositório de transações de crédito
     """
     settings = get_settings()
-    return GoogleSheetsCreditoRepository(settings)
+    repository = GoogleSheetsCreditoRepository(settings, get_sheets_connection())
+    if settings.read_backend == "sqlite":
+        return SqliteCreditoRepository(settings, repository)
+    return repository
 
 
 def get_listar_transacoes_credito_use_case() -> ListarTransacoesCreditoPaginadas:
@@ -119,6 +181,30 @@ def get_deletar_transacao_credito_use_case() -> DeletarTransacaoCredito:
     return DeletarTransacaoCredito(repository)
 
 
+def get_criar_transacoes_credito_em_lote_use_case() -> CriarTransacoesCreditoEmLote:
+    """
+    Factory para obter instância do caso de uso de criar transações de crédito em lote
+    """
+    repository = get_transacao_credito_repository()
+    return CriarTransacoesCreditoEmLote(repository)
+
+
+def get_atualizar_transacoes_credito_em_lote_use_case() -> AtualizarTransacoesCreditoEmLote:
+    """
+    Factory para obter instância do caso de uso de atualizar transações de crédito em lote
+    """
+    repository = get_transacao_credito_repository()
+    return AtualizarTransacoesCreditoEmLote(repository)
+
+
+def get_deletar_transacoes_credito_em_lote_use_case() -> DeletarTransacoesCreditoEmLote:
+    """
+    Factory para obter instância do caso de uso de deletar transações de crédito em lote
+    """
+    repository = get_transacao_credito_repository()
+    return DeletarTransacoesCreditoEmLote(repository)
+
+
 # ==================== CONFIGURAÇÕES ====================
 
 @lru_cache()
@@ -127,7 +213,14 @@ def get_configuracao_repository():
     Factory para obter instância do repositório de configurações
     """
     settings = get_settings()
-    return GoogleSheetsConfiguracaoRepository(settings)
+    return GoogleSheetsConfiguracaoRepository(settings, get_sheets_connection())
+
+
+# Todas as configurações
+def get_listar_configuracoes_use_case() -> ListarConfiguracoes:
+    """Factory para listar todas as configurações"""
+    repository = get_configuracao_repository()
+    return ListarConfiguracoes(repository)
 
 
 # Categorias
@@ -221,16 +314,25 @@ def get_api_repository():
     Factory para obter instância do repositório da página API
     """
     settings = get_settings()
-    return GoogleSheetsAPIRepository(settings)
+    return GoogleSheetsAPIRepository(settings, get_sheets_connection())
 
 
-def get_obter_saldo_geral_use_case() -> ObterSaldoGeral:
-    """Factory para obter saldo geral"""
+def get_obter_saldos_use_case() -> ObterSaldos:
+    """Factory para obter o saldo geral e o saldo por conta"""
     repository = get_api_repository()
-    return ObterSaldoGeral(repository)
+    return ObterSaldos(repository)
 
 
 def get_obter_saldo_por_conta_use_case() -> ObterSaldoPorConta:
     """Factory para obter saldo por conta"""
     repository = get_api_repository()
     return ObterSaldoPorConta(repository)
+
+
+# ==================== ADMINISTRAÇÃO ====================
+
+def get_gravar_alteracoes_pendentes_use_case() -> GravarAlteracoesPendentes:
+    """
+    Factory para obter instância do caso de uso de gravar as alterações pendentes (write-behind)
+    """
+    return GravarAlteracoesPendentes(get_settings().write_behind_enabled, flush_write_behind_queues)
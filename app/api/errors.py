@@ -0,0 +1,34 @@
+"""
+Conversão das falhas do Google Sheets em respostas HTTP
+"""
+import math
+
+from fastapi import HTTPException
+
+from app.data.sheets_errors import SheetsError, SheetsNotFoundError, SheetsQuotaError
+
+
+def sheets_http_exception(error: SheetsError, detail: str) -> HTTPException:
+    """
+    Monta a resposta HTTP para uma falha classificada do Google Sheets
+    
+    Cota esgotada vira 429 e indisponibilidade (5xx do Google, timeout,
+    credencial, circuit breaker aberto) vira 503, ambos com Retry-After
+    quando há uma sugestão de espera. Aba ou planilha inexistente é erro de
+    configuração do servidor (500).
+    
+    Args:
+        error: Falha classificada
+        detail: Mensagem da resposta
+    
+    Returns:
+        HTTPException a ser lançada pela rota
+    """
+    if isinstance(error, SheetsNotFoundError):
+        return HTTPException(status_code=500, detail=detail)
+    
+    status_code = 429 if isinstance(error, SheetsQuotaError) else 503
+    headers = None
+    if error.retry_after is not None:
+        headers = {"Retry-After": str(max(1, math.ceil(error.retry_after)))}
+    return HTTPException(status_code=status_code, detail=detail, headers=headers)
@@ -0,0 +1,88 @@
+"""
+Middleware de métricas das requisições HTTP
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from app.core.metrics import Counter, Histogram, get_metrics_registry
+
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Rota usada quando a requisição não corresponde a nenhuma rota (evita uma série por URL)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Mede cada requisição HTTP por rota
+    
+    Registra a latência em `http_request_duration_seconds{method,route}`, o
+    total em `http_requests_total{method,route,status}` e as requisições em
+    andamento em `http_requests_in_flight`. A rota é o modelo declarado
+    (ex: /api/transacoes/{row_index}), não a URL, para manter poucas séries.
+    
+    É um middleware ASGI puro (sem BaseHTTPMiddleware): não copia o corpo
+    nem cria tarefas por requisição.
+    """
+    
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]):
+        self.app = app
+        self._registry = get_metrics_registry()
+        self._in_flight = self._registry.gauge("http_requests_in_flight", "Requisições HTTP em andamento")
+        self._durations: Dict[Tuple[str, str], Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], Counter] = {}
+    
+    def _duration(self, method: str, route: str) -> Histogram:
+        """Histograma de latência da rota"""
+        key = (method, route)
+        histogram = self._durations.get(key)
+        if histogram is None:
+            histogram = self._registry.histogram(
+                "http_request_duration_seconds",
+                "Latência das requisições HTTP por rota",
+                {"method": method, "route": route}
+            )
+            self._durations[key] = histogram
+        return histogram
+    
+    def _counter(self, method: str, route: str, status: str) -> Counter:
+        """Contador de requisições da rota por status"""
+        key = (method, route, status)
+        counter = self._requests.get(key)
+        if counter is None:
+            counter = self._registry.counter(
+                "http_requests_total",
+                "Requisições HTTP por rota e status",
+                {"method": method, "route": route, "status": status}
+            )
+            self._requests[key] = counter
+        return counter
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status = "500"
+        
+        async def send_with_status(message: Dict[str, Any]):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+        
+        self._in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._in_flight.dec()
+            # O roteador do FastAPI grava a rota encontrada no próprio scope
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            method = scope.get("method", "")
+            self._duration(method, route).observe(elapsed)
+            self._counter(method, route, status).inc()
@@ -0,0 +1,36 @@
+"""
+Rotas administrativas
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from app.domain.schemas import WriteBehindFlushResponse
+from app.use_cases.gravar_alteracoes_pendentes import GravarAlteracoesPendentes
+from app.api.dependencies import get_gravar_alteracoes_pendentes_use_case
+from app.core.executor import run_blocking
+from app.api.errors import sheets_http_exception
+from app.data.sheets_errors import SheetsError
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Administração"]
+)
+
+
+@router.post("/flush", response_model=WriteBehindFlushResponse)
+async def gravar_alteracoes_pendentes(
+    use_case: GravarAlteracoesPendentes = Depends(get_gravar_alteracoes_pendentes_use_case)
+):
+    """
+    Grava imediatamente na planilha as alterações em fila do modo write-behind
+    
+    Retorna as estatísticas de cada fila após a gravação (`pending` > 0 e
+    `last_error` preenchido indicam que a gravação falhou e será tentada
+    novamente em segundo plano).
+    """
+    try:
+        result = await run_blocking(use_case.execute)
+        return WriteBehindFlushResponse(**result)
+    
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
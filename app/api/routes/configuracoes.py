@@ -4,6 +4,7 @@ Rotas de configurações (Categorias, Status, Contas e Cartões)
 from fastapi import APIRouter, HTTPException, Depends, status
 from typing import List
 from app.domain.schemas import (
+    ConfiguracoesResponse,
     CategoriaSchema, CreateCategoriaRequest,
     StatusSchema, MesSchema,
     ContaSchema, CreateContaRequest, UpdateContaRequest,
@@ -11,17 +12,22 @@ from app.domain.schemas import (
     SuccessResponse
 )
 from app.use_cases.configuracoes import (
+    ListarConfiguracoes,
     ListarCategorias, CriarCategoria, DeletarCategoria,
     ListarStatus, ListarMeses,
     ListarContas, CriarConta, AtualizarConta, DeletarConta,
     ListarCartoes, CriarCartao, AtualizarCartao, DeletarCartao
 )
 from app.api.dependencies import (
+    get_listar_configuracoes_use_case,
     get_listar_categorias_use_case, get_criar_categoria_use_case, get_deletar_categoria_use_case,
     get_listar_status_use_case, get_listar_meses_use_case,
     get_listar_contas_use_case, get_criar_conta_use_case, get_atualizar_conta_use_case, get_deletar_conta_use_case,
     get_listar_cartoes_use_case, get_criar_cartao_use_case, get_atualizar_cartao_use_case, get_deletar_cartao_use_case
 )
+from app.core.executor import run_blocking
+from app.api.errors import sheets_http_exception
+from app.data.sheets_errors import SheetsError
 
 router = APIRouter(
     prefix="/api/configuracoes",
@@ -29,6 +35,27 @@ router = APIRouter(
 )
 
 
+# ==================== TODAS AS CONFIGURAÇÕES ====================
+
+@router.get("", response_model=ConfiguracoesResponse)
+async def listar_configuracoes(
+    use_case: ListarConfiguracoes = Depends(get_listar_configuracoes_use_case)
+):
+    """
+    Lista categorias, status, meses, contas e cartões em uma única resposta
+    
+    Todas as listas vêm de uma única leitura das colunas A–G da aba
+    Configurações (uma requisição ao Google Sheets, ou nenhuma com o cache válido).
+    """
+    try:
+        configuracoes = await run_blocking(use_case.execute)
+        return ConfiguracoesResponse(**configuracoes.to_dict())
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ==================== CATEGORIAS ====================
 
 @router.get("/categorias", response_model=List[CategoriaSchema])
@@ -37,8 +64,10 @@ async def listar_categorias(
 ):
     """Lista todas as categorias"""
     try:
-        categorias = use_case.execute()
+        categorias = await run_blocking(use_case.execute)
         return [CategoriaSchema(**c.to_dict()) for c in categorias]
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -50,10 +79,12 @@ async def criar_categoria(
 ):
     """Cria uma nova categoria"""
     try:
-        categoria = use_case.execute(request.nome)
+        categoria = await run_blocking(use_case.execute, request.nome)
         return CategoriaSchema(**categoria.to_dict())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -65,10 +96,12 @@ async def deletar_categoria(
 ):
     """Deleta uma categoria"""
     try:
-        use_case.execute(nome)
+        await run_blocking(use_case.execute, nome)
         return SuccessResponse(message=f"Categoria '{nome}' deletada com sucesso")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -87,10 +120,12 @@ async def listar_status(
     - Se não especificado, retorna todos os status de ambos os tipos
     """
     try:
-        status_list = use_case.execute(tipo)
+        status_list = await run_blocking(use_case.execute, tipo)
         return [StatusSchema(**s.to_dict()) for s in status_list]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -103,8 +138,10 @@ async def listar_meses(
 ):
     """Lista todos os meses da coluna G (Configurações!G2:G)"""
     try:
-        meses = use_case.execute()
+        meses = await run_blocking(use_case.execute)
         return [MesSchema(**m.to_dict()) for m in meses]
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -117,8 +154,10 @@ async def listar_contas(
 ):
     """Lista todas as contas"""
     try:
-        contas = use_case.execute()
+        contas = await run_blocking(use_case.execute)
         return [ContaSchema(**c.to_dict()) for c in contas]
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -130,10 +169,12 @@ async def criar_conta(
 ):
     """Cria uma nova conta"""
     try:
-        conta = use_case.execute(request.nome)
+        conta = await run_blocking(use_case.execute, request.nome)
         return ContaSchema(**conta.to_dict())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -146,10 +187,12 @@ async def atualizar_conta(
 ):
     """Atualiza o nome de uma conta existente"""
     try:
-        conta = use_case.execute(nome, request.nome)
+        conta = await run_blocking(use_case.execute, nome, request.nome)
         return ContaSchema(**conta.to_dict())
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -161,10 +204,12 @@ async def deletar_conta(
 ):
     """Deleta uma conta"""
     try:
-        use_case.execute(nome)
+        await run_blocking(use_case.execute, nome)
         return SuccessResponse(message=f"Conta '{nome}' deletada com sucesso")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -177,8 +222,10 @@ async def listar_cartoes(
 ):
     """Lista todos os cartões"""
     try:
-        cartoes = use_case.execute()
+        cartoes = await run_blocking(use_case.execute)
         return [CartaoSchema(**c.to_dict()) for c in cartoes]
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -190,10 +237,12 @@ async def criar_cartao(
 ):
     """Cria um novo cartão"""
     try:
-        cartao = use_case.execute(request.nome)
+        cartao = await run_blocking(use_case.execute, request.nome)
         return CartaoSchema(**cartao.to_dict())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -206,10 +255,12 @@ async def atualizar_cartao(
 ):
     """Atualiza o nome de um cartão existente"""
     try:
-        cartao = use_case.execute(nome, request.nome)
+        cartao = await run_blocking(use_case.execute, nome, request.nome)
         return CartaoSchema(**cartao.to_dict())
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -221,9 +272,11 @@ async def deletar_cartao(
 ):
     """Deleta um cartão"""
     try:
-        use_case.execute(nome)
+        await run_blocking(use_case.execute, nome)
         return SuccessResponse(message=f"Cartão '{nome}' deletado com sucesso")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,10 +1,12 @@
 """
 Rotas de health check
 """
-from fastapi import APIRouter, Depends
-from app.domain.schemas import HealthCheckResponse
-from app.use_cases.verificar_saude import VerificarSaude
-from app.api.dependencies import get_verificar_saude_use_case
+from fastapi import APIRouter, Depends, HTTPException
+from app.core.config import get_settings
+from app.domain.schemas import HealthCheckResponse, LivenessResponse
+from app.use_cases.verificar_saude import VerificarSaude, VerificarProntidao
+from app.api.dependencies import get_verificar_saude_use_case, get_verificar_prontidao_use_case
+from app.core.executor import run_blocking
 
 router = APIRouter(
     prefix="/api",
@@ -14,10 +16,58 @@ router = APIRouter(
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check(
-    use_case: VerificarSaude = Depends(get_verificar_saude_use_case)
+    use_case: VerificarProntidao = Depends(get_verificar_prontidao_use_case)
 ):
     """
     Verifica o status da API e conexão com Google Sheets
+    
+    Equivalente a `/api/health/ready`: consulta apenas metadados da planilha
+    e reaproveita o resultado por alguns segundos.
+    """
+    result = await run_blocking(use_case.execute)
+    return HealthCheckResponse(**result)
+
+
+@router.get("/health/live", response_model=LivenessResponse)
+async def liveness_check():
+    """
+    Verifica se o processo está no ar (não acessa o Google Sheets)
+    """
+    return LivenessResponse(status="ok", version=get_settings().app_version)
+
+
+@router.get("/health/ready", response_model=HealthCheckResponse)
+async def readiness_check(
+    use_case: VerificarProntidao = Depends(get_verificar_prontidao_use_case)
+):
+    """
+    Verifica credenciais, token de acesso e acesso à planilha
+    
+    Faz apenas uma consulta de metadados no Drive (sem baixar os dados) e o
+    resultado é reaproveitado durante `HEALTH_CHECK_INTERVAL_SECONDS`.
+    """
+    result = await run_blocking(use_case.execute)
+    return HealthCheckResponse(**result)
+
+
+def require_deep_check_enabled():
+    """Bloqueia o deep health check quando não habilitado (antes de conectar à planilha)"""
+    if not get_settings().health_deep_check_enabled:
+        raise HTTPException(status_code=404, detail="Deep health check desabilitado")
+
+
+@router.get(
+    "/health/deep",
+    response_model=HealthCheckResponse,
+    dependencies=[Depends(require_deep_check_enabled)]
+)
+async def deep_health_check(
+    use_case: VerificarSaude = Depends(get_verificar_saude_use_case)
+):
+    """
+    Verificação completa: lê a aba de transações inteira sem usar o cache
+    
+    Desabilitada por padrão; habilite com `HEALTH_DEEP_CHECK_ENABLED=true`.
     """
-    result = use_case.execute()
+    result = await run_blocking(use_case.execute)
     return HealthCheckResponse(**result)
@@ -0,0 +1,43 @@
+"""
+Rotas de métricas internas
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from typing import Dict
+from app.core.metrics import get_metrics_registry
+
+router = APIRouter(
+    prefix="/api/metrics",
+    tags=["Métricas"]
+)
+
+
+@router.get("", response_model=Dict[str, float])
+async def obter_metricas():
+    """
+    Retorna os contadores internos da aplicação
+    
+    Inclui hits/misses dos caches de leitura das planilhas. Histogramas
+    aparecem apenas como `_count` e `_sum` (as faixas estão em `/metrics`).
+    """
+    return get_metrics_registry().snapshot()
+
+
+# Endpoint no formato de texto do Prometheus, no caminho padrão dos coletores
+prometheus_router = APIRouter(tags=["Métricas"])
+
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse)
+async def exportar_metricas_prometheus():
+    """
+    Retorna todas as métricas no formato de texto do Prometheus
+    
+    Inclui os histogramas de latência por rota (`http_request_duration_seconds`)
+    e por operação do Google Sheets (`sheets_operation_duration_seconds`), as
+    linhas lidas por chamada (`sheets_fetch_rows`), a taxa de acerto dos caches
+    (`sheets_cache_hit_ratio`) e as requisições em andamento.
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
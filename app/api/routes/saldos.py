@@ -3,9 +3,12 @@ Rotas de saldos
 """
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List
-from app.domain.schemas import SaldoSchema, SaldoContaSchema
-from app.use_cases.saldos import ObterSaldoGeral, ObterSaldoPorConta
-from app.api.dependencies import get_obter_saldo_geral_use_case, get_obter_saldo_por_conta_use_case
+from app.domain.schemas import SaldosResponse, SaldoContaSchema
+from app.use_cases.saldos import ObterSaldos, ObterSaldoPorConta
+from app.api.dependencies import get_obter_saldos_use_case, get_obter_saldo_por_conta_use_case
+from app.core.executor import run_blocking
+from app.api.errors import sheets_http_exception
+from app.data.sheets_errors import SheetsError
 
 router = APIRouter(
     prefix="/api/saldos",
@@ -13,23 +16,26 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=SaldoSchema)
-async def obter_saldo_geral(
-    use_case: ObterSaldoGeral = Depends(get_obter_saldo_geral_use_case)
+@router.get("", response_model=SaldosResponse)
+async def obter_saldos(
+    use_case: ObterSaldos = Depends(get_obter_saldos_use_case)
 ):
     """
-    Retorna o saldo geral da célula A2 da página API
+    Retorna o saldo geral (célula A2) e o saldo de cada conta (tabela O:P) da página API
     
-    Retorna o valor total consolidado de todas as contas.
+    Os dois vêm de uma única leitura da planilha, mantida em cache por alguns
+    segundos e compartilhada entre requisições simultâneas.
     """
     try:
-        saldo = use_case.execute()
-        return SaldoSchema(**saldo.to_dict())
+        saldos = await run_blocking(use_case.execute)
+        return SaldosResponse(**saldos.to_dict())
         
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao obter saldos: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Erro ao obter saldo geral: {str(e)}"
+            detail=f"Erro ao obter saldos: {str(e)}"
         )
 
 
@@ -43,9 +49,11 @@ async def obter_saldo_por_conta(
     Lista todas as contas com seus respectivos saldos.
     """
     try:
-        saldos = use_case.execute()
+        saldos = await run_blocking(use_case.execute)
         return [SaldoContaSchema(**saldo.to_dict()) for saldo in saldos]
         
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao obter saldo por conta: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
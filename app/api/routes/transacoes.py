@@ -8,18 +8,33 @@ from app.domain.schemas import (
     TransacaoSchema, 
     CreateTransacaoRequest, 
     UpdateTransacaoRequest,
+    BatchCreateTransacaoRequest,
+    BatchCreateTransacaoResponse,
+    BatchUpdateTransacaoRequest,
+    BatchUpdateTransacaoResponse,
+    BatchDeleteRequest,
+    BatchDeleteResponse,
     SuccessResponse
 )
 from app.use_cases.listar_transacoes_paginadas import ListarTransacoesPaginadas
 from app.use_cases.criar_transacao import CriarTransacao
 from app.use_cases.atualizar_transacao import AtualizarTransacao
 from app.use_cases.deletar_transacao import DeletarTransacao
+from app.use_cases.criar_transacoes_em_lote import CriarTransacoesEmLote
+from app.use_cases.atualizar_transacoes_em_lote import AtualizarTransacoesEmLote
+from app.use_cases.deletar_transacoes_em_lote import DeletarTransacoesEmLote
 from app.api.dependencies import (
     get_listar_transacoes_use_case, 
     get_criar_transacao_use_case,
     get_atualizar_transacao_use_case,
-    get_deletar_transacao_use_case
+    get_deletar_transacao_use_case,
+    get_criar_transacoes_em_lote_use_case,
+    get_atualizar_transacoes_em_lote_use_case,
+    get_deletar_transacoes_em_lote_use_case
 )
+from app.core.executor import run_blocking
+from app.api.errors import sheets_http_exception
+from app.data.sheets_errors import SheetsError
 
 router = APIRouter(
     prefix="/api/transacoes",
@@ -39,6 +54,8 @@ async def listar_transacoes(
     situacao: Optional[str] = Query(None, description="Filtro por situação (ex: Pago, A pagar, Recebido, A receber)"),
     conta: Optional[str] = Query(None, description="Filtro por conta"),
     order_by: str = Query("data", description="Campo para ordenação: data, tipo, categoria, valor, situacao, conta"),
+    usar_cursor: bool = Query(False, description="Ativa a paginação por cursor (retorna next_cursor)"),
+    cursor: Optional[str] = Query(None, description="Cursor retornado em next_cursor pela página anterior"),
     use_case: ListarTransacoesPaginadas = Depends(get_listar_transacoes_use_case)
 ):
     """
@@ -47,16 +64,19 @@ async def listar_transacoes(
     - **page**: Número da página (começa em 1)
     - **page_size**: Quantidade de itens por página (máximo 100)
     - **tipo**: Filtro por tipo (RECEITA ou DESPESA)
-    - **categoria**: Filtro por categoria/descritivo (busca parcial)
+    - **categoria**: Filtro por categoria/descritivo (busca parcial, sem diferenciar maiúsculas e acentos)
     - **data_inicio**: Data inicial no formato DD/MM/YYYY
     - **data_fim**: Data final no formato DD/MM/YYYY
     - **mes**: Filtro por mês (ex: Janeiro, Dezembro)
     - **situacao**: Filtro por situação (ex: Pago, A pagar para DESPESA; Recebido, A receber para RECEITA)
     - **conta**: Filtro por nome da conta
     - **order_by**: Campo para ordenação (data, tipo, categoria, valor, situacao, conta) - padrão: data
+    - **usar_cursor**: Pagina por cursor em vez de número de página; a resposta traz `next_cursor`
+    - **cursor**: Valor de `next_cursor` da página anterior (implica `usar_cursor`; `page` é ignorado)
     """
     try:
-        result = use_case.execute(
+        result = await run_blocking(
+            use_case.execute,
             page=page,
             page_size=page_size,
             tipo=tipo,
@@ -66,7 +86,9 @@ async def listar_transacoes(
             mes=mes,
             situacao=situacao,
             conta=conta,
-            order_by=order_by
+            order_by=order_by,
+            usar_cursor=usar_cursor,
+            cursor=cursor
         )
         
         # Converte entidades para schemas
@@ -80,11 +102,14 @@ async def listar_transacoes(
             page=result["page"],
             page_size=result["page_size"],
             total_pages=result["total_pages"],
-            items=transacoes_schema
+            items=transacoes_schema,
+            next_cursor=result.get("next_cursor")
         )
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao obter transações: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -110,7 +135,8 @@ async def criar_transacao(
     - **conta**: Conta relacionada
     """
     try:
-        transacao = use_case.execute(
+        transacao = await run_blocking(
+            use_case.execute,
             tipo=request.tipo,
             descritivo=request.descritivo,
             valor=request.valor,
@@ -125,6 +151,8 @@ async def criar_transacao(
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao criar transação: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -132,6 +160,108 @@ async def criar_transacao(
         )
 
 
+@router.post("/batch", response_model=BatchCreateTransacaoResponse, status_code=status.HTTP_201_CREATED)
+async def criar_transacoes_em_lote(
+    request: BatchCreateTransacaoRequest,
+    use_case: CriarTransacoesEmLote = Depends(get_criar_transacoes_em_lote_use_case)
+):
+    """
+    Cria várias transações com uma única gravação na planilha
+    
+    - **itens**: Lista de transações (mesmos campos da criação individual, máximo 1000)
+    
+    Cada item é validado individualmente: os inválidos são reportados em
+    `resultados` com o motivo, sem impedir a gravação dos demais.
+    """
+    try:
+        result = await run_blocking(
+            use_case.execute,
+            itens=[item.model_dump() for item in request.itens]
+        )
+        
+        for resultado in result["resultados"]:
+            if resultado["transacao"] is not None:
+                resultado["transacao"] = TransacaoSchema(**resultado["transacao"].to_dict())
+        
+        return BatchCreateTransacaoResponse(**result)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao criar transações em lote: {str(e)}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao criar transações em lote: {str(e)}"
+        )
+
+
+@router.put("/batch", response_model=BatchUpdateTransacaoResponse)
+async def atualizar_transacoes_em_lote(
+    request: BatchUpdateTransacaoRequest,
+    use_case: AtualizarTransacoesEmLote = Depends(get_atualizar_transacoes_em_lote_use_case)
+):
+    """
+    Atualiza várias transações com uma única chamada batch_update
+    
+    - **itens**: Lista com `row_index` e os campos da atualização individual (máximo 1000)
+    
+    Itens inválidos, com linha repetida ou inexistente são reportados em `resultados`
+    sem impedir a gravação dos demais.
+    """
+    try:
+        result = await run_blocking(
+            use_case.execute,
+            itens=[item.model_dump() for item in request.itens]
+        )
+        
+        for resultado in result["resultados"]:
+            if resultado["transacao"] is not None:
+                resultado["transacao"] = TransacaoSchema(**resultado["transacao"].to_dict())
+        
+        return BatchUpdateTransacaoResponse(**result)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao atualizar transações em lote: {str(e)}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao atualizar transações em lote: {str(e)}"
+        )
+
+
+@router.delete("/batch", response_model=BatchDeleteResponse)
+async def deletar_transacoes_em_lote(
+    request: BatchDeleteRequest,
+    use_case: DeletarTransacoesEmLote = Depends(get_deletar_transacoes_em_lote_use_case)
+):
+    """
+    Deleta várias transações com um único batchUpdate na planilha
+    
+    - **row_indexes**: Índices das linhas a deletar, como retornados pela listagem (máximo 1000)
+    
+    As linhas são removidas de baixo para cima, então todos os índices se
+    referem à planilha antes da remoção, em qualquer ordem. Linhas
+    inexistentes são reportadas em `resultados` sem impedir as demais.
+    """
+    try:
+        result = await run_blocking(use_case.execute, row_indexes=request.row_indexes)
+        
+        return BatchDeleteResponse(**result)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao deletar transações em lote: {str(e)}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao deletar transações em lote: {str(e)}"
+        )
+
+
 @router.put("/{row_index}", response_model=TransacaoSchema)
 async def atualizar_transacao(
     row_index: int,
@@ -152,7 +282,8 @@ async def atualizar_transacao(
     - **conta**: Conta relacionada
     """
     try:
-        transacao = use_case.execute(
+        transacao = await run_blocking(
+            use_case.execute,
             row_index=row_index,
             tipo=request.tipo,
             descritivo=request.descritivo,
@@ -168,6 +299,8 @@ async def atualizar_transacao(
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao atualizar transação: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -186,12 +319,14 @@ async def deletar_transacao(
     - **row_index**: Índice da linha na planilha (>= 2, pois linha 1 é o cabeçalho)
     """
     try:
-        use_case.execute(row_index=row_index)
+        await run_blocking(use_case.execute, row_index=row_index)
         
         return SuccessResponse(message=f"Transação na linha {row_index} deletada com sucesso")
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SheetsError as e:
+        raise sheets_http_exception(e, f"Erro ao deletar transação: {str(e)}")
     except Exception as e:
         raise HTTPException(
             status_code=500,
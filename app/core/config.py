@@ -26,6 +26,70 @@ class Settings(BaseSettings):
     default_page_size: int = 10
     max_page_size: int = 100
     
+    # Cache de leitura das planilhas (0 desabilita o cache)
+    cache_ttl_seconds: float = 30.0
+    # Ao expirar o TTL, consulta a revisão do arquivo no Drive e só baixa os dados se mudou
+    cache_revision_check: bool = True
+    # Idade máxima do snapshot antes de um recarregamento completo
+    cache_max_age_seconds: float = 600.0
+    # Cache curto dos saldos da página API (fórmulas; 0 desabilita o cache)
+    saldos_cache_ttl_seconds: float = 10.0
+    # Combinações (filtros, ordenação) com resultado ordenado mantido por snapshot (0 desabilita)
+    pagination_cache_entries: int = 64
+    
+    # Pool de threads para chamadas bloqueantes ao Google Sheets
+    sheets_max_workers: int = 8
+    # Cotas da API do Google Sheets (requisições por minuto; 0 desabilita o controle)
+    sheets_read_quota_per_minute: float = 60.0
+    sheets_write_quota_per_minute: float = 60.0
+    # Espera máxima por cota das requisições de usuários e das tarefas em segundo plano/lote
+    sheets_quota_timeout_seconds: float = 15.0
+    sheets_background_quota_timeout_seconds: float = 120.0
+    # Tentativas por chamada em falhas temporárias (5xx, timeout) e de cota (429)
+    sheets_retry_attempts: int = 3
+    sheets_retry_base_delay_seconds: float = 0.5
+    sheets_retry_max_delay_seconds: float = 8.0
+    # Circuit breaker: falhas consecutivas que suspendem as chamadas (0 desabilita) e duração da suspensão
+    sheets_circuit_failure_threshold: int = 5
+    sheets_circuit_reset_seconds: float = 30.0
+    # Linhas por chamada nas gravações em lote (append_rows)
+    sheets_batch_chunk_size: int = 500
+    
+    # Backend da planilha: "google" (API do Google Sheets) ou "fake" (planilha
+    # em memória com dados sintéticos, para testes de carga sem acesso ao Google)
+    sheets_backend: str = "google"
+    # Planilha falsa: linhas de cada extrato, semente dos dados e das falhas,
+    # latência (+ jitter) por chamada e 429 simulados (taxa aleatória e/ou cota por minuto; 0 desabilita)
+    fake_sheets_rows: int = 1000
+    fake_sheets_seed: int = 42
+    fake_sheets_latency_seconds: float = 0.0
+    fake_sheets_jitter_seconds: float = 0.0
+    fake_sheets_quota_error_rate: float = 0.0
+    fake_sheets_quota_per_minute: float = 0.0
+    
+    # Write-behind: escritas de transações confirmadas após o journal local e
+    # gravadas na planilha em segundo plano (requer o cache habilitado)
+    write_behind_enabled: bool = False
+    write_behind_flush_interval_seconds: float = 2.0
+    write_behind_journal_dir: str = ".write_behind"
+    
+    # Backend de leitura das transações: "sheets" (cache em memória) ou
+    # "sqlite" (espelho local indexado, sincronizado em segundo plano)
+    read_backend: str = "sheets"
+    sqlite_path: str = ".data/controle_financeiro.sqlite3"
+    sqlite_refresh_interval_seconds: float = 30.0
+    
+    # Snapshots das planilhas salvos em disco: restaurados na inicialização e
+    # servidos enquanto são revalidados em segundo plano (requer o cache habilitado)
+    snapshot_persist_enabled: bool = False
+    snapshot_dir: str = ".snapshots"
+    snapshot_persist_interval_seconds: float = 300.0
+    
+    # Health check: intervalo de reaproveitamento da verificação de prontidão
+    health_check_interval_seconds: float = 30.0
+    # Habilita /api/health/deep (lê a aba de transações inteira)
+    health_deep_check_enabled: bool = False
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,59 @@
+"""
+Execução de chamadas bloqueantes (Google Sheets) fora do event loop
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import get_settings
+
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Retorna o pool de threads usado para as chamadas ao Google Sheets (singleton)
+    
+    O tamanho do pool é limitado por `sheets_max_workers`, o que também limita
+    quantas requisições simultâneas chegam à API do Google.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().sheets_max_workers,
+                    thread_name_prefix="sheets"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Executa uma função síncrona no pool de threads sem bloquear o event loop
+    
+    Args:
+        func: Função bloqueante (ex: use_case.execute)
+        *args: Argumentos posicionais
+        **kwargs: Argumentos nomeados
+    
+    Returns:
+        Resultado da função
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executor():
+    """Encerra o pool de threads aguardando as chamadas em andamento"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
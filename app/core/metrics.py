@@ -0,0 +1,323 @@
+"""
+Métricas internas da aplicação (contadores, medidores e histogramas em memória)
+"""
+import bisect
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# Limites padrão dos histogramas de latência (segundos)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Limites para contagens de linhas
+ROW_BUCKETS = (0, 10, 50, 100, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelSet:
+    """Normaliza um dicionário de labels em uma tupla ordenada"""
+    return tuple(sorted((labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    """Escapa o valor de um label para o formato de texto do Prometheus"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_name(name: str, labels: LabelSet) -> str:
+    """Formata o nome da métrica no estilo Prometheus (nome{label="valor"})"""
+    if not labels:
+        return name
+    rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return f"{name}{{{rendered}}}"
+
+
+def _format_value(value: float) -> str:
+    """Formata um valor no formato de texto do Prometheus"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+class Counter:
+    """
+    Contador monotônico thread-safe
+    """
+    
+    def __init__(self, name: str, description: str = "", labels: LabelSet = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._value = 0.0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1.0):
+        """Incrementa o contador"""
+        with self._lock:
+            self._value += amount
+    
+    @property
+    def value(self) -> float:
+        """Valor atual do contador"""
+        return self._value
+
+
+class Gauge:
+    """
+    Medidor de valor instantâneo (pode subir e descer)
+    
+    Se `reader` for informado, o valor é lido da função no momento da
+    consulta (ex: idade do item mais antigo de uma fila).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labels: LabelSet = (),
+        reader: Optional[Callable[[], float]] = None
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.reader = reader
+        self._value = 0.0
+        self._lock = threading.Lock()
+    
+    def set(self, value: float):
+        """Define o valor atual"""
+        self._value = value
+    
+    def inc(self, amount: float = 1.0):
+        """Incrementa o valor atual (ex: requisições em andamento)"""
+        with self._lock:
+            self._value += amount
+    
+    def dec(self, amount: float = 1.0):
+        """Decrementa o valor atual"""
+        with self._lock:
+            self._value -= amount
+    
+    @property
+    def value(self) -> float:
+        """Valor atual do medidor"""
+        if self.reader is not None:
+            return float(self.reader())
+        return self._value
+
+
+class Histogram:
+    """
+    Distribuição de valores observados em faixas cumulativas (estilo Prometheus)
+    
+    Guarda apenas a contagem por faixa, a soma e o total: `observe` custa uma
+    busca binária nos limites e uma soma sob lock.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labels: LabelSet = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float):
+        """Registra um valor observado"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+    
+    @property
+    def count(self) -> int:
+        """Quantidade de valores observados"""
+        return self._count
+    
+    @property
+    def sum(self) -> float:
+        """Soma dos valores observados"""
+        return self._sum
+    
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Retorna as contagens cumulativas por limite superior
+        
+        Returns:
+            Lista de (limite, observações <= limite), terminando em (+Inf, total)
+        """
+        with self._lock:
+            counts = list(self._counts)
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Registro central de métricas do processo
+    """
+    
+    def __init__(self):
+        self._counters: Dict[Tuple[str, LabelSet], Counter] = {}
+        self._gauges: Dict[Tuple[str, LabelSet], Gauge] = {}
+        self._histograms: Dict[Tuple[str, LabelSet], Histogram] = {}
+        self._lock = threading.Lock()
+    
+    def counter(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[Dict[str, str]] = None
+    ) -> Counter:
+        """
+        Obtém (ou cria) um contador
+        
+        Args:
+            name: Nome da métrica
+            description: Descrição da métrica
+            labels: Labels que identificam a série
+        
+        Returns:
+            Instância de Counter compartilhada para o mesmo nome/labels
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = Counter(name, description, key[1])
+                self._counters[key] = counter
+            return counter
+    
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[Dict[str, str]] = None,
+        reader: Optional[Callable[[], float]] = None
+    ) -> Gauge:
+        """
+        Obtém (ou cria) um medidor
+        
+        Args:
+            name: Nome da métrica
+            description: Descrição da métrica
+            labels: Labels que identificam a série
+            reader: Função que calcula o valor na consulta (substitui a anterior)
+        
+        Returns:
+            Instância de Gauge compartilhada para o mesmo nome/labels
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            gauge = self._gauges.get(key)
+            if gauge is None:
+                gauge = Gauge(name, description, key[1], reader)
+                self._gauges[key] = gauge
+            elif reader is not None:
+                gauge.reader = reader
+            return gauge
+    
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """
+        Obtém (ou cria) um histograma
+        
+        Args:
+            name: Nome da métrica
+            description: Descrição da métrica
+            labels: Labels que identificam a série
+            buckets: Limites superiores das faixas (usados apenas na criação)
+        
+        Returns:
+            Instância de Histogram compartilhada para o mesmo nome/labels
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(name, description, key[1], buckets)
+                self._histograms[key] = histogram
+            return histogram
+    
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Retorna os valores atuais de todas as métricas
+        
+        Histogramas aparecem como `nome_count` e `nome_sum`.
+        
+        Returns:
+            Dicionário {nome{labels}: valor}
+        """
+        with self._lock:
+            metrics = list(self._counters.values()) + list(self._gauges.values())
+            histograms = list(self._histograms.values())
+        result = {_format_name(m.name, m.labels): m.value for m in metrics}
+        for h in histograms:
+            result[_format_name(f"{h.name}_count", h.labels)] = float(h.count)
+            result[_format_name(f"{h.name}_sum", h.labels)] = h.sum
+        return result
+    
+    def render_prometheus(self) -> str:
+        """
+        Exporta todas as métricas no formato de texto do Prometheus (versão 0.0.4)
+        
+        Returns:
+            Texto com HELP, TYPE e as amostras de cada métrica
+        """
+        with self._lock:
+            families: Dict[str, Tuple[str, str, list]] = {}
+            for kind, metrics in (
+                ("counter", self._counters.values()),
+                ("gauge", self._gauges.values()),
+                ("histogram", self._histograms.values())
+            ):
+                for metric in metrics:
+                    family = families.setdefault(metric.name, (kind, metric.description, []))
+                    family[2].append(metric)
+        
+        lines: List[str] = []
+        for name in sorted(families):
+            kind, description, metrics = families[name]
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for metric in sorted(metrics, key=lambda m: m.labels):
+                if kind != "histogram":
+                    lines.append(f"{_format_name(name, metric.labels)} {_format_value(metric.value)}")
+                    continue
+                for bound, count in metric.cumulative():
+                    labels = metric.labels + (("le", _format_value(bound) if math.isinf(bound) else f"{bound:g}"),)
+                    lines.append(f"{_format_name(name + '_bucket', labels)} {count}")
+                lines.append(f"{_format_name(name + '_sum', metric.labels)} {_format_value(metric.sum)}")
+                lines.append(f"{_format_name(name + '_count', metric.labels)} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Retorna o registro de métricas do processo (singleton)
+    """
+    return _registry
@@ -0,0 +1,121 @@
+"""
+Coalescência de chamadas concorrentes idênticas (single-flight)
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from app.core.metrics import get_metrics_registry
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Chamada em andamento e seu resultado, compartilhados pelos que aguardam"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Garante no máximo uma execução em andamento por chave
+    
+    Quem chama `do` enquanto já existe uma execução com a mesma chave não
+    executa a função: aguarda a execução em andamento e recebe o mesmo
+    resultado (ou a mesma exceção). Nada é guardado depois que a execução
+    termina — o cache, se houver, fica a cargo de quem chama. A função não
+    deve chamar `do` com a mesma chave (a chamada interna aguardaria a si mesma).
+    """
+    
+    def __init__(self, name: str):
+        """
+        Inicializa o grupo
+        
+        Args:
+            name: Nome do grupo (usado nas métricas)
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        
+        registry = get_metrics_registry()
+        labels = {"group": name}
+        self._executions = registry.counter(
+            "single_flight_executions_total",
+            "Chamadas executadas de fato (uma por grupo de chamadas concorrentes)",
+            labels
+        )
+        self._shared = registry.counter(
+            "single_flight_shared_total",
+            "Chamadas atendidas pelo resultado de uma execução já em andamento",
+            labels
+        )
+    
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Executa a função, ou aguarda a execução em andamento com a mesma chave
+        
+        Args:
+            key: Identifica chamadas equivalentes
+            func: Função a executar
+        
+        Returns:
+            Resultado da execução (compartilhado entre as chamadas concorrentes)
+        
+        Raises:
+            Exception: A exceção lançada pela execução, repassada a todos que aguardavam
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        
+        if not leader:
+            self._shared.inc()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        self._executions.inc()
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                # A chave pode ter sido liberada por `forget` (e já ter outra execução)
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+    
+    def forget(self, key: Hashable):
+        """
+        Faz com que as próximas chamadas com a chave iniciem uma nova execução
+        
+        Quem já aguarda a execução em andamento continua recebendo o seu
+        resultado. Usado após uma escrita: uma leitura iniciada antes dela não
+        deve ser compartilhada com quem chegou depois.
+        
+        Args:
+            key: Chave a liberar
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do grupo"""
+        with self._lock:
+            in_flight = len(self._calls)
+        return {
+            "in_flight": in_flight,
+            "executions": int(self._executions.value),
+            "shared": int(self._shared.value)
+        }
@@ -0,0 +1,109 @@
+"""
+Token de alteração da planilha via metadados do Google Drive
+"""
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from gspread.urls import DRIVE_FILES_API_V3_URL
+
+from app.core.metrics import get_metrics_registry
+from app.data.instrumented_sheets import observe_call
+from app.data.sheets_resilience import ResilientSheetsCaller
+from app.data.sheets_scheduler import READ
+
+
+class DriveRevisionToken:
+    """
+    Obtém um token barato que muda sempre que a planilha é editada
+    
+    Consulta apenas os campos `version` e `modifiedTime` do arquivo no Drive,
+    uma chamada de metadados muito menor que baixar os valores da aba.
+    Edições manuais na planilha também alteram o token.
+    
+    Consultas repetidas dentro de `min_interval_seconds` reutilizam o último
+    token, permitindo que vários caches da mesma planilha compartilhem uma
+    única chamada ao Drive.
+    
+    A chamada passa pelo executor das chamadas ao Google (retentativas,
+    circuit breaker e falhas classificadas como `SheetsError`) e é medida
+    como a operação `drive_revision`, mas não consome a cota de leitura do
+    Google Sheets: o Drive tem cota própria, e as revalidações dos caches
+    não devem disputar a cota com as leituras das abas.
+    """
+    
+    def __init__(
+        self,
+        spreadsheet_getter: Callable[[], Any],
+        caller: Optional[ResilientSheetsCaller] = None,
+        min_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o provedor do token
+        
+        Args:
+            spreadsheet_getter: Função que retorna a planilha conectada (gspread.Spreadsheet)
+            caller: Executor das chamadas ao Google (chamada direta se omitido)
+            min_interval_seconds: Intervalo mínimo entre consultas ao Drive
+            clock: Função que retorna o tempo atual (injetável para testes)
+        """
+        self._get_spreadsheet = spreadsheet_getter
+        self._caller = caller
+        self.min_interval_seconds = min_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_token: Optional[str] = None
+        self._last_checked_at: Optional[float] = None
+        self._requests = get_metrics_registry().counter(
+            "sheets_revision_checks_total",
+            "Consultas ao token de revisão da planilha no Drive"
+        )
+    
+    def __call__(self) -> Optional[str]:
+        """
+        Consulta o token de revisão atual
+        
+        Returns:
+            Versão do arquivo no Drive (ou modifiedTime), ou None se indisponível
+        """
+        with self._lock:
+            now = self._clock()
+            if (
+                self._last_checked_at is not None
+                and (now - self._last_checked_at) < self.min_interval_seconds
+            ):
+                return self._last_token
+            
+            token = self._fetch()
+            self._last_token = token
+            self._last_checked_at = now
+            return token
+    
+    def _fetch(self) -> Optional[str]:
+        """
+        Consulta os metadados do arquivo no Drive
+        
+        Raises:
+            SheetsError: Se a consulta falhar após as tentativas (com executor)
+        """
+        spreadsheet = self._get_spreadsheet()
+        self._requests.inc()
+        
+        def request() -> Any:
+            return observe_call("drive_revision", lambda: spreadsheet.client.request(
+                "get",
+                f"{DRIVE_FILES_API_V3_URL}/{spreadsheet.id}",
+                params={
+                    "fields": "version,modifiedTime",
+                    "supportsAllDrives": True
+                }
+            ))
+        
+        if self._caller is None:
+            response = request()
+        else:
+            response = self._caller.run(READ, request, quota=False)
+        metadata = response.json()
+        token = metadata.get("version") or metadata.get("modifiedTime")
+        return str(token) if token else None
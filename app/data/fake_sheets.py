@@ -0,0 +1,643 @@
+"""
+Planilha falsa em memória para testes de carga e benchmarks sem acesso ao Google
+"""
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from gspread.cell import Cell
+from gspread.exceptions import APIError, WorksheetNotFound
+
+from app.core.config import Settings
+
+
+_A1_CELL_RE = re.compile(r"^([A-Z]*)(\d*)$")
+
+TIPOS = ["RECEITA", "DESPESA"]
+SITUACOES = {"RECEITA": ["Recebido", "A receber"], "DESPESA": ["Pago", "A pagar"]}
+CONTAS = ["Nubank", "Itaú", "Inter", "Carteira", "Bradesco"]
+CARTOES = ["Nubank", "Itaú Visa", "Inter Mastercard"]
+CATEGORIAS = ["Mercado", "Moradia", "Salário", "Saúde", "Lazer", "Transporte", "Educação", "Serviços"]
+MESES = [
+    f"{i:02d}-{nome}" for i, nome in enumerate([
+        "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+        "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+    ], start=1)
+]
+DESCRITIVOS = [
+    "Supermercado", "Aluguel", "Salário", "Farmácia", "Restaurante",
+    "Combustível", "Academia", "Internet", "Energia", "Água",
+    "Streaming", "Padaria", "Uber", "Presente", "Manutenção"
+]
+
+
+def _column_index(letters: str) -> int:
+    """Converte letras de coluna em índice (A = 1)"""
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index
+
+
+def _column_letters(index: int) -> str:
+    """Converte um índice de coluna (A = 1) em letras"""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def parse_a1_range(range_name: str) -> Tuple[int, int, Optional[int], Optional[int]]:
+    """
+    Converte um intervalo A1 em limites de linhas e colunas
+    
+    Args:
+        range_name: Intervalo (ex: "A2", "A5:H5", "O:P", "Extrato!A1:B2")
+    
+    Returns:
+        Tupla (primeira linha, primeira coluna, última linha, última coluna),
+        com índices a partir de 1; None indica intervalo aberto até o fim
+    
+    Raises:
+        APIError: Se o intervalo não for válido (400, como a API)
+    """
+    cells = range_name.split("!")[-1].replace("$", "").upper().split(":")
+    parsed = []
+    for cell in cells:
+        match = _A1_CELL_RE.match(cell)
+        if not match or not (match.group(1) or match.group(2)):
+            raise _api_error(400, f"Unable to parse range: {range_name}", "INVALID_ARGUMENT")
+        parsed.append((
+            int(match.group(2)) if match.group(2) else None,
+            _column_index(match.group(1)) if match.group(1) else None
+        ))
+    (first_row, first_col), (last_row, last_col) = parsed[0], parsed[-1]
+    if len(parsed) == 1:
+        return first_row or 1, first_col or 1, first_row, first_col
+    return first_row or 1, first_col or 1, last_row, last_col
+
+
+def _api_error(code: int, message: str, status: str) -> APIError:
+    """Monta um APIError do gspread igual ao de uma resposta real da API"""
+    response = requests.Response()
+    response.status_code = code
+    response._content = json.dumps({"error": {"code": code, "message": message, "status": status}}).encode()
+    return APIError(response)
+
+
+def _trim(values: List[str]) -> List[str]:
+    """Remove as células vazias do final (a API não as retorna)"""
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    return values[:end]
+
+
+class FakeSheetsBackend:
+    """
+    Simula o comportamento de rede e de cota da API do Google Sheets
+    
+    Cada chamada espera `latency_seconds` mais um jitter uniforme de até
+    `jitter_seconds` e pode falhar com 429 (cota esgotada): aleatoriamente
+    com probabilidade `quota_error_rate`, ou sempre que passar de
+    `quota_per_minute` chamadas do mesmo tipo (leitura ou escrita) nos
+    últimos 60 segundos. O gerador aleatório usa a semente informada, de
+    modo que a mesma sequência de chamadas produz os mesmos atrasos e falhas.
+    """
+    
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        quota_error_rate: float = 0.0,
+        quota_per_minute: float = 0.0,
+        seed: int = 42
+    ):
+        """
+        Inicializa o simulador
+        
+        Args:
+            latency_seconds: Latência fixa de cada chamada
+            jitter_seconds: Variação máxima somada à latência
+            quota_error_rate: Probabilidade de uma chamada falhar com 429 (0 a 1)
+            quota_per_minute: Chamadas por minuto de cada tipo antes do 429 (0 = sem limite)
+            seed: Semente do gerador aleatório
+        """
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.quota_error_rate = quota_error_rate
+        self.quota_per_minute = quota_per_minute
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls: Dict[bool, List[float]] = {False: [], True: []}
+        self.requests = 0
+        self.quota_errors = 0
+    
+    def call(self, write: bool = False):
+        """
+        Simula a ida à API: aplica a latência e decide se a chamada falha por cota
+        
+        Args:
+            write: Se True, conta na cota de escrita (senão, na de leitura)
+        
+        Raises:
+            APIError: 429 se a chamada exceder a cota simulada
+        """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency_seconds + self._random.uniform(0, self.jitter_seconds)
+            rejected = self._random.random() < self.quota_error_rate
+            if self.quota_per_minute > 0:
+                now = time.monotonic()
+                window = [t for t in self._calls[write] if now - t < 60.0]
+                rejected = rejected or len(window) >= self.quota_per_minute
+                if not rejected:
+                    window.append(now)
+                self._calls[write] = window
+            if rejected:
+                self.quota_errors += 1
+        if delay > 0:
+            time.sleep(delay)
+        if rejected:
+            kind = "Write" if write else "Read"
+            raise _api_error(
+                429,
+                f"Quota exceeded for quota metric '{kind} requests' (simulado)",
+                "RESOURCE_EXHAUSTED"
+            )
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as chamadas recebidas e os 429 simulados"""
+        return {"requests": self.requests, "quota_errors": self.quota_errors}
+
+
+class FakeWorksheet:
+    """
+    Aba em memória com o subconjunto de `gspread.Worksheet` usado pelos repositórios
+    
+    Os valores são textos, como a API os retorna formatados (fórmulas não são calculadas).
+    """
+    
+    def __init__(self, spreadsheet: "FakeSpreadsheet", title: str, sheet_id: int, rows: List[List[str]]):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self._rows = [[str(v) for v in row] for row in rows]
+    
+    # ==================== AUXILIARES ====================
+    
+    def _read(self):
+        """Simula uma chamada de leitura (a latência é aplicada fora do lock: chamadas concorrentes se sobrepõem)"""
+        self.spreadsheet.backend.call(write=False)
+    
+    def _write(self):
+        """Simula uma chamada de escrita"""
+        self.spreadsheet.backend.call(write=True)
+    
+    def _cell(self, row: int, col: int) -> str:
+        """Valor de uma célula (índices a partir de 1)"""
+        if row > len(self._rows):
+            return ""
+        values = self._rows[row - 1]
+        return values[col - 1] if col <= len(values) else ""
+    
+    def _set(self, row: int, col: int, value: Any):
+        """Grava uma célula, estendendo as linhas e colunas se preciso"""
+        while len(self._rows) < row:
+            self._rows.append([])
+        values = self._rows[row - 1]
+        if len(values) < col:
+            values.extend([""] * (col - len(values)))
+        values[col - 1] = "" if value is None else str(value)
+    
+    def _last_row(self) -> int:
+        """Última linha com algum valor"""
+        for index in range(len(self._rows), 0, -1):
+            if any(self._rows[index - 1]):
+                return index
+        return 0
+    
+    def _width(self) -> int:
+        """Quantidade de colunas usadas"""
+        return max((len(_trim(row)) for row in self._rows), default=0)
+    
+    def _range(self, range_name: str) -> List[List[str]]:
+        """Valores de um intervalo, sem as linhas e células vazias do final (como a API)"""
+        first_row, first_col, last_row, last_col = parse_a1_range(range_name)
+        last_row = last_row or self._last_row()
+        last_col = last_col or self._width()
+        values = [
+            _trim([self._cell(row, col) for col in range(first_col, last_col + 1)])
+            for row in range(first_row, last_row + 1)
+        ]
+        while values and not values[-1]:
+            values.pop()
+        return values
+    
+    def _write_range(self, range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        """Grava uma matriz a partir do canto superior esquerdo do intervalo"""
+        first_row, first_col, _, _ = parse_a1_range(range_name)
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                self._set(first_row + i, first_col + j, value)
+        width = max((len(row) for row in values), default=0)
+        return {
+            "updatedRange": self._a1(first_row, first_col, first_row + len(values) - 1, first_col + width - 1),
+            "updatedRows": len(values),
+            "updatedCells": sum(len(row) for row in values)
+        }
+    
+    def _a1(self, first_row: int, first_col: int, last_row: int, last_col: int) -> str:
+        """Intervalo A1 com o nome da aba (formato das respostas da API)"""
+        return (
+            f"'{self.title}'!{_column_letters(first_col)}{first_row}"
+            f":{_column_letters(max(last_col, first_col))}{max(last_row, first_row)}"
+        )
+    
+    # ==================== LEITURAS ====================
+    
+    def get_all_values(self, *args: Any, **kwargs: Any) -> List[List[str]]:
+        """Todas as linhas, completadas até a largura da aba"""
+        self._read()
+        with self.spreadsheet.lock:
+            width = self._width()
+            return [
+                row[:width] + [""] * (width - len(row[:width]))
+                for row in self._rows[:self._last_row()]
+            ]
+    
+    def get(self, range_name: Optional[str] = None, major_dimension: Optional[str] = None, **kwargs: Any) -> List[List[str]]:
+        """Valores de um intervalo (por linhas ou, com major_dimension="COLUMNS", por colunas)"""
+        self._read()
+        with self.spreadsheet.lock:
+            values = self._range(range_name or "A1:ZZ")
+            if str(major_dimension or "").upper() != "COLUMNS":
+                return values
+            width = max((len(row) for row in values), default=0)
+            columns = [_trim([row[j] if j < len(row) else "" for row in values]) for j in range(width)]
+            while columns and not columns[-1]:
+                columns.pop()
+            return columns
+    
+    def batch_get(self, ranges: Iterable[str], **kwargs: Any) -> List[List[List[str]]]:
+        """Valores de vários intervalos em uma única chamada"""
+        self._read()
+        with self.spreadsheet.lock:
+            return [self._range(range_name) for range_name in ranges]
+    
+    def col_values(self, col: int, **kwargs: Any) -> List[str]:
+        """Valores de uma coluna, incluindo o cabeçalho"""
+        self._read()
+        with self.spreadsheet.lock:
+            return _trim([self._cell(row, col) for row in range(1, self._last_row() + 1)])
+    
+    def row_values(self, row: int, **kwargs: Any) -> List[str]:
+        """Valores de uma linha"""
+        self._read()
+        with self.spreadsheet.lock:
+            return _trim(list(self._rows[row - 1])) if row <= len(self._rows) else []
+    
+    def acell(self, label: str, **kwargs: Any) -> Cell:
+        """Célula pela notação A1"""
+        row, col, _, _ = parse_a1_range(label)
+        return self.cell(row, col)
+    
+    def cell(self, row: int, col: int, **kwargs: Any) -> Cell:
+        """Célula pela linha e coluna"""
+        self._read()
+        with self.spreadsheet.lock:
+            return Cell(row, col, self._cell(row, col))
+    
+    def find(
+        self,
+        query: str,
+        in_row: Optional[int] = None,
+        in_column: Optional[int] = None,
+        case_sensitive: bool = True
+    ) -> Optional[Cell]:
+        """Primeira célula com o valor exato (None se não houver, como o gspread 6)"""
+        self._read()
+        with self.spreadsheet.lock:
+            expected = query if case_sensitive else query.lower()
+            for row_index, row in enumerate(self._rows, start=1):
+                if in_row is not None and row_index != in_row:
+                    continue
+                for col_index, value in enumerate(row, start=1):
+                    if in_column is not None and col_index != in_column:
+                        continue
+                    if (value if case_sensitive else value.lower()) == expected:
+                        return Cell(row_index, col_index, value)
+            return None
+    
+    # ==================== ESCRITAS ====================
+    
+    def update(self, values: Any = None, range_name: Any = None, **kwargs: Any) -> Dict[str, Any]:
+        """Grava uma matriz em um intervalo (aceita a ordem antiga `update(range, values)`)"""
+        if isinstance(values, str) and not isinstance(range_name, str):
+            values, range_name = range_name, values
+        self._write()
+        with self.spreadsheet.lock:
+            self.spreadsheet.revision += 1
+            return {"spreadsheetId": self.spreadsheet.id, **self._write_range(range_name or "A1", values or [])}
+    
+    def batch_update(self, data: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        """Grava vários intervalos em uma única chamada"""
+        self._write()
+        with self.spreadsheet.lock:
+            self.spreadsheet.revision += 1
+            responses = [self._write_range(item["range"], item["values"]) for item in data]
+            return {
+                "spreadsheetId": self.spreadsheet.id,
+                "totalUpdatedRows": sum(r["updatedRows"] for r in responses),
+                "totalUpdatedCells": sum(r["updatedCells"] for r in responses),
+                "responses": responses
+            }
+    
+    def update_cell(self, row: int, col: int, value: Any) -> Dict[str, Any]:
+        """Grava uma célula"""
+        self._write()
+        with self.spreadsheet.lock:
+            self.spreadsheet.revision += 1
+            self._set(row, col, value)
+            return {"spreadsheetId": self.spreadsheet.id, "updatedRange": self._a1(row, col, row, col)}
+    
+    def append_row(self, values: List[Any], **kwargs: Any) -> Dict[str, Any]:
+        """Acrescenta uma linha após a última linha com dados"""
+        return self.append_rows([values], **kwargs)
+    
+    def append_rows(
+        self,
+        values: List[List[Any]],
+        table_range: Optional[str] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Acrescenta linhas após a última linha com dados
+        
+        Com `table_range`, só as colunas do intervalo a partir da sua primeira
+        linha são consideradas e as linhas são gravadas na primeira coluna
+        dele (como o values.append da API, nunca sobre células preenchidas).
+        """
+        self._write()
+        with self.spreadsheet.lock:
+            self.spreadsheet.revision += 1
+            first_row, first_col, _, last_col = parse_a1_range(table_range or "A1")
+            last_col = last_col if table_range else None
+            last_col = last_col or max(self._width(), first_col)
+            last = first_row - 1
+            for row in range(first_row, len(self._rows) + 1):
+                if any(self._cell(row, col) for col in range(first_col, last_col + 1)):
+                    last = row
+            result = self._write_range(f"{_column_letters(first_col)}{last + 1}", values)
+            return {
+                "spreadsheetId": self.spreadsheet.id,
+                "tableRange": self._a1(first_row, first_col, last, last_col),
+                "updates": result
+            }
+    
+    def delete_rows(self, start_index: int, end_index: Optional[int] = None) -> Dict[str, Any]:
+        """Remove as linhas [start_index, end_index] (as de baixo sobem)"""
+        self._write()
+        with self.spreadsheet.lock:
+            self.spreadsheet.revision += 1
+            self._delete(start_index, end_index or start_index)
+            return {"spreadsheetId": self.spreadsheet.id, "replies": [{}]}
+    
+    def _delete(self, first_row: int, last_row: int):
+        """Remove um intervalo de linhas (sem simular a chamada)"""
+        del self._rows[first_row - 1:last_row]
+    
+    def _find_replace(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplica um findReplace restrito ao intervalo da aba"""
+        grid = request.get("range") or {}
+        find = request["find"]
+        replacement = request.get("replacement", "")
+        match_case = request.get("matchCase", False)
+        entire = request.get("matchEntireCell", False)
+        first_row = grid.get("startRowIndex", 0) + 1
+        last_row = grid.get("endRowIndex", len(self._rows))
+        first_col = grid.get("startColumnIndex", 0) + 1
+        last_col = grid.get("endColumnIndex", self._width())
+        changed = 0
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                value = self._cell(row, col)
+                if not value:
+                    continue
+                current = value if match_case else value.lower()
+                target = find if match_case else find.lower()
+                if entire and current == target:
+                    self._set(row, col, replacement)
+                    changed += 1
+                elif not entire and target in current:
+                    flags = 0 if match_case else re.IGNORECASE
+                    self._set(row, col, re.sub(re.escape(find), replacement, value, flags=flags))
+                    changed += 1
+        return {"occurrencesChanged": changed, "valuesChanged": changed, "rowsChanged": changed, "sheetsChanged": 1 if changed else 0}
+
+
+class _FakeDriveResponse:
+    """Resposta mínima da API do Drive (metadados do arquivo)"""
+    
+    def __init__(self, payload: Dict[str, Any]):
+        self._payload = payload
+    
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+
+class _FakeClient:
+    """Cliente com o `request` usado para consultar a revisão do arquivo no Drive"""
+    
+    def __init__(self, spreadsheet: "FakeSpreadsheet"):
+        self._spreadsheet = spreadsheet
+    
+    def request(self, method: str, endpoint: str, **kwargs: Any) -> _FakeDriveResponse:
+        """Responde à consulta de metadados do arquivo com a revisão atual"""
+        backend = self._spreadsheet.backend
+        if backend.latency_seconds > 0:
+            time.sleep(backend.latency_seconds)
+        return _FakeDriveResponse({"version": str(self._spreadsheet.revision)})
+
+
+class FakeSpreadsheet:
+    """
+    Planilha em memória com o subconjunto de `gspread.Spreadsheet` usado pela aplicação
+    
+    Toda escrita incrementa `revision`, devolvida como versão do arquivo na
+    consulta ao Drive (ver `DriveRevisionToken`), de modo que a revalidação
+    dos caches funciona como com a planilha real.
+    """
+    
+    def __init__(self, backend: FakeSheetsBackend, spreadsheet_id: str = "fake-spreadsheet"):
+        """
+        Inicializa a planilha vazia
+        
+        Args:
+            backend: Simulador de latência e cota
+            spreadsheet_id: ID da planilha
+        """
+        self.backend = backend
+        self.id = spreadsheet_id
+        self.title = "Controle Financeiro (fake)"
+        self.revision = 1
+        self.lock = threading.RLock()
+        self.client = _FakeClient(self)
+        self._worksheets: Dict[str, FakeWorksheet] = {}
+    
+    def add_worksheet(self, title: str, rows: List[List[str]]) -> FakeWorksheet:
+        """
+        Cria uma aba com os valores informados (sem simular chamada)
+        
+        Args:
+            title: Nome da aba
+            rows: Linhas iniciais (incluindo o cabeçalho)
+        
+        Returns:
+            Aba criada
+        """
+        worksheet = FakeWorksheet(self, title, len(self._worksheets), rows)
+        self._worksheets[title] = worksheet
+        return worksheet
+    
+    def worksheet(self, title: str) -> FakeWorksheet:
+        """
+        Obtém uma aba pelo nome
+        
+        Raises:
+            WorksheetNotFound: Se a aba não existir
+        """
+        self.backend.call(write=False)
+        worksheet = self._worksheets.get(title)
+        if worksheet is None:
+            raise WorksheetNotFound(title)
+        return worksheet
+    
+    def worksheets(self, *args: Any, **kwargs: Any) -> List[FakeWorksheet]:
+        """Obtém todas as abas"""
+        self.backend.call(write=False)
+        return list(self._worksheets.values())
+    
+    def batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa as requisições findReplace e deleteDimension (linhas) em uma única chamada
+        
+        Raises:
+            APIError: 400 para outros tipos de requisição ou aba inexistente
+        """
+        self.backend.call(write=True)
+        with self.lock:
+            by_id = {ws.id: ws for ws in self._worksheets.values()}
+            replies: List[Dict[str, Any]] = []
+            for request in body.get("requests", []):
+                if "findReplace" in request:
+                    find_replace = request["findReplace"]
+                    worksheet = by_id.get((find_replace.get("range") or {}).get("sheetId"))
+                    if worksheet is None:
+                        raise _api_error(400, "No grid with id", "INVALID_ARGUMENT")
+                    replies.append({"findReplace": worksheet._find_replace(find_replace)})
+                elif "deleteDimension" in request:
+                    grid = request["deleteDimension"]["range"]
+                    worksheet = by_id.get(grid.get("sheetId"))
+                    if worksheet is None or grid.get("dimension") != "ROWS":
+                        raise _api_error(400, "No grid with id", "INVALID_ARGUMENT")
+                    worksheet._delete(grid["startIndex"] + 1, grid["endIndex"])
+                    replies.append({})
+                else:
+                    raise _api_error(400, f"Requisição não suportada: {sorted(request)}", "INVALID_ARGUMENT")
+            self.revision += 1
+            return {"spreadsheetId": self.id, "replies": replies}
+
+
+def _brl(centavos: int) -> str:
+    """Formata centavos no padrão da planilha (ex: R$ 1.234,56)"""
+    reais, cents = divmod(abs(centavos), 100)
+    sinal = "-" if centavos < 0 else ""
+    return f"{sinal}R$ {reais:,}".replace(",", ".") + f",{cents:02d}"
+
+
+def _synthetic_rows(rnd: random.Random, n: int, contas: List[str]) -> List[List[str]]:
+    """Linhas de extrato (colunas A..H) com valores no formato da planilha"""
+    rows = []
+    for _ in range(n):
+        mes = rnd.randrange(12)
+        tipo = rnd.choice(TIPOS)
+        rows.append([
+            tipo,
+            f"{rnd.choice(DESCRITIVOS)} {rnd.randrange(1000)}",
+            _brl(rnd.randrange(1, 500000)),
+            f"{rnd.randrange(1, 29):02d}/{mes + 1:02d}/{rnd.choice([2023, 2024, 2025])}",
+            MESES[mes],
+            rnd.choice(["", "observação"]),
+            rnd.choice(SITUACOES[tipo]),
+            rnd.choice(contas)
+        ])
+    return rows
+
+
+def build_fake_spreadsheet(settings: Settings) -> FakeSpreadsheet:
+    """
+    Monta a planilha falsa com dados sintéticos conforme as configurações
+    
+    Cria as abas usadas pelos repositórios: extrato e extrato de crédito com
+    `fake_sheets_rows` linhas cada, configurações (colunas A:G) e a página
+    API (saldo geral em A2 e saldos por conta em O:P). Os dados dependem só
+    de `fake_sheets_seed`.
+    
+    Args:
+        settings: Configurações da aplicação
+    
+    Returns:
+        FakeSpreadsheet pronta para uso
+    """
+    backend = FakeSheetsBackend(
+        latency_seconds=settings.fake_sheets_latency_seconds,
+        jitter_seconds=settings.fake_sheets_jitter_seconds,
+        quota_error_rate=settings.fake_sheets_quota_error_rate,
+        quota_per_minute=settings.fake_sheets_quota_per_minute,
+        seed=settings.fake_sheets_seed
+    )
+    spreadsheet = FakeSpreadsheet(backend, settings.google_sheets_id or "fake-spreadsheet")
+    rnd = random.Random(settings.fake_sheets_seed)
+    
+    spreadsheet.add_worksheet(
+        settings.google_sheet_name,
+        [["TIPO", "DESCRITIVO", "VALOR", "DATA", "MÊS", "DETALHES", "SITUAÇÃO", "CONTA"]]
+        + _synthetic_rows(rnd, settings.fake_sheets_rows, CONTAS)
+    )
+    spreadsheet.add_worksheet(
+        "Extrato Crédito",
+        [["TIPO", "DESCRITIVO", "VALOR", "DATA", "MÊS", "DETALHES", "SITUAÇÃO", "CARTÃO"]]
+        + _synthetic_rows(rnd, settings.fake_sheets_rows, CARTOES)
+    )
+    
+    columns = [
+        ["CATEGORIAS"] + CATEGORIAS,
+        ["STATUS RECEITA"] + SITUACOES["RECEITA"],
+        ["STATUS DESPESA"] + SITUACOES["DESPESA"],
+        ["CONTAS"] + CONTAS,
+        ["CARTÕES"] + CARTOES,
+        [""],
+        ["MESES"] + MESES
+    ]
+    height = max(len(column) for column in columns)
+    spreadsheet.add_worksheet(
+        "Configurações",
+        [[column[i] if i < len(column) else "" for column in columns] for i in range(height)]
+    )
+    
+    saldos = {conta: rnd.randrange(-100000, 2000000) for conta in CONTAS}
+    api_rows = [["SALDO GERAL"], [_brl(sum(saldos.values()))]]
+    for i, (conta, saldo) in enumerate([("CONTA", "SALDO")] + [(c, _brl(v)) for c, v in saldos.items()]):
+        while len(api_rows) <= i:
+            api_rows.append([])
+        row = api_rows[i]
+        row.extend([""] * (14 - len(row)))
+        row.extend([conta, saldo])
+    spreadsheet.add_worksheet("API", api_rows)
+    return spreadsheet
@@ -0,0 +1,195 @@
+"""
+Instrumentação das chamadas ao gspread (contagem, latência e linhas lidas por operação)
+"""
+import time
+from typing import Any, Callable, Dict, List, TypeVar
+
+from app.core.metrics import ROW_BUCKETS, Counter, Gauge, Histogram, get_metrics_registry
+
+
+T = TypeVar("T")
+
+# Métodos do Worksheet que fazem uma chamada à API
+WORKSHEET_OPERATIONS = frozenset({
+    "acell", "append_row", "append_rows", "batch_clear", "batch_get", "batch_update", "cell", "clear",
+    "col_values", "delete_rows", "find", "findall", "get", "get_all_records", "get_all_values",
+    "get_values", "insert_row", "insert_rows", "row_values", "update", "update_acell", "update_cell"
+})
+# Métodos do Spreadsheet que fazem uma chamada à API
+SPREADSHEET_OPERATIONS = frozenset({
+    "batch_update", "fetch_sheet_metadata", "values_batch_get", "values_batch_update", "values_get",
+    "worksheet", "worksheets"
+})
+# Leituras cujo resultado tem as linhas contadas
+_FETCH_OPERATIONS = frozenset({"batch_get", "col_values", "get", "get_all_records", "get_all_values", "get_values"})
+
+
+class _SheetsCallMetrics:
+    """Séries de métricas das chamadas ao gspread, criadas uma vez por operação/aba"""
+    
+    def __init__(self):
+        self._registry = get_metrics_registry()
+        self.in_flight: Gauge = self._registry.gauge(
+            "sheets_operations_in_flight",
+            "Chamadas ao Google Sheets em andamento"
+        )
+        self._durations: Dict[str, Histogram] = {}
+        self._errors: Dict[str, Counter] = {}
+        self._rows: Dict[str, Histogram] = {}
+    
+    def duration(self, operation: str) -> Histogram:
+        """Histograma de latência da operação"""
+        histogram = self._durations.get(operation)
+        if histogram is None:
+            histogram = self._registry.histogram(
+                "sheets_operation_duration_seconds",
+                "Latência das chamadas ao Google Sheets por operação",
+                {"operation": operation}
+            )
+            self._durations[operation] = histogram
+        return histogram
+    
+    def errors(self, operation: str) -> Counter:
+        """Contador de falhas da operação"""
+        counter = self._errors.get(operation)
+        if counter is None:
+            counter = self._registry.counter(
+                "sheets_operation_errors_total",
+                "Chamadas ao Google Sheets que falharam, por operação",
+                {"operation": operation}
+            )
+            self._errors[operation] = counter
+        return counter
+    
+    def rows(self, worksheet: str) -> Histogram:
+        """Histograma de linhas lidas por chamada de leitura da aba"""
+        histogram = self._rows.get(worksheet)
+        if histogram is None:
+            histogram = self._registry.histogram(
+                "sheets_fetch_rows",
+                "Linhas retornadas por chamada de leitura ao Google Sheets",
+                {"worksheet": worksheet},
+                buckets=ROW_BUCKETS
+            )
+            self._rows[worksheet] = histogram
+        return histogram
+
+
+_metrics = _SheetsCallMetrics()
+
+
+def _row_count(operation: str, result: Any, kwargs: Dict[str, Any]) -> int:
+    """Quantidade de linhas no resultado de uma leitura"""
+    if not isinstance(result, list):
+        return 0
+    if operation == "batch_get":
+        return sum(len(values) for values in result)
+    if str(kwargs.get("major_dimension", "")).upper() == "COLUMNS":
+        return max((len(column) for column in result), default=0)
+    return len(result)
+
+
+def observe_call(operation: str, call: Callable[[], T]) -> T:
+    """
+    Executa uma chamada ao Google Sheets registrando latência e falhas
+    
+    Args:
+        operation: Nome da operação (label das métricas)
+        call: Função que faz a chamada
+    
+    Returns:
+        Resultado da chamada
+    """
+    _metrics.in_flight.inc()
+    started = time.perf_counter()
+    try:
+        return call()
+    except Exception:
+        _metrics.errors(operation).inc()
+        raise
+    finally:
+        _metrics.duration(operation).observe(time.perf_counter() - started)
+        _metrics.in_flight.dec()
+
+
+class _InstrumentedHandle:
+    """Proxy que mede os métodos de API do objeto gspread envolvido e repassa o resto"""
+    
+    _operations: frozenset = frozenset()
+    
+    def __init__(self, wrapped: Any):
+        object.__setattr__(self, "_wrapped", wrapped)
+    
+    def _instrument(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Envolve um método de API"""
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return observe_call(name, lambda: method(*args, **kwargs))
+        return call
+    
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._wrapped, name)
+        if name in self._operations and callable(attr):
+            return self._instrument(name, attr)
+        return attr
+    
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._wrapped, name, value)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _InstrumentedHandle):
+            other = other._wrapped
+        return self._wrapped == other
+    
+    def __hash__(self) -> int:
+        return hash(self._wrapped)
+    
+    def __repr__(self) -> str:
+        return repr(self._wrapped)
+
+
+class InstrumentedWorksheet(_InstrumentedHandle):
+    """
+    gspread.Worksheet com as chamadas à API medidas
+    
+    Cada método de API registra a latência em
+    `sheets_operation_duration_seconds{operation}` e as falhas em
+    `sheets_operation_errors_total{operation}`; as leituras registram também
+    as linhas retornadas em `sheets_fetch_rows{worksheet}`.
+    """
+    
+    _operations = WORKSHEET_OPERATIONS
+    
+    def _instrument(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Envolve um método de API, contando as linhas das leituras"""
+        if name not in _FETCH_OPERATIONS:
+            return super()._instrument(name, method)
+        
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = observe_call(name, lambda: method(*args, **kwargs))
+            _metrics.rows(getattr(self._wrapped, "title", "")).observe(_row_count(name, result, kwargs))
+            return result
+        return call
+    
+    @property
+    def spreadsheet(self) -> "InstrumentedSpreadsheet":
+        """Planilha da aba, também instrumentada"""
+        return InstrumentedSpreadsheet(self._wrapped.spreadsheet)
+
+
+class InstrumentedSpreadsheet(_InstrumentedHandle):
+    """
+    gspread.Spreadsheet com as chamadas à API medidas
+    
+    As abas obtidas por `worksheet`/`worksheets` já vêm instrumentadas.
+    """
+    
+    _operations = SPREADSHEET_OPERATIONS
+    
+    def worksheet(self, title: str) -> InstrumentedWorksheet:
+        """Obtém a aba pelo nome (uma busca de metadados)"""
+        return InstrumentedWorksheet(observe_call("worksheet", lambda: self._wrapped.worksheet(title)))
+    
+    def worksheets(self, *args: Any, **kwargs: Any) -> List[InstrumentedWorksheet]:
+        """Obtém todas as abas (uma busca de metadados)"""
+        worksheets = observe_call("worksheets", lambda: self._wrapped.worksheets(*args, **kwargs))
+        return [InstrumentedWorksheet(ws) for ws in worksheets]
@@ -0,0 +1,3 @@
+"""
+Consulta em memória sobre os snapshots das planilhas (filtros, ordenação e paginação)
+"""
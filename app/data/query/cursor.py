@@ -0,0 +1,61 @@
+"""
+Cursores opacos da paginação por cursor (keyset)
+"""
+import base64
+import hashlib
+import json
+from typing import Any, Dict
+
+from app.data.query.filters import FilterCriteria
+
+
+def query_fingerprint(criteria: FilterCriteria, order_by: str) -> str:
+    """
+    Identifica a combinação (filtros, order_by) de um cursor
+    
+    Args:
+        criteria: Filtros da listagem
+        order_by: Campo para ordenação
+    
+    Returns:
+        Hash curto da combinação
+    """
+    raw = json.dumps([list(vars(criteria).values()), order_by], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """
+    Codifica o estado do cursor em um token opaco (base64 url-safe)
+    
+    Args:
+        payload: Estado do cursor (valores serializáveis em JSON)
+    
+    Returns:
+        Token do cursor
+    """
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Decodifica um token de cursor
+    
+    Args:
+        token: Token retornado em `next_cursor`
+    
+    Returns:
+        Estado do cursor
+    
+    Raises:
+        ValueError: Se o token for inválido
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Cursor inválido")
+    if not isinstance(payload, dict):
+        raise ValueError("Cursor inválido")
+    return payload
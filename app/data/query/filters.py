@@ -0,0 +1,118 @@
+"""
+Compilação dos filtros de listagem em uma única passada
+"""
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+from app.domain.entities import normalizar_busca, parse_data
+
+
+FilterFunction = Callable[[Iterable[Any]], List[Any]]
+Predicate = Callable[[Any], bool]
+
+# Campos de conta aceitos
+_ACCOUNT_FIELDS = ("conta", "cartao")
+
+
+@dataclass(frozen=True)
+class FilterCriteria:
+    """
+    Parâmetros de filtro de uma listagem
+    
+    O campo `conta` filtra pela conta no extrato e pelo cartão no extrato de
+    crédito (ver `account_field` em `compile_filter`). Por ser imutável, pode
+    ser usado como chave de cache.
+    """
+    tipo: Optional[str] = None
+    categoria: Optional[str] = None
+    data_inicio: Optional[str] = None
+    data_fim: Optional[str] = None
+    mes: Optional[str] = None
+    situacao: Optional[str] = None
+    conta: Optional[str] = None
+    
+    @property
+    def is_empty(self) -> bool:
+        """Indica se nenhum filtro foi informado"""
+        return not (
+            self.tipo or self.categoria or self.data_inicio or self.data_fim
+            or self.mes or self.situacao or self.conta
+        )
+
+
+def compile_filter(criteria: FilterCriteria, account_field: str = "conta") -> Optional[FilterFunction]:
+    """
+    Compila os filtros em uma única função que percorre as transações uma vez
+    
+    Os textos de busca são normalizados uma única vez e comparados com os
+    campos já normalizados da entidade (`*_lower`, `descritivo_busca`,
+    `data_ordenacao`). Apenas as verificações dos filtros informados entram
+    na lista aplicada a cada transação.
+    
+    Args:
+        criteria: Filtros da listagem
+        account_field: Campo da entidade filtrado por `criteria.conta` ("conta" ou "cartao")
+    
+    Returns:
+        Função que recebe as transações e retorna as que atendem aos filtros,
+        ou None se não houver filtros
+    """
+    if account_field not in _ACCOUNT_FIELDS:
+        raise ValueError(f"Campo de conta inválido: {account_field}")
+    if criteria.is_empty:
+        return None
+    
+    checks: List[Predicate] = []
+    
+    # Verificações mais baratas e seletivas primeiro: igualdade de tipo e datas
+    if criteria.tipo:
+        tipo = criteria.tipo.lower()
+        checks.append(lambda t: t.tipo_lower == tipo)
+    
+    # Transações sem data válida são excluídas quando há filtro de data,
+    # mesmo que a data informada no filtro seja inválida
+    if criteria.data_inicio or criteria.data_fim:
+        checks.append(lambda t: t.data_ordenacao is not None)
+        dt_inicio = parse_data(criteria.data_inicio)
+        dt_fim = parse_data(criteria.data_fim)
+        if dt_inicio:
+            checks.append(lambda t: t.data_ordenacao >= dt_inicio)
+        if dt_fim:
+            checks.append(lambda t: t.data_ordenacao <= dt_fim)
+    
+    # Filtros por texto (case-insensitive, contém)
+    if criteria.mes:
+        mes = criteria.mes.lower()
+        checks.append(lambda t: mes in t.mes_lower)
+    if criteria.situacao:
+        situacao = criteria.situacao.lower()
+        checks.append(lambda t: situacao in t.situacao_lower)
+    if criteria.conta:
+        conta = criteria.conta.lower()
+        account_value = attrgetter(f"{account_field}_lower")
+        checks.append(lambda t: conta in account_value(t))
+    # Categoria: também sem diferenciar acentos ("alimentacao" encontra "Alimentação")
+    if criteria.categoria:
+        categoria = normalizar_busca(criteria.categoria)
+        checks.append(lambda t: categoria in t.descritivo_busca)
+    
+    return lambda items: [t for t in items if all(check(t) for check in checks)]
+
+
+def apply_filter(items: Sequence[Any], criteria: FilterCriteria, account_field: str = "conta") -> Sequence[Any]:
+    """
+    Filtra as transações em uma única passada
+    
+    Args:
+        items: Transações do snapshot
+        criteria: Filtros da listagem
+        account_field: Campo da entidade filtrado por `criteria.conta`
+    
+    Returns:
+        Transações que atendem aos filtros (a própria sequência se não houver filtros)
+    """
+    filter_function = compile_filter(criteria, account_field)
+    if filter_function is None:
+        return items
+    return filter_function(items)
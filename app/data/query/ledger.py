@@ -0,0 +1,331 @@
+"""
+Extrato em memória com índices secundários
+"""
+import bisect
+import copy
+import threading
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from app.core.metrics import get_metrics_registry
+from app.data.query.filters import FilterCriteria, apply_filter
+from app.data.query.ngram import NgramIndex
+from app.domain.entities import normalizar_busca, parse_data
+
+
+T = TypeVar("T")
+
+# Acima desta fração do extrato, o candidato do índice não compensa: varre tudo
+INDEX_MAX_FRACTION = 0.25
+
+
+class Ledger(Generic[T]):
+    """
+    Snapshot de um extrato (aba da planilha) com índices secundários
+    
+    Cada transação recebe um identificador sequencial estável (seq), que segue
+    a ordem das linhas e não muda quando linhas anteriores são excluídas.
+    Sobre esses identificadores são mantidos:
+    
+    - índices hash dos campos normalizados `tipo`, `mes`, `situacao` e
+      `conta`/`cartao` (valor -> conjunto de seqs);
+    - índice ordenado de datas ((ordinal, seq)), consultado por busca binária
+      nos filtros `data_inicio`/`data_fim`;
+    - índice de trigramas do descritivo sem acentos (`descritivo_busca`),
+      usado pelo filtro `categoria` (busca por substring).
+    
+    Os índices são atualizados incrementalmente em `append`, `replace` e
+    `remove`. A lista `items` é recriada a cada alteração (cópia na escrita),
+    de modo que quem já a obteve continua vendo uma versão consistente.
+    """
+    
+    def __init__(self, items: Iterable[T], account_field: str = "conta", name: str = "ledger"):
+        """
+        Constrói o extrato e seus índices
+        
+        Args:
+            items: Transações na ordem da planilha
+            account_field: Campo de conta da entidade ("conta" ou "cartao")
+            name: Nome do extrato (usado nas métricas)
+        """
+        self.account_field = account_field
+        self._hash_fields = ("tipo", "mes", "situacao", account_field)
+        self._hash_attrs = tuple((field, f"{field}_lower") for field in self._hash_fields)
+        self._lock = threading.RLock()
+        self._items: Dict[int, T] = {}
+        self._by_row: Dict[int, int] = {}
+        self._hash: Dict[str, Dict[str, Set[int]]] = {field: {} for field in self._hash_fields}
+        self._dates: List[Tuple[int, int]] = []
+        self._descriptions = NgramIndex()
+        self._next_seq = 0
+        self._last_row = 0
+        self._view: Optional[List[T]] = None
+        
+        for item in items:
+            self._add(item)
+        self._dates.sort()
+        
+        registry = get_metrics_registry()
+        description = "Consultas de filtro por plano de execução (índices ou varredura)"
+        self._index_queries = registry.counter("ledger_queries_total", description, {"ledger": name, "plan": "index"})
+        self._scan_queries = registry.counter("ledger_queries_total", description, {"ledger": name, "plan": "scan"})
+    
+    @property
+    def items(self) -> List[T]:
+        """Transações na ordem das linhas (lista nova a cada alteração)"""
+        with self._lock:
+            if self._view is None:
+                self._view = list(self._items.values())
+            return self._view
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    @property
+    def last_row(self) -> int:
+        """Maior row_index do extrato (0 se vazio)"""
+        return self._last_row
+    
+    def has_row(self, row_index: int) -> bool:
+        """Verifica se a linha contém uma transação do extrato"""
+        return row_index in self._by_row
+    
+    def _add(self, item: T, sorted_insert: bool = False) -> int:
+        """Registra a transação nos índices e retorna seu seq"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._items[seq] = item
+        if item.row_index is not None:
+            self._by_row[item.row_index] = seq
+            self._last_row = max(self._last_row, item.row_index)
+        self._index(seq, item, sorted_insert)
+        return seq
+    
+    def _index(self, seq: int, item: T, sorted_insert: bool = True):
+        """Inclui a transação nos índices hash, de datas e de trigramas"""
+        for field, attr in self._hash_attrs:
+            self._hash[field].setdefault(getattr(item, attr), set()).add(seq)
+        self._descriptions.add(item.descritivo_busca, seq)
+        if item.data_ordenacao is not None:
+            entry = (item.data_ordenacao.toordinal(), seq)
+            if sorted_insert:
+                bisect.insort(self._dates, entry)
+            else:
+                self._dates.append(entry)
+    
+    def _unindex(self, seq: int, item: T):
+        """Remove a transação dos índices hash, de datas e de trigramas"""
+        for field, attr in self._hash_attrs:
+            index = self._hash[field]
+            key = getattr(item, attr)
+            postings = index.get(key)
+            if postings is not None:
+                postings.discard(seq)
+                if not postings:
+                    del index[key]
+        self._descriptions.remove(item.descritivo_busca, seq)
+        if item.data_ordenacao is not None:
+            entry = (item.data_ordenacao.toordinal(), seq)
+            pos = bisect.bisect_left(self._dates, entry)
+            if pos < len(self._dates) and self._dates[pos] == entry:
+                del self._dates[pos]
+    
+    def append(self, item: T) -> Optional["Ledger[T]"]:
+        """
+        Inclui uma transação recém-criada no final do extrato
+        
+        Returns:
+            O próprio extrato, ou None se a linha não for posterior à última
+            (o snapshot deve ser recarregado)
+        """
+        with self._lock:
+            if item.row_index is None or self._last_row >= item.row_index:
+                return None
+            self._add(item, sorted_insert=True)
+            self._view = None
+            return self
+    
+    def extend(self, items: Sequence[T]) -> Optional["Ledger[T]"]:
+        """
+        Inclui várias transações recém-criadas (ex: append em lote)
+        
+        Returns:
+            O próprio extrato, ou None se alguma linha não for posterior à anterior
+        """
+        with self._lock:
+            for item in items:
+                if self.append(item) is None:
+                    return None
+            return self
+    
+    def replace(self, item: T) -> Optional["Ledger[T]"]:
+        """
+        Substitui a transação da mesma linha
+        
+        Returns:
+            O próprio extrato, ou None se a linha não estiver no snapshot
+        """
+        with self._lock:
+            seq = self._by_row.get(item.row_index)
+            if seq is None:
+                return None
+            self._unindex(seq, self._items[seq])
+            self._items[seq] = item
+            self._index(seq, item)
+            self._view = None
+            return self
+    
+    def remove(self, row_index: int) -> "Ledger[T]":
+        """
+        Remove a linha e desloca o row_index das linhas seguintes
+        """
+        return self.remove_many([row_index])
+    
+    def remove_many(self, row_indexes: Iterable[int]) -> "Ledger[T]":
+        """
+        Remove várias linhas e desloca o row_index das seguintes em uma única passada
+        
+        Os seqs das demais transações não mudam, então os índices só são
+        alterados para as transações removidas.
+        """
+        removed = sorted(set(row_indexes))
+        with self._lock:
+            for row_index in removed:
+                seq = self._by_row.pop(row_index, None)
+                if seq is not None:
+                    self._unindex(seq, self._items.pop(seq))
+            
+            shifted: Dict[int, int] = {}
+            for row, item_seq in self._by_row.items():
+                # Quantidade de linhas removidas acima desta
+                offset = bisect.bisect_left(removed, row)
+                if offset:
+                    # Cópia rasa: as chaves já calculadas da entidade são reaproveitadas
+                    item = copy.copy(self._items[item_seq])
+                    item.row_index = row - offset
+                    self._items[item_seq] = item
+                    shifted[row - offset] = item_seq
+                else:
+                    shifted[row] = item_seq
+            self._by_row = shifted
+            self._last_row = max(shifted, default=0)
+            self._view = None
+            return self
+    
+    def _postings(self, field: str, needle: str, exact: bool) -> Tuple[int, List[Set[int]]]:
+        """
+        Obtém as listas de seqs de um índice hash
+        
+        Os filtros de texto são por "contém": as chaves distintas do índice
+        (poucas) são percorridas e as listas das que contêm o texto são unidas.
+        
+        Returns:
+            Tupla (quantidade total de seqs, conjuntos de seqs)
+        """
+        index = self._hash[field]
+        if exact:
+            postings = [index[needle]] if needle in index else []
+        else:
+            postings = [seqs for key, seqs in index.items() if needle in key]
+        return sum(len(p) for p in postings), postings
+    
+    def _date_range(self, criteria: FilterCriteria) -> Tuple[int, int]:
+        """Posições [lo, hi) do índice de datas dentro do intervalo do filtro"""
+        dt_inicio = parse_data(criteria.data_inicio)
+        dt_fim = parse_data(criteria.data_fim)
+        lo = bisect.bisect_left(self._dates, (dt_inicio.toordinal(), -1)) if dt_inicio else 0
+        hi = bisect.bisect_left(self._dates, (dt_fim.toordinal() + 1, -1)) if dt_fim else len(self._dates)
+        return lo, max(lo, hi)
+    
+    def _plan(self, criteria: FilterCriteria) -> Optional[Set[int]]:
+        """
+        Escolhe e combina os índices para os filtros informados
+        
+        Estima o tamanho do candidato de cada índice aplicável, parte do mais
+        seletivo e intersecta os índices hash em ordem crescente de tamanho.
+        
+        Returns:
+            Conjunto de seqs candidatos, ou None se a varredura completa for melhor
+        """
+        options: List[Tuple[int, str, Any]] = []
+        needles = (
+            ("tipo", criteria.tipo, True),
+            ("mes", criteria.mes, False),
+            ("situacao", criteria.situacao, False),
+            (self.account_field, criteria.conta, False)
+        )
+        for field, value, exact in needles:
+            if value:
+                size, postings = self._postings(field, value.lower(), exact)
+                options.append((size, "hash", postings))
+        if criteria.categoria:
+            postings = self._descriptions.search(normalizar_busca(criteria.categoria))
+            options.append((sum(len(p) for p in postings), "hash", postings))
+        if criteria.data_inicio or criteria.data_fim:
+            lo, hi = self._date_range(criteria)
+            options.append((hi - lo, "date", (lo, hi)))
+        
+        if not options:
+            return None
+        options.sort(key=lambda option: option[0])
+        size, kind, data = options[0]
+        if size > len(self._items) * INDEX_MAX_FRACTION:
+            return None
+        
+        if kind == "date":
+            lo, hi = data
+            candidates = {seq for _, seq in self._dates[lo:hi]}
+        else:
+            candidates = set().union(*data)
+        
+        # O intervalo de datas restante é verificado no filtro residual
+        for _, kind, data in options[1:]:
+            if not candidates:
+                break
+            if kind == "hash":
+                if len(data) == 1:
+                    candidates &= data[0]
+                else:
+                    candidates = {seq for seq in candidates if any(seq in p for p in data)}
+        return candidates
+    
+    def filter(self, criteria: FilterCriteria, items: Optional[Sequence[T]] = None) -> Sequence[T]:
+        """
+        Filtra as transações usando os índices quando compensa
+        
+        O resultado segue a ordem das linhas e é idêntico ao de `apply_filter`:
+        os candidatos dos índices passam pelo filtro compilado completo.
+        
+        Args:
+            criteria: Filtros da listagem
+            items: Versão de `items` sobre a qual a consulta foi iniciada; se o
+                extrato mudou desde então, filtra essa versão por varredura
+        
+        Returns:
+            Transações que atendem aos filtros
+        """
+        with self._lock:
+            view = self.items
+            if items is not None and items is not view:
+                self._scan_queries.inc()
+                return apply_filter(items, criteria, self.account_field)
+            
+            candidates = self._plan(criteria)
+            if candidates is None:
+                self._scan_queries.inc()
+                return apply_filter(view, criteria, self.account_field)
+            
+            self._index_queries.inc()
+            ordered = [self._items[seq] for seq in sorted(candidates)]
+        return apply_filter(ordered, criteria, self.account_field)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas dos índices"""
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "distinct_keys": {field: len(index) for field, index in self._hash.items()},
+                "dated_items": len(self._dates),
+                "distinct_descriptions": len(self._descriptions),
+                "index_queries": int(self._index_queries.value),
+                "scan_queries": int(self._scan_queries.value)
+            }
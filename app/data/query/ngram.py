@@ -0,0 +1,93 @@
+"""
+Índice invertido de n-gramas para buscas por substring
+"""
+from typing import Dict, List, Set
+
+
+class NgramIndex:
+    """
+    Índice de n-gramas (trigramas por padrão) sobre textos já normalizados
+    
+    Os textos distintos são indexados uma única vez (descrições se repetem
+    muito no extrato) e cada um aponta para o conjunto de seqs que o usam.
+    Uma busca intersecta os conjuntos de textos dos n-gramas do termo, do
+    menor para o maior, e confirma a substring apenas nos textos candidatos.
+    """
+    
+    def __init__(self, n: int = 3):
+        """
+        Inicializa o índice
+        
+        Args:
+            n: Tamanho dos n-gramas
+        """
+        self.n = n
+        self._postings: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._postings)
+    
+    def _ngrams(self, text: str) -> Set[str]:
+        """Retorna os n-gramas distintos do texto"""
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+    
+    def add(self, text: str, seq: int):
+        """
+        Associa o texto a um seq
+        
+        Args:
+            text: Texto normalizado
+            seq: Identificador da transação
+        """
+        postings = self._postings.get(text)
+        if postings is None:
+            postings = self._postings[text] = set()
+            for gram in self._ngrams(text):
+                self._grams.setdefault(gram, set()).add(text)
+        postings.add(seq)
+    
+    def remove(self, text: str, seq: int):
+        """
+        Desfaz a associação entre o texto e o seq
+        
+        Args:
+            text: Texto normalizado
+            seq: Identificador da transação
+        """
+        postings = self._postings.get(text)
+        if postings is None:
+            return
+        postings.discard(seq)
+        if postings:
+            return
+        
+        del self._postings[text]
+        for gram in self._ngrams(text):
+            texts = self._grams.get(gram)
+            if texts is not None:
+                texts.discard(text)
+                if not texts:
+                    del self._grams[gram]
+    
+    def search(self, needle: str) -> List[Set[int]]:
+        """
+        Busca os textos que contêm o termo
+        
+        Args:
+            needle: Termo normalizado
+        
+        Returns:
+            Conjuntos de seqs dos textos que contêm o termo
+        """
+        if len(needle) < self.n:
+            # Termo curto demais para os n-gramas: percorre os textos distintos
+            candidates = self._postings.keys()
+        else:
+            grams = sorted(self._ngrams(needle), key=lambda g: len(self._grams.get(g, ())))
+            candidates = set(self._grams.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self._grams.get(gram, set())
+        return [self._postings[text] for text in candidates if needle in text]
@@ -0,0 +1,259 @@
+"""
+Motor de paginação com seleção top-k e cache de permutações ordenadas
+"""
+import bisect
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.metrics import get_metrics_registry
+from app.data.query.cursor import decode_cursor, encode_cursor, query_fingerprint
+from app.data.query.filters import FilterCriteria, apply_filter
+from app.data.query.ledger import Ledger
+from app.data.query.sorting import is_top_k_eligible, position_key, select_top, sort_items
+
+
+class _Entry:
+    """Resultado de uma combinação (filtros, order_by) sobre um snapshot"""
+    
+    __slots__ = ("filtered", "ordered", "requests")
+    
+    def __init__(self, filtered: Sequence[Any]):
+        self.filtered = filtered
+        self.ordered: Optional[List[Any]] = None
+        self.requests = 0
+
+
+class PaginationEngine:
+    """
+    Pagina os snapshots das planilhas sem ordenar tudo a cada requisição
+    
+    Para cada snapshot mantém, em um LRU limitado, o resultado filtrado de
+    cada combinação (filtros, order_by):
+    
+    - primeira requisição de uma página inicial: seleção por heap (top-k);
+    - requisições seguintes da mesma combinação (próximas páginas, repetições)
+      ou páginas profundas: ordena uma vez e reutiliza a permutação ordenada,
+      servindo cada página por fatiamento.
+    
+    O `total` é sempre exato (tamanho do resultado filtrado). O cache é
+    descartado quando o snapshot muda (nova carga ou correção write-through,
+    que sempre produzem uma nova lista).
+    
+    Também atende a paginação por cursor (`paginate_cursor`), em que cada
+    página retorna um cursor opaco com a posição e a chave do último item.
+    """
+    
+    def __init__(self, name: str, max_entries: int = 64):
+        """
+        Inicializa o motor
+        
+        Args:
+            name: Nome do extrato (usado nas métricas)
+            max_entries: Quantidade máxima de combinações mantidas por snapshot
+                (0 desabilita o cache de permutações)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Sequence[Any]] = None
+        # Identifica o snapshot nos cursores: o prefixo aleatório distingue
+        # processos diferentes (vários workers) e reinícios
+        self._instance = secrets.token_hex(4)
+        self._generation = 0
+        self._entries: "OrderedDict[Tuple[FilterCriteria, str], _Entry]" = OrderedDict()
+        
+        registry = get_metrics_registry()
+        labels = {"ledger": name}
+        self._hits = registry.counter(
+            "pagination_cache_hits_total",
+            "Páginas servidas a partir de uma permutação ordenada em cache",
+            labels
+        )
+        self._top_k = registry.counter(
+            "pagination_top_k_total",
+            "Páginas servidas por seleção top-k (sem ordenação completa)",
+            labels
+        )
+        self._sorts = registry.counter(
+            "pagination_full_sorts_total",
+            "Ordenações completas do resultado filtrado",
+            labels
+        )
+    
+    def _entry(
+        self,
+        items: Sequence[Any],
+        criteria: FilterCriteria,
+        order_by: str,
+        account_field: str,
+        ledger: Optional[Ledger] = None
+    ) -> Tuple[_Entry, str]:
+        """
+        Obtém (ou cria) o resultado filtrado da combinação para o snapshot
+        
+        Returns:
+            Tupla (entrada, identificador do snapshot)
+        """
+        key = (criteria, order_by)
+        with self._lock:
+            if items is not self._snapshot:
+                self._snapshot = items
+                self._generation += 1
+                self._entries.clear()
+            snapshot_id = f"{self._instance}:{self._generation}"
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry, snapshot_id
+        
+        if ledger is not None:
+            filtered = ledger.filter(criteria, items)
+        else:
+            filtered = apply_filter(items, criteria, account_field)
+        entry = _Entry(filtered)
+        if self.max_entries <= 0:
+            return entry, snapshot_id
+        
+        with self._lock:
+            if items is self._snapshot:
+                # Outra thread pode ter criado a mesma entrada enquanto filtrava
+                entry = self._entries.setdefault(key, entry)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry, snapshot_id
+    
+    def _ordered(self, entry: _Entry, order_by: str, account_field: str) -> List[Any]:
+        """Ordena o resultado filtrado uma única vez por entrada"""
+        ordered = entry.ordered
+        if ordered is None:
+            self._sorts.inc()
+            ordered = sort_items(entry.filtered, order_by, account_field)
+            entry.ordered = ordered
+        return ordered
+    
+    def paginate(
+        self,
+        items: Sequence[Any],
+        criteria: FilterCriteria,
+        order_by: str,
+        start: int,
+        count: int,
+        account_field: str = "conta",
+        ledger: Optional[Ledger] = None
+    ) -> Tuple[int, List[Any]]:
+        """
+        Filtra, ordena e recorta uma página do snapshot
+        
+        Args:
+            items: Snapshot das transações
+            criteria: Filtros da listagem
+            order_by: Campo para ordenação
+            start: Posição inicial da página (0 = primeiro item)
+            count: Quantidade de itens por página
+            account_field: Nome do campo de conta da entidade ("conta" ou "cartao")
+            ledger: Extrato indexado de onde `items` foi obtido (usa os índices no filtro)
+        
+        Returns:
+            Tupla (total exato de itens filtrados, itens da página)
+        """
+        entry, _ = self._entry(items, criteria, order_by, account_field, ledger)
+        total = len(entry.filtered)
+        end = start + count
+        
+        if entry.ordered is not None:
+            self._hits.inc()
+            return total, entry.ordered[start:end]
+        
+        entry.requests += 1
+        if entry.requests == 1 and is_top_k_eligible(total, start, count):
+            self._top_k.inc()
+            return total, select_top(entry.filtered, end, order_by, account_field)[start:end]
+        
+        return total, self._ordered(entry, order_by, account_field)[start:end]
+    
+    def paginate_cursor(
+        self,
+        items: Sequence[Any],
+        criteria: FilterCriteria,
+        order_by: str,
+        cursor: Optional[str],
+        count: int,
+        account_field: str = "conta",
+        ledger: Optional[Ledger] = None
+    ) -> Tuple[int, int, List[Any], Optional[str]]:
+        """
+        Retorna a página seguinte ao cursor (paginação keyset)
+        
+        Se o cursor foi gerado sobre o mesmo snapshot, a página continua
+        exatamente da posição gravada (O(1)), sem ser afetada por escritas
+        posteriores. Se o snapshot mudou, a posição é localizada por busca
+        binária (O(log n)) sobre a chave (valor de ordenação, row_index) do
+        último item entregue; como exclusões deslocam o row_index das linhas
+        seguintes, apenas itens com o mesmo valor de ordenação do último item
+        podem se repetir ou ser pulados nesse caso.
+        
+        Args:
+            items: Snapshot das transações
+            criteria: Filtros da listagem
+            order_by: Campo para ordenação
+            cursor: Cursor retornado pela página anterior (None = primeira página)
+            count: Quantidade de itens por página
+            account_field: Nome do campo de conta da entidade ("conta" ou "cartao")
+            ledger: Extrato indexado de onde `items` foi obtido (usa os índices no filtro)
+        
+        Returns:
+            Tupla (total exato, posição inicial da página, itens, próximo cursor
+            ou None na última página)
+        
+        Raises:
+            ValueError: Se o cursor for inválido ou de outra combinação de filtros
+        """
+        fingerprint = query_fingerprint(criteria, order_by)
+        entry, snapshot_id = self._entry(items, criteria, order_by, account_field, ledger)
+        ordered = self._ordered(entry, order_by, account_field)
+        total = len(ordered)
+        position = position_key(order_by, account_field)
+        
+        start = 0
+        if cursor:
+            state = decode_cursor(cursor)
+            if state.get("q") != fingerprint:
+                raise ValueError("Cursor não corresponde aos filtros e à ordenação informados")
+            
+            offset = state.get("o")
+            last_key = state.get("k")
+            if state.get("s") == snapshot_id and isinstance(offset, int) and 0 <= offset <= total:
+                self._hits.inc()
+                start = offset
+            else:
+                if not isinstance(last_key, list) or len(last_key) != 2:
+                    raise ValueError("Cursor inválido")
+                try:
+                    start = bisect.bisect_right(ordered, tuple(last_key), key=position)
+                except TypeError:
+                    raise ValueError("Cursor inválido")
+        
+        page_items = ordered[start:start + count]
+        end = start + len(page_items)
+        next_cursor = None
+        if page_items and end < total:
+            next_cursor = encode_cursor({
+                "q": fingerprint,
+                "s": snapshot_id,
+                "o": end,
+                "k": list(position(page_items[-1]))
+            })
+        return total, start, page_items, next_cursor
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do motor"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "cache_hits": int(self._hits.value),
+            "top_k": int(self._top_k.value),
+            "full_sorts": int(self._sorts.value)
+        }
@@ -0,0 +1,119 @@
+"""
+Ordenação das transações e seleção parcial (top-k) de páginas
+"""
+import heapq
+from datetime import date
+from operator import attrgetter
+from typing import Any, Callable, List, Sequence, Tuple
+
+
+# Abaixo desta fração do total, a seleção por heap é mais barata que ordenar tudo
+TOP_K_MAX_FRACTION = 0.1
+
+
+def _data_key(t) -> date:
+    return t.data_ordenacao or date.min
+
+
+def sort_key(order_by: str, account_field: str = "conta") -> Tuple[Callable[[Any], Any], bool]:
+    """
+    Retorna a chave e a direção de ordenação de um campo
+    
+    Args:
+        order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, conta/cartao)
+        account_field: Nome do campo de conta da entidade ("conta" ou "cartao")
+    
+    Returns:
+        Tupla (função chave, reverse). Campos inválidos ordenam por data.
+    """
+    if order_by == "tipo":
+        return attrgetter("tipo_lower"), False
+    if order_by == "categoria":
+        return attrgetter("descritivo_lower"), False
+    if order_by == "valor":
+        return attrgetter("valor_centavos"), True
+    if order_by == "situacao":
+        return attrgetter("situacao_lower"), False
+    if order_by == account_field:
+        return attrgetter(f"{account_field}_lower"), False
+    # data (padrão): mais recente primeiro
+    return _data_key, True
+
+
+def position_key(order_by: str, account_field: str = "conta") -> Callable[[Any], Tuple[Any, int]]:
+    """
+    Retorna uma chave crescente equivalente à ordem de `sort_items`
+    
+    A ordenação é estável e o snapshot está na ordem das linhas, então itens
+    com a mesma chave ficam em ordem crescente de `row_index`. Para os campos
+    ordenados de forma decrescente (data, valor) a chave é negada. Usada para
+    localizar, por busca binária, a posição de um item na lista ordenada.
+    
+    Args:
+        order_by: Campo para ordenação
+        account_field: Nome do campo de conta da entidade
+    
+    Returns:
+        Função que retorna a tupla (chave, row_index) de um item
+    """
+    key, reverse = sort_key(order_by, account_field)
+    if key is _data_key:
+        return lambda t: (-_data_key(t).toordinal(), t.row_index or 0)
+    if reverse:
+        return lambda t: (-key(t), t.row_index or 0)
+    return lambda t: (key(t), t.row_index or 0)
+
+
+def sort_items(items: Sequence[Any], order_by: str, account_field: str = "conta") -> List[Any]:
+    """
+    Ordena as transações (ordenação estável)
+    
+    Args:
+        items: Transações
+        order_by: Campo para ordenação
+        account_field: Nome do campo de conta da entidade
+    
+    Returns:
+        Nova lista ordenada
+    """
+    key, reverse = sort_key(order_by, account_field)
+    return sorted(items, key=key, reverse=reverse)
+
+
+def is_top_k_eligible(total: int, start: int, count: int) -> bool:
+    """
+    Indica se a página pode ser obtida por seleção top-k
+    
+    Args:
+        total: Quantidade de itens filtrados
+        start: Posição inicial da página
+        count: Quantidade de itens por página
+    
+    Returns:
+        True se a página é um prefixo pequeno do resultado ordenado
+    """
+    end = start + count
+    return start >= 0 and count > 0 and end < total and end <= total * TOP_K_MAX_FRACTION
+
+
+def select_top(items: Sequence[Any], k: int, order_by: str, account_field: str = "conta") -> List[Any]:
+    """
+    Retorna os k primeiros itens na ordem de `sort_items`, sem ordenar tudo
+    
+    Usa seleção por heap (O(n log k)), com o mesmo resultado de
+    `sort_items(items, ...)[:k]`, inclusive no desempate de chaves iguais.
+    
+    Args:
+        items: Transações
+        k: Quantidade de itens
+        order_by: Campo para ordenação
+        account_field: Nome do campo de conta da entidade
+    
+    Returns:
+        Lista com os k primeiros itens
+    """
+    key, reverse = sort_key(order_by, account_field)
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
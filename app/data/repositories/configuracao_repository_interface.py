@@ -3,7 +3,7 @@ Interface do repositório de configurações
 """
 from abc import ABC, abstractmethod
 from typing import List
-from app.domain.entities import Categoria, Status, Conta, Cartao, Mes
+from app.domain.entities import Categoria, Status, Conta, Cartao, Mes, Configuracoes
 
 
 class ConfiguracaoRepositoryInterface(ABC):
@@ -11,6 +11,12 @@ class ConfiguracaoRepositoryInterface(ABC):
     Interface que define o contrato para repositórios de configuração
     """
     
+    # Todas as configurações
+    @abstractmethod
+    def get_all_configuracoes(self) -> Configuracoes:
+        """Obtém categorias, status, meses, contas e cartões de uma só vez"""
+        pass
+    
     # Categorias
     @abstractmethod
     def get_all_categorias(self) -> List[Categoria]:
@@ -1,78 +1,101 @@
 """
 Repository para acesso aos dados da página API do Google Sheets
 """
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from typing import List, Optional
-from app.domain.entities import Saldo, SaldoConta
+from typing import Any, Dict, List, Optional
+from app.domain.entities import SaldoConta, Saldos
 from app.core.config import Settings
+from app.data.sheets_connection import SheetsConnectionManager
+from app.data.sheets_errors import with_context
+from app.data.snapshot_cache import SnapshotCache
+from app.data.snapshot_store import get_snapshot_persistence
+
+
+# Intervalos da página API lidos juntos: saldo geral e tabela de saldos por conta
+SALDO_GERAL_RANGE = "A2"
+SALDO_CONTAS_RANGE = "O:P"
 
 
 class GoogleSheetsAPIRepository:
     """
     Repositório para acessar dados da página API (saldos) no Google Sheets
+    
+    O saldo geral e o saldo por conta vêm de uma única chamada batch_get,
+    mantida em um cache curto (as células são fórmulas que mudam com qualquer
+    lançamento). Leituras concorrentes aguardam a mesma chamada à planilha.
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, connection: Optional[SheetsConnectionManager] = None):
         self.settings = settings
+        self._connection = connection or SheetsConnectionManager(settings)
         self.spreadsheet = None
         self.sheet_name = "API"  # Nome da página
+        self._worksheets = self._connection.worksheets
+        self._cache: SnapshotCache[Saldos] = SnapshotCache(
+            "saldos",
+            settings.saldos_cache_ttl_seconds,
+            change_token=self._connection.revision if settings.cache_revision_check else None,
+            max_age_seconds=settings.cache_max_age_seconds
+        )
+        if settings.snapshot_persist_enabled and self._cache.enabled:
+            get_snapshot_persistence(
+                settings.snapshot_dir,
+                settings.snapshot_persist_interval_seconds
+            ).register(self._cache, dump=_dump_saldos, load=_load_saldos)
     
     def _connect(self):
-        """Conecta ao Google Sheets"""
+        """Conecta ao Google Sheets (conexão compartilhada pelo SheetsConnectionManager)"""
         try:
-            # Configurar credenciais
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # Criar credenciais usando o mesmo padrão dos outros repositórios
-            credentials = ServiceAccountCredentials.from_json_keyfile_dict(
-                {
-                    "type": "service_account",
-                    "project_id": "controle-financeiro-450717",
-                    "private_key_id": "dummy_key_id",  # Não é necessário para autenticação
-                    "private_key": self.settings.google_private_key.replace('\\n', '\n'),
-                    "client_email": self.settings.google_service_account_email,
-                    "client_id": "",
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                    "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{self.settings.google_service_account_email.replace('@', '%40')}"
-                },
-                scope
-            )
-            
-            # Autorizar e abrir a planilha
-            client = gspread.authorize(credentials)
-            self.spreadsheet = client.open_by_key(self.settings.google_sheets_id)
-            
+            self.spreadsheet = self._connection.spreadsheet()
         except Exception as e:
             print(f"Erro ao conectar ao Google Sheets: {e}")
             raise
     
-    def get_saldo_geral(self) -> Saldo:
+    def _fetch_saldos(self) -> Saldos:
         """
-        Obtém o saldo geral da célula A2 da página API
+        Lê o saldo geral e a tabela de saldos por conta em uma única requisição
         
         Returns:
-            Entidade Saldo com o valor
+            Entidade Saldos
         """
-        try:
-            if not self.spreadsheet:
-                self._connect()
-            
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
-            
-            # Lê a célula A2
-            valor = worksheet.acell('A2').value or "R$ 0,00"
+        if not self.spreadsheet:
+            self._connect()
+        
+        geral, tabela = self._worksheets.run(
+            self.sheet_name,
+            lambda ws: ws.batch_get([SALDO_GERAL_RANGE, SALDO_CONTAS_RANGE])
+        )
+        
+        valor = (geral[0][0] if geral and geral[0] else "") or "R$ 0,00"
+        
+        # Ignora o cabeçalho (primeira linha)
+        contas = []
+        for row in tabela[1:]:
+            # Ignora linhas vazias
+            if not row or len(row) < 2:
+                continue
             
-            return Saldo(valor=valor)
+            conta = row[0].strip()
+            saldo = row[1].strip()
             
+            # Adiciona apenas se a conta tiver nome
+            if conta:
+                contas.append(SaldoConta(conta=conta, saldo=saldo))
+        
+        return Saldos(valor=valor, contas=contas)
+    
+    def get_saldos(self) -> Saldos:
+        """
+        Obtém o saldo geral (célula A2) e o saldo por conta (tabela O:P)
+        
+        Returns:
+            Entidade Saldos
+        """
+        try:
+            # Com o cache desabilitado, leituras simultâneas ainda compartilham uma única chamada
+            return self._cache.get(lambda: self._connection.read(self.sheet_name, self._fetch_saldos))
         except Exception as e:
-            print(f"Erro ao obter saldo geral: {e}")
-            raise Exception(f"Erro ao obter saldo geral: {str(e)}")
+            print(f"Erro ao obter saldos: {e}")
+            raise with_context(e, "Erro ao obter saldos")
     
     def get_saldo_por_conta(self) -> List[SaldoConta]:
         """
@@ -81,34 +104,17 @@ class GoogleSheetsAPIRepository:
         Returns:
             Lista de entidades SaldoConta
         """
-        try:
-            if not self.spreadsheet:
-                self._connect()
-            
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
-            
-            # Lê o intervalo O:P (todas as linhas das colunas O e P)
-            valores = worksheet.get('O:P')
-            
-            if len(valores) < 2:
-                return []
-            
-            # Ignora o cabeçalho (primeira linha)
-            saldos = []
-            for row in valores[1:]:
-                # Ignora linhas vazias
-                if not row or len(row) < 2:
-                    continue
-                
-                conta = row[0].strip() if len(row) > 0 else ""
-                saldo = row[1].strip() if len(row) > 1 else "R$ 0,00"
-                
-                # Adiciona apenas se a conta tiver nome
-                if conta:
-                    saldos.append(SaldoConta(conta=conta, saldo=saldo))
-            
-            return saldos
-            
-        except Exception as e:
-            print(f"Erro ao obter saldo por conta: {e}")
-            raise Exception(f"Erro ao obter saldo por conta: {str(e)}")
+        return list(self.get_saldos().contas)
+
+
+def _dump_saldos(saldos: Saldos) -> Dict[str, Any]:
+    """Converte os saldos em dados serializáveis para o snapshot em disco"""
+    return saldos.to_dict()
+
+
+def _load_saldos(data: Dict[str, Any]) -> Saldos:
+    """Reconstrói os saldos a partir do snapshot em disco"""
+    return Saldos(
+        valor=data["valor"],
+        contas=[SaldoConta(conta=c["conta"], saldo=c["saldo"]) for c in data["contas"]]
+    )
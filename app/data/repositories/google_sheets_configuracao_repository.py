@@ -1,12 +1,43 @@
 """
 Repositório de configurações usando Google Sheets
 """
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from typing import List, Optional
-from app.domain.entities import Categoria, Status, Conta, Cartao, Mes
+import re
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from app.domain.entities import Categoria, Status, Conta, Cartao, Mes, Configuracoes
 from app.data.repositories.configuracao_repository_interface import ConfiguracaoRepositoryInterface
 from app.core.config import Settings
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_connection import SheetsConnectionManager
+from app.data.snapshot_cache import SnapshotCache
+from app.data.snapshot_store import get_snapshot_persistence
+
+
+T = TypeVar("T")
+
+# Colunas da aba de configurações lidas de uma só vez (F não é usada, mas fica no intervalo)
+COLUMN_LETTERS = "ABCDEFG"
+COLUMNS_RANGE = "A:G"
+
+# Tentativas de uma alteração condicional (a segunda usa as colunas relidas)
+WRITE_ATTEMPTS = 2
+
+# Primeira linha do intervalo gravado (ex: "'Configurações'!B7:B7" -> 7)
+_UPDATED_ROW_RE = re.compile(r"!\$?[A-Z]+\$?(\d+)")
+
+
+def _updated_row(response: Any) -> Optional[int]:
+    """
+    Obtém a linha gravada por um append a partir da resposta da API
+    
+    Args:
+        response: Resposta de values.append
+    
+    Returns:
+        Número da linha ou None se a resposta não informar o intervalo
+    """
+    updated_range = ((response or {}).get("updates") or {}).get("updatedRange", "")
+    match = _UPDATED_ROW_RE.search(updated_range)
+    return int(match.group(1)) if match else None
 
 
 class GoogleSheetsConfiguracaoRepository(ConfiguracaoRepositoryInterface):
@@ -14,84 +45,274 @@ class GoogleSheetsConfiguracaoRepository(ConfiguracaoRepositoryInterface):
     Implementação do repositório de configurações usando Google Sheets
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, connection: Optional[SheetsConnectionManager] = None):
         """
         Inicializa o repositório com as configurações
         
         Args:
             settings: Configurações da aplicação
+            connection: Conexão compartilhada (uma nova é criada se omitida)
         """
         self.settings = settings
+        self._connection = connection or SheetsConnectionManager(settings)
         self.sheets_id = settings.google_sheets_id
         self.sheet_name = "Configurações"  # Nome da aba de configurações
         self.spreadsheet = None
-        self._connect()
+        self._worksheets = self._connection.worksheets
+        # Todas as colunas em um único cache, lidas em uma única requisição
+        self._change_token = self._connection.revision if settings.cache_revision_check else None
+        self._cache: Optional[SnapshotCache[Dict[str, List[str]]]] = None
+        self._conflicts = get_metrics_registry().counter(
+            "configuracoes_write_conflicts_total",
+            "Alterações de configuração em conflito com o snapshot (célula alterada por outro cliente)"
+        )
+        # Com snapshots salvos em disco, a conexão só é feita quando a planilha for necessária
+        if not settings.snapshot_persist_enabled:
+            self._connect()
     
     def _connect(self):
-        """Conecta ao Google Sheets"""
+        """Conecta ao Google Sheets (conexão compartilhada pelo SheetsConnectionManager)"""
         try:
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            credentials = ServiceAccountCredentials.from_json_keyfile_dict(
-                {
-                    "type": "service_account",
-                    "project_id": "controle-financeiro-450717",
-                    "private_key_id": "dummy_key_id",
-                    "private_key": self.settings.google_private_key.replace('\\n', '\n'),
-                    "client_email": self.settings.google_service_account_email,
-                    "client_id": "",
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                    "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{self.settings.google_service_account_email.replace('@', '%40')}"
-                },
-                scope
-            )
-            
-            client = gspread.authorize(credentials)
-            self.spreadsheet = client.open_by_key(self.sheets_id)
-            
+            self.spreadsheet = self._connection.spreadsheet()
         except Exception as e:
             print(f"Erro ao conectar ao Google Sheets: {e}")
             raise
     
-    def _get_worksheet(self):
-        """Obtém a worksheet de configurações"""
+    def _run(self, operation: Callable[[Any], T], write: bool = False) -> T:
+        """
+        Executa uma operação sobre a worksheet de configurações
+        
+        O handle da aba é resolvido uma única vez e reutilizado entre chamadas.
+        
+        Args:
+            operation: Função que recebe a worksheet e chama a API
+            write: Se True, a chamada consome a cota de escrita
+        
+        Returns:
+            Resultado da operação
+        """
         if not self.spreadsheet:
             self._connect()
-        return self.spreadsheet.worksheet(self.sheet_name)
+        return self._worksheets.run(self.sheet_name, operation, write=write)
+    
+    def _write(self, operation: Callable[[Any], T]) -> T:
+        """
+        Executa uma escrita na worksheet de configurações
+        
+        Leituras iniciadas depois da escrita não reaproveitam uma leitura
+        que já estava em andamento (e poderia não incluí-la).
+        
+        Args:
+            operation: Função que recebe a worksheet e chama a API
+        
+        Returns:
+            Resultado da operação
+        """
+        try:
+            return self._run(operation, write=True)
+        finally:
+            self._connection.written(self.sheet_name)
+    
+    def _get_cache(self) -> SnapshotCache[Dict[str, List[str]]]:
+        """
+        Obtém o cache das colunas, criando-o na primeira utilização
+        
+        Returns:
+            SnapshotCache com as colunas A–G (letra -> células, a partir da linha 1)
+        """
+        if self._cache is None:
+            cache = SnapshotCache(
+                "configuracoes",
+                self.settings.cache_ttl_seconds,
+                change_token=self._change_token,
+                max_age_seconds=self.settings.cache_max_age_seconds
+            )
+            if self.settings.snapshot_persist_enabled and cache.enabled:
+                get_snapshot_persistence(
+                    self.settings.snapshot_dir,
+                    self.settings.snapshot_persist_interval_seconds
+                ).register(cache, dump=dict, load=dict)
+            self._cache = cache
+        return self._cache
     
-    def _get_column_values(self, col_letter: str) -> List[str]:
+    def _fetch_columns(self) -> Dict[str, List[str]]:
+        """
+        Lê da planilha as colunas A–G em uma única requisição
+        
+        Returns:
+            Dicionário letra -> células da coluna (incluindo o cabeçalho e as
+            células vazias intermediárias, para preservar a posição das linhas)
+        """
+        values = self._connection.read(
+            self.sheet_name,
+            lambda: self._run(lambda ws: ws.get(COLUMNS_RANGE, major_dimension="COLUMNS"))
+        )
+        # A API omite as colunas vazias no final do intervalo
+        return {
+            col_letter: list(values[i]) if i < len(values) else []
+            for i, col_letter in enumerate(COLUMN_LETTERS)
+        }
+    
+    def _get_columns(self) -> Dict[str, List[str]]:
+        """
+        Obtém as colunas A–G (do cache ou da planilha)
+        
+        Returns:
+            Dicionário letra -> células da coluna, a partir da linha 1
+        """
+        return self._get_cache().get(self._fetch_columns)
+    
+    def _get_column_values(self, col_letter: str, columns: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """
         Obtém todos os valores de uma coluna (exceto o cabeçalho)
         
         Args:
-            col_letter: Letra da coluna (A, B, C, D)
-            
+            col_letter: Letra da coluna (A a G)
+            columns: Colunas já obtidas (lidas do cache se omitidas)
+        
         Returns:
             Lista de valores não vazios
         """
-        worksheet = self._get_worksheet()
-        values = worksheet.col_values(ord(col_letter) - ord('A') + 1)
+        if columns is None:
+            columns = self._get_columns()
         # Remove o cabeçalho e valores vazios
-        return [v.strip() for v in values[1:] if v.strip()]
+        return [v.strip() for v in columns.get(col_letter, [])[1:] if v.strip()]
+    
+    def _patch_cell(self, col_letter: str, row: int, value: str):
+        """
+        Aplica uma escrita confirmada ao snapshot das colunas (sem nova leitura)
+        
+        Args:
+            col_letter: Letra da coluna
+            row: Linha escrita (1 = cabeçalho)
+            value: Valor gravado ("" para apagar)
+        """
+        def patch(columns: Dict[str, List[str]]) -> Dict[str, List[str]]:
+            cells = list(columns.get(col_letter, []))
+            cells.extend([""] * (row - len(cells)))
+            cells[row - 1] = value
+            # Como na leitura, a coluna termina na última célula preenchida
+            while cells and not cells[-1]:
+                cells.pop()
+            return {**columns, col_letter: cells}
+        
+        self._get_cache().update(patch)
+    
+    def _find_row(self, col_letter: str, value: str, columns: Dict[str, List[str]]) -> Optional[int]:
+        """
+        Localiza no snapshot a linha de um valor (ignora o cabeçalho)
+        
+        Args:
+            col_letter: Letra da coluna
+            value: Valor procurado
+            columns: Colunas do snapshot
+        
+        Returns:
+            Número da linha na planilha ou None se o valor não estiver na coluna
+        """
+        for row, cell in enumerate(columns.get(col_letter, [])[1:], start=2):
+            if cell.strip() == value:
+                return row
+        return None
+    
+    def _replace_cell(self, col_letter: str, row: int, expected: str, new_value: str) -> bool:
+        """
+        Troca o conteúdo de uma célula somente se ela ainda contiver o valor esperado
+        
+        Usa um único batchUpdate com findReplace restrito à célula (texto
+        inteiro, diferenciando maiúsculas): a verificação e a escrita são
+        feitas pela API na mesma requisição.
+        
+        Args:
+            col_letter: Letra da coluna
+            row: Linha da célula
+            expected: Conteúdo esperado (como está no snapshot)
+            new_value: Novo conteúdo ("" para apagar)
+        
+        Returns:
+            True se a célula foi alterada, False se o conteúdo não era o esperado
+        """
+        col_index = ord(col_letter) - ord('A')
+        
+        def replace(ws):
+            body = {"requests": [{
+                "findReplace": {
+                    "find": expected,
+                    "replacement": new_value,
+                    "matchCase": True,
+                    "matchEntireCell": True,
+                    "range": {
+                        "sheetId": ws.id,
+                        "startRowIndex": row - 1,
+                        "endRowIndex": row,
+                        "startColumnIndex": col_index,
+                        "endColumnIndex": col_index + 1
+                    }
+                }
+            }]}
+            return ws.spreadsheet.batch_update(body)
+        
+        response = self._write(replace)
+        replies = (response or {}).get("replies") or [{}]
+        return (replies[0].get("findReplace") or {}).get("occurrencesChanged", 0) > 0
+    
+    def _replace_in_column(self, col_letter: str, old_value: str, new_value: str) -> bool:
+        """
+        Substitui um valor de uma coluna (otimista: sem leitura antes da escrita)
+        
+        A linha vem do snapshot em cache e a escrita é condicional (ver
+        `_replace_cell`). Se o valor não estiver no snapshot ou a célula tiver
+        sido alterada por outro cliente, o snapshot é descartado e a operação
+        é refeita uma vez com as colunas relidas.
+        
+        Args:
+            col_letter: Letra da coluna
+            old_value: Valor atual
+            new_value: Novo valor ("" para apagar)
+        
+        Returns:
+            True se substituiu, False se o valor não existe na coluna
+        """
+        for attempt in range(WRITE_ATTEMPTS):
+            if attempt > 0:
+                self._get_cache().invalidate()
+            columns = self._get_columns()
+            row = self._find_row(col_letter, old_value, columns)
+            if row is None:
+                continue
+            if self._replace_cell(col_letter, row, columns[col_letter][row - 1], new_value):
+                self._patch_cell(col_letter, row, new_value)
+                return True
+            self._conflicts.inc()
+        return False
     
     def _append_to_column(self, col_letter: str, value: str):
         """
-        Adiciona um valor ao final de uma coluna
+        Adiciona um valor ao final de uma coluna sem sobrescrever dados
+        
+        A próxima linha livre vem do snapshot em cache e a escrita é um append
+        restrito à coluna a partir dessa linha: se outro cliente já tiver
+        preenchido a célula, a API grava o valor depois dos dados da coluna em
+        vez de sobrescrevê-los. Nesse caso o conflito é contado e o snapshot é
+        descartado (o valor já foi gravado, então a escrita não é refeita).
         
         Args:
             col_letter: Letra da coluna
             value: Valor a adicionar
         """
-        worksheet = self._get_worksheet()
-        col_num = ord(col_letter) - ord('A') + 1
-        values = worksheet.col_values(col_num)
-        next_row = len(values) + 1
-        worksheet.update_cell(next_row, col_num, value)
+        expected_row = len(self._get_columns().get(col_letter, [])) + 1
+        response = self._write(lambda ws: ws.append_row(
+            [value],
+            value_input_option="USER_ENTERED",
+            insert_data_option="OVERWRITE",
+            table_range=f"{col_letter}{expected_row}:{col_letter}"
+        ))
+        row = _updated_row(response)
+        if row == expected_row:
+            self._patch_cell(col_letter, row, value)
+            return
+        self._conflicts.inc()
+        self._get_cache().invalidate()
     
     def _delete_from_column(self, col_letter: str, value: str) -> bool:
         """
@@ -104,17 +325,7 @@ class GoogleSheetsConfiguracaoRepository(ConfiguracaoRepositoryInterface):
         Returns:
             True se deletou, False se não encontrou
         """
-        worksheet = self._get_worksheet()
-        col_num = ord(col_letter) - ord('A') + 1
-        
-        try:
-            cell = worksheet.find(value, in_column=col_num)
-            if cell and cell.row > 1:  # Não deletar o cabeçalho
-                worksheet.update_cell(cell.row, col_num, "")
-                return True
-        except:
-            pass
-        return False
+        return self._replace_in_column(col_letter, value, "")
     
     def _update_in_column(self, col_letter: str, old_value: str, new_value: str) -> bool:
         """
@@ -128,17 +339,28 @@ class GoogleSheetsConfiguracaoRepository(ConfiguracaoRepositoryInterface):
         Returns:
             True se atualizou, False se não encontrou
         """
-        worksheet = self._get_worksheet()
-        col_num = ord(col_letter) - ord('A') + 1
+        return self._replace_in_column(col_letter, old_value, new_value)
+    
+    # ==================== TODAS AS CONFIGURAÇÕES ====================
+    
+    def get_all_configuracoes(self) -> Configuracoes:
+        """
+        Obtém todas as listas de configuração a partir de uma única leitura
         
-        try:
-            cell = worksheet.find(old_value, in_column=col_num)
-            if cell and cell.row > 1:
-                worksheet.update_cell(cell.row, col_num, new_value)
-                return True
-        except:
-            pass
-        return False
+        Returns:
+            Entidade Configuracoes com categorias, status, meses, contas e cartões
+        """
+        columns = self._get_columns()
+        return Configuracoes(
+            categorias=[Categoria(nome=v) for v in self._get_column_values('A', columns)],
+            status=(
+                [Status(nome=v, tipo="RECEITA") for v in self._get_column_values('B', columns)]
+                + [Status(nome=v, tipo="DESPESA") for v in self._get_column_values('C', columns)]
+            ),
+            meses=[Mes(nome=v) for v in self._get_column_values('G', columns)],
+            contas=[Conta(nome=v) for v in self._get_column_values('D', columns)],
+            cartoes=[Cartao(nome=v) for v in self._get_column_values('E', columns)]
+        )
     
     # ==================== CATEGORIAS ====================
     
@@ -169,15 +391,16 @@ class GoogleSheetsConfiguracaoRepository(ConfiguracaoRepositoryInterface):
             Lista de status filtrados por tipo (se especificado)
         """
         status_list = []
+        columns = self._get_columns()
         
         # Coluna B - Status de Receita
         if tipo is None or tipo.upper() == "RECEITA":
-            receitas = self._get_column_values('B')
+            receitas = self._get_column_values('B', columns)
             status_list.extend([Status(nome=v, tipo="RECEITA") for v in receitas])
         
         # Coluna C - Status de Despesa  
         if tipo is None or tipo.upper() == "DESPESA":
-            despesas = self._get_column_values('C')
+            despesas = self._get_column_values('C', columns)
             status_list.extend([Status(nome=v, tipo="DESPESA") for v in despesas])
         
         return status_list
@@ -1,14 +1,26 @@
 """
 Repositório Google Sheets para transações de cartão de crédito
 """
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import os
+from dataclasses import replace
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from app.core.config import Settings
+from app.data.sheets_connection import SheetsConnectionManager
+from app.data.sheets_errors import with_context
+from app.data.sheets_scheduler import BULK, sheets_lane
 from app.data.repositories.transacao_credito_repository_interface import TransacaoCreditoRepositoryInterface
 from app.domain.entities import TransacaoCredito
+from app.data.snapshot_cache import SnapshotCache
+from app.data.snapshot_store import get_snapshot_persistence
+from app.data.query.filters import FilterCriteria
+from app.data.query.ledger import Ledger
+from app.data.query.pagination import PaginationEngine
+from app.data.query.sorting import sort_items
+from app.data.sheets_utils import delete_rows_requests, parse_updated_rows
+from app.data.write_behind import (
+    CREATE, DELETE, UPDATE, PendingWrite, WriteBehindQueue, apply_write, register_write_behind_queue
+)
 
 
 class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
@@ -16,46 +28,60 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
     Implementação do repositório usando Google Sheets como fonte de dados
     """
     
-    def __init__(self, settings: Settings):
+    # Ordem das colunas A:H da aba (mesma ordem usada nas escritas)
+    _COLUMNS = ["TIPO", "DESCRITIVO", "VALOR", "DATA", "MÊS", "DETALHES", "SITUAÇÃO", "CARTÃO"]
+    
+    def __init__(self, settings: Settings, connection: Optional[SheetsConnectionManager] = None):
         """
         Inicializa o repositório com as configurações
         
         Args:
             settings: Configurações da aplicação
+            connection: Conexão compartilhada (uma nova é criada se omitida)
         """
         self.settings = settings
+        self._connection = connection or SheetsConnectionManager(settings)
         self.sheets_id = settings.google_sheets_id
         self.sheet_name = "Extrato Crédito"
         self.spreadsheet = None
-        self._connect()
+        self._worksheets = self._connection.worksheets
+        self._revision = self._connection.revision
+        self._pages = PaginationEngine("transacoes_credito", settings.pagination_cache_entries)
+        self._cache: SnapshotCache[Ledger[TransacaoCredito]] = SnapshotCache(
+            "transacoes_credito",
+            settings.cache_ttl_seconds,
+            change_token=self._revision if settings.cache_revision_check else None,
+            max_age_seconds=settings.cache_max_age_seconds
+        )
+        self._write_behind: Optional[WriteBehindQueue] = None
+        
+        # Snapshot salvo em disco: servido já na inicialização enquanto é revalidado
+        restored = False
+        if settings.snapshot_persist_enabled and self._cache.enabled:
+            restored = get_snapshot_persistence(
+                settings.snapshot_dir,
+                settings.snapshot_persist_interval_seconds
+            ).register(self._cache, dump=self._dump_ledger, load=self._restore_ledger)
+        # Com um snapshot restaurado, a conexão fica para a revalidação em segundo plano
+        if not restored:
+            self._connect()
+        
+        # Write-behind: as escritas são confirmadas após o journal e gravadas em segundo plano
+        if settings.write_behind_enabled and self._cache.enabled:
+            self._write_behind = register_write_behind_queue(WriteBehindQueue(
+                "transacoes_credito",
+                append_rows=self._append_rows,
+                update_rows=self._update_rows,
+                delete_rows=self._delete_rows,
+                journal_path=os.path.join(settings.write_behind_journal_dir, "transacoes_credito.jsonl"),
+                flush_interval_seconds=settings.write_behind_flush_interval_seconds,
+                on_conflict=self._reload_after_conflict
+            ))
     
     def _connect(self):
-        """Conecta ao Google Sheets"""
+        """Conecta ao Google Sheets (conexão compartilhada pelo SheetsConnectionManager)"""
         try:
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            credentials = ServiceAccountCredentials.from_json_keyfile_dict(
-                {
-                    "type": "service_account",
-                    "project_id": "controle-financeiro-450717",
-                    "private_key_id": "dummy_key_id",  # Não é necessário para autenticação
-                    "private_key": self.settings.google_private_key.replace('\\n', '\n'),
-                    "client_email": self.settings.google_service_account_email,
-                    "client_id": "",
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                    "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{self.settings.google_service_account_email.replace('@', '%40')}"
-                },
-                scope
-            )
-            
-            client = gspread.authorize(credentials)
-            self.spreadsheet = client.open_by_key(self.sheets_id)
-            
+            self.spreadsheet = self._connection.spreadsheet()
         except Exception as e:
             print(f"Erro ao conectar ao Google Sheets: {e}")
             raise
@@ -64,15 +90,32 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
         """
         Obtém dados brutos da planilha
         
+        Leituras simultâneas da aba compartilham uma única chamada à API e o
+        mesmo resultado (ver `SheetsConnectionManager.read`).
+        
         Returns:
             Lista de dicionários com os dados (incluindo row_index)
+        
+        Raises:
+            Exception: Se não for possível ler a planilha
+        """
+        return self._connection.read(self.sheet_name, self._read_raw_data)
+    
+    def _read_raw_data(self) -> List[Dict[str, str]]:
+        """
+        Lê a aba inteira e converte as linhas em dicionários
+        
+        Returns:
+            Lista de dicionários com os dados (incluindo row_index)
+        
+        Raises:
+            Exception: Se não for possível ler a planilha
         """
         try:
             if not self.spreadsheet:
                 self._connect()
             
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
-            all_values = worksheet.get_all_values()
+            all_values = self._worksheets.run(self.sheet_name, lambda ws: ws.get_all_values())
             
             if len(all_values) < 2:
                 return []
@@ -99,7 +142,25 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             
         except Exception as e:
             print(f"Erro ao obter dados da planilha: {e}")
-            return []
+            raise
+    
+    def _write(self, operation: Callable[[Any], Any]) -> Any:
+        """
+        Executa uma escrita na aba
+        
+        Leituras iniciadas depois da escrita não reaproveitam uma leitura
+        que já estava em andamento (e poderia não incluí-la).
+        
+        Args:
+            operation: Função que recebe o Worksheet e chama a API
+        
+        Returns:
+            Resposta da API
+        """
+        try:
+            return self._worksheets.run(self.sheet_name, operation, write=True)
+        finally:
+            self._connection.written(self.sheet_name)
     
     def _dict_to_entity(self, data: Dict[str, str]) -> TransacaoCredito:
         """
@@ -123,97 +184,153 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             row_index=data.get("_row_index")
         )
     
-    def _parse_date(self, date_str: str) -> datetime:
+    def _load_transacoes(self) -> List[TransacaoCredito]:
         """
-        Converte string de data DD/MM/YYYY para datetime
+        Lê a planilha e converte todas as linhas em entidades
         
-        Args:
-            date_str: String da data
-            
         Returns:
-            Objeto datetime
+            Lista de entidades TransacaoCredito na ordem da planilha
+        """
+        return [self._dict_to_entity(item) for item in self._get_raw_data()]
+    
+    def _load_ledger(self) -> Ledger[TransacaoCredito]:
+        """
+        Lê a planilha e monta o extrato indexado
+        
+        Returns:
+            Extrato com as transações e seus índices secundários
+        """
+        if self._write_behind is None:
+            return Ledger(self._load_transacoes(), account_field="cartao", name="transacoes_credito")
+        
+        # Alterações ainda não gravadas são reaplicadas sobre a leitura (as
+        # incompatíveis são descartadas); as gravações ficam pausadas para que
+        # as duas correspondam ao mesmo momento
+        with self._write_behind.paused():
+            ledger = Ledger(self._load_transacoes(), account_field="cartao", name="transacoes_credito")
+            pending = self._write_behind.pending()
+            kept = []
+            for write in pending:
+                if apply_write(ledger, write, self._row_to_entity) is None:
+                    print(f"Alteração pendente incompatível com a planilha (transacoes_credito), descartada: {write}")
+                else:
+                    kept.append(write)
+            self._write_behind.resolve(pending, kept)
+            return ledger
+    
+    def _reload_after_conflict(self):
+        """
+        Relê a planilha após uma divergência do write-behind
+        
+        As alterações retidas são reaplicadas sobre a leitura nova em
+        `_load_ledger`, que descarta as incompatíveis e libera as gravações.
         """
+        self._cache.invalidate()
         try:
-            return datetime.strptime(date_str.strip(), "%d/%m/%Y")
-        except:
-            return None
+            self._cache.get(self._load_ledger, allow_stale=False)
+        except Exception as e:
+            # As gravações continuam retidas; a próxima tentativa relê de novo
+            print(f"Erro ao reler a planilha após divergência do write-behind: {e}")
     
-    def _apply_filters(
-        self,
-        transacoes: List[TransacaoCredito],
-        tipo: Optional[str] = None,
-        categoria: Optional[str] = None,
-        data_inicio: Optional[str] = None,
-        data_fim: Optional[str] = None,
-        mes: Optional[str] = None,
-        situacao: Optional[str] = None,
-        cartao: Optional[str] = None,
-        order_by: str = "data"
-    ) -> List[TransacaoCredito]:
+    def _dump_ledger(self, ledger: Ledger[TransacaoCredito]) -> List[List[Any]]:
+        """Converte o extrato em linhas [row_index, colunas A:H] para salvar em disco"""
+        return [[transacao.row_index] + self._entity_to_row(transacao) for transacao in ledger.items]
+    
+    def _restore_ledger(self, rows: List[List[Any]]) -> Ledger[TransacaoCredito]:
+        """Reconstrói o extrato (e seus índices) a partir das linhas salvas em disco"""
+        return Ledger(
+            (self._row_to_entity(row[1:], row[0]) for row in rows),
+            account_field="cartao",
+            name="transacoes_credito"
+        )
+    
+    def _get_ledger(self) -> Ledger[TransacaoCredito]:
+        """
+        Obtém o extrato indexado a partir do snapshot em cache
+        
+        Com a planilha indisponível, o último snapshot válido é servido (ver
+        `SnapshotCache.get`); sem snapshot, a falha é repassada em vez de
+        parecer um extrato vazio.
+        
+        Returns:
+            Extrato indexado
+        
+        Raises:
+            SheetsError: Se a planilha estiver indisponível e não houver snapshot
+        """
+        return self._cache.get(self._load_ledger)
+    
+    def _get_transacoes(self) -> List[TransacaoCredito]:
+        """
+        Obtém todas as transações a partir do snapshot em cache
+        
+        Returns:
+            Lista de entidades TransacaoCredito
+        """
+        return self._get_ledger().items
+    
+    def load_snapshot(self) -> List[TransacaoCredito]:
         """
-        Aplica filtros à lista de transações
+        Lê todas as transações da planilha, sem passar pelo cache
+        
+        Inclui as alterações ainda pendentes no write-behind. Usado para
+        sincronizar réplicas locais (ver `SqliteMirror`).
+        
+        Returns:
+            Lista de entidades TransacaoCredito na ordem da planilha
+        """
+        return self._load_ledger().items
+    
+    def change_token(self) -> Optional[str]:
+        """
+        Retorna o token de revisão atual da planilha no Drive
+        
+        Returns:
+            Token de revisão, ou None se indisponível
+        """
+        if not self.spreadsheet:
+            self._connect()
+        return self._revision()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do cache de transações de crédito"""
+        return self._cache.stats()
+    
+    def _entity_to_row(self, transacao: TransacaoCredito) -> List[str]:
+        """
+        Converte a entidade nos valores das colunas A:H
         
         Args:
-            transacoes: Lista de transações
-            tipo: Filtro por tipo (RECEITA ou DESPESA)
-            categoria: Filtro por categoria/descritivo
-            data_inicio: Data inicial (DD/MM/YYYY)
-            data_fim: Data final (DD/MM/YYYY)
-            mes: Filtro por mês
-            situacao: Filtro por situação
-            cartao: Filtro por cartão
-            order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, cartao)
-            
+            transacao: Entidade TransacaoCredito
+        
+        Returns:
+            Lista com os valores na ordem das colunas da planilha
+        """
+        return [
+            transacao.tipo,
+            transacao.descritivo,
+            transacao.valor,
+            transacao.data,
+            transacao.mes,
+            transacao.detalhes or "",
+            transacao.situacao,
+            transacao.cartao
+        ]
+    
+    def _row_to_entity(self, valores: List[str], row_index: Optional[int]) -> TransacaoCredito:
+        """
+        Converte uma linha escrita na planilha na entidade equivalente à lida
+        
+        Args:
+            valores: Valores das colunas A:H
+            row_index: Índice da linha na planilha
+        
         Returns:
-            Lista filtrada de transações
-        """
-        filtered = transacoes
-        
-        # Filtro por tipo
-        if tipo:
-            tipo_upper = tipo.upper()
-            filtered = [t for t in filtered if t.tipo.upper() == tipo_upper]
-        
-        # Filtro por categoria/descritivo (case-insensitive, contains)
-        if categoria:
-            categoria_lower = categoria.lower()
-            filtered = [t for t in filtered if categoria_lower in t.descritivo.lower()]
-        
-        # Filtro por data (intervalo)
-        if data_inicio or data_fim:
-            date_filtered = []
-            dt_inicio = self._parse_date(data_inicio) if data_inicio else None
-            dt_fim = self._parse_date(data_fim) if data_fim else None
-            
-            for t in filtered:
-                dt_transacao = self._parse_date(t.data)
-                if dt_transacao:
-                    if dt_inicio and dt_transacao < dt_inicio:
-                        continue
-                    if dt_fim and dt_transacao > dt_fim:
-                        continue
-                    date_filtered.append(t)
-            filtered = date_filtered
-        
-        # Filtro por mês (case-insensitive)
-        if mes:
-            mes_lower = mes.lower()
-            filtered = [t for t in filtered if mes_lower in t.mes.lower()]
-        
-        # Filtro por situação (case-insensitive)
-        if situacao:
-            situacao_lower = situacao.lower()
-            filtered = [t for t in filtered if situacao_lower in t.situacao.lower()]
-        
-        # Filtro por cartão (case-insensitive)
-        if cartao:
-            cartao_lower = cartao.lower()
-            filtered = [t for t in filtered if cartao_lower in t.cartao.lower()]
-        
-        # Ordenação
-        filtered = self._sort_transacoes(filtered, order_by)
-        
-        return filtered
+            Entidade TransacaoCredito normalizada como em _get_raw_data
+        """
+        data = {header: (valor or "").strip() for header, valor in zip(self._COLUMNS, valores)}
+        data["_row_index"] = row_index
+        return self._dict_to_entity(data)
     
     def _sort_transacoes(self, transacoes: List[TransacaoCredito], order_by: str) -> List[TransacaoCredito]:
         """
@@ -226,38 +343,7 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
         Returns:
             Lista ordenada
         """
-        if order_by == "data":
-            # Ordena por data (mais recente primeiro)
-            return sorted(
-                transacoes,
-                key=lambda t: self._parse_date(t.data) or datetime.min,
-                reverse=True
-            )
-        elif order_by == "tipo":
-            return sorted(transacoes, key=lambda t: t.tipo.lower())
-        elif order_by == "categoria":
-            return sorted(transacoes, key=lambda t: t.descritivo.lower())
-        elif order_by == "valor":
-            # Remove formatação e converte para float
-            def parse_valor(valor_str: str) -> float:
-                try:
-                    # Remove R$, espaços e converte vírgula para ponto
-                    clean = valor_str.replace("R$", "").replace(" ", "").replace(".", "").replace(",", ".")
-                    return float(clean)
-                except:
-                    return 0.0
-            return sorted(transacoes, key=lambda t: parse_valor(t.valor), reverse=True)
-        elif order_by == "situacao":
-            return sorted(transacoes, key=lambda t: t.situacao.lower())
-        elif order_by == "cartao":
-            return sorted(transacoes, key=lambda t: t.cartao.lower())
-        else:
-            # Se order_by inválido, retorna por data
-            return sorted(
-                transacoes,
-                key=lambda t: self._parse_date(t.data) or datetime.min,
-                reverse=True
-            )
+        return sort_items(transacoes, order_by, account_field="cartao")
     
     def get_all(
         self,
@@ -286,19 +372,17 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
         Returns:
             Lista de entidades TransacaoCredito
         """
-        raw_data = self._get_raw_data()
-        all_transacoes = [self._dict_to_entity(item) for item in raw_data]
-        return self._apply_filters(
-            all_transacoes,
+        criteria = FilterCriteria(
             tipo=tipo,
             categoria=categoria,
             data_inicio=data_inicio,
             data_fim=data_fim,
             mes=mes,
             situacao=situacao,
-            cartao=cartao,
-            order_by=order_by
+            conta=cartao
         )
+        filtered = self._get_ledger().filter(criteria)
+        return self._sort_transacoes(filtered, order_by)
     
     def get_paginated(
         self, 
@@ -311,7 +395,9 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
         mes: Optional[str] = None,
         situacao: Optional[str] = None,
         cartao: Optional[str] = None,
-        order_by: str = "data"
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Obtém transações paginadas com filtros opcionais
@@ -327,28 +413,52 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             situacao: Filtro por situação
             cartao: Filtro por cartão
             order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, cartao)
+            usar_cursor: Se True, pagina por cursor (ignora `page`)
+            cursor: Cursor retornado em `next_cursor` pela página anterior
             
         Returns:
             Dicionário com dados paginados e lista de entidades
         """
-        all_transacoes = self.get_all(
+        criteria = FilterCriteria(
             tipo=tipo,
             categoria=categoria,
             data_inicio=data_inicio,
             data_fim=data_fim,
             mes=mes,
             situacao=situacao,
-            cartao=cartao,
-            order_by=order_by
+            conta=cartao
         )
-        total = len(all_transacoes)
         
-        # Calcula índices para paginação
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
+        ledger = self._get_ledger()
+        items = ledger.items
         
-        # Obtém apenas os itens da página atual
-        page_transacoes = all_transacoes[start_idx:end_idx]
+        next_cursor = None
+        if usar_cursor or cursor:
+            # Paginação por cursor: continua a partir do último item entregue
+            total, start_idx, page_transacoes, next_cursor = self._pages.paginate_cursor(
+                items,
+                criteria,
+                order_by,
+                cursor,
+                page_size,
+                account_field="cartao",
+                ledger=ledger
+            )
+            page = start_idx // page_size + 1
+        else:
+            # Calcula índices para paginação
+            start_idx = (page - 1) * page_size
+            
+            # Obtém apenas os itens da página atual (top-k ou permutação ordenada em cache)
+            total, page_transacoes = self._pages.paginate(
+                items,
+                criteria,
+                order_by,
+                start_idx,
+                page_size,
+                account_field="cartao",
+                ledger=ledger
+            )
         
         # Calcula total de páginas
         total_pages = (total + page_size - 1) // page_size
@@ -358,9 +468,88 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages if total > 0 else 1,
-            "items": page_transacoes
+            "items": page_transacoes,
+            "next_cursor": next_cursor
         }
     
+    def _append_rows(self, linhas: List[List[str]]) -> Optional[Tuple[int, int]]:
+        """
+        Inclui linhas no final da aba com uma única chamada append_rows
+        
+        Returns:
+            Tupla (primeira_linha, ultima_linha) gravada, ou None se a resposta não informar
+        """
+        if not self.spreadsheet:
+            self._connect()
+        with sheets_lane(BULK):
+            response = self._write(lambda ws: ws.append_rows(linhas))
+        return parse_updated_rows(response)
+    
+    def _update_rows(self, linhas: Dict[int, List[str]]):
+        """
+        Grava várias linhas (colunas A:H) com uma única chamada batch_update
+        
+        Args:
+            linhas: Dicionário {row_index: valores}
+        """
+        if not self.spreadsheet:
+            self._connect()
+        data = [
+            {"range": f"A{row_index}:H{row_index}", "values": [valores]}
+            for row_index, valores in linhas.items()
+        ]
+        with sheets_lane(BULK):
+            self._write(lambda ws: ws.batch_update(data))
+    
+    def _delete_rows(self, row_indexes: List[int]):
+        """
+        Remove várias linhas com um único batchUpdate de deleteDimension
+        
+        Args:
+            row_indexes: Índices das linhas na planilha antes da remoção
+        """
+        if not self.spreadsheet:
+            self._connect()
+        
+        def delete_rows(ws):
+            body = {"requests": delete_rows_requests(ws.id, row_indexes)}
+            return ws.spreadsheet.batch_update(body)
+        
+        with sheets_lane(BULK):
+            self._write(delete_rows)
+    
+    def _write_behind_apply(
+        self,
+        build: Callable[[Ledger[TransacaoCredito]], List[PendingWrite]]
+    ) -> List[PendingWrite]:
+        """
+        Aplica alterações ao snapshot em memória e as enfileira para gravação posterior
+        
+        As alterações são registradas no journal antes de alterar o snapshot,
+        sob o lock do cache, para que a ordem da fila seja a ordem de aplicação.
+        
+        Args:
+            build: Recebe o extrato atual e retorna as alterações (com os row_index resolvidos)
+        
+        Returns:
+            Alterações enfileiradas
+        """
+        enqueued: List[PendingWrite] = []
+        
+        def patch(ledger):
+            writes = build(ledger)
+            self._write_behind.enqueue(writes)
+            for write in writes:
+                apply_write(ledger, write, self._row_to_entity)
+            enqueued.extend(writes)
+            return ledger
+        
+        # O snapshot precisa estar carregado (e, se restaurado de disco, revalidado
+        # antes de calcular posições); se for descartado no meio, tenta de novo
+        while not self._cache.update(patch, allow_stale=False):
+            self._cache.get(self._load_ledger, allow_stale=False)
+        return enqueued
+    
     def create(self, transacao: TransacaoCredito) -> TransacaoCredito:
         """
         Cria uma nova transação de crédito na planilha
@@ -375,28 +564,88 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             if not self.spreadsheet:
                 self._connect()
             
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
-            
             # Prepara linha para inserção
-            nova_linha = [
-                transacao.tipo,
-                transacao.descritivo,
-                transacao.valor,
-                transacao.data,
-                transacao.mes,
-                transacao.detalhes or "",
-                transacao.situacao,
-                transacao.cartao
-            ]
+            nova_linha = self._entity_to_row(transacao)
+            
+            if self._write_behind is not None:
+                [write] = self._write_behind_apply(
+                    lambda ledger: [PendingWrite(CREATE, _next_row(ledger), nova_linha)]
+                )
+                return replace(transacao, row_index=write.row_index)
             
             # Adiciona ao final da planilha
-            worksheet.append_row(nova_linha)
+            response = self._write(lambda ws: ws.append_row(nova_linha))
+            
+            # Atualiza o snapshot em cache com a linha atribuída pela planilha
+            rows = parse_updated_rows(response)
+            if rows:
+                transacao = replace(transacao, row_index=rows[0])
+                criada = self._row_to_entity(nova_linha, rows[0])
+                self._cache.update(lambda ledger: ledger.append(criada))
+            else:
+                self._cache.invalidate()
             
             return transacao
             
         except Exception as e:
             print(f"Erro ao criar transação de crédito: {e}")
-            raise Exception(f"Erro ao criar transação de crédito: {str(e)}")
+            raise with_context(e, "Erro ao criar transação de crédito")
+    
+    def create_many(self, transacoes: List[TransacaoCredito]) -> List[Dict[str, Any]]:
+        """
+        Cria várias transações com uma chamada append_rows por lote
+        
+        As linhas são enviadas em lotes de `sheets_batch_chunk_size`. Se um
+        lote falhar, os lotes seguintes não são enviados.
+        
+        Args:
+            transacoes: Entidades TransacaoCredito a serem criadas
+        
+        Returns:
+            Lista na ordem de entrada com {"transacao": entidade criada (com
+            row_index, se informado pela planilha) ou None, "erro": mensagem ou None}
+        """
+        if self._write_behind is not None:
+            linhas = [self._entity_to_row(t) for t in transacoes]
+            writes = self._write_behind_apply(
+                lambda ledger: [PendingWrite(CREATE, _next_row(ledger) + i, linha) for i, linha in enumerate(linhas)]
+            )
+            return [
+                {"transacao": replace(t, row_index=write.row_index), "erro": None}
+                for t, write in zip(transacoes, writes)
+            ]
+        
+        chunk_size = max(1, self.settings.sheets_batch_chunk_size)
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(transacoes), chunk_size):
+            chunk = transacoes[start:start + chunk_size]
+            linhas = [self._entity_to_row(t) for t in chunk]
+            
+            try:
+                rows = self._append_rows(linhas)
+            except Exception as e:
+                print(f"Erro ao criar transação de crédito em lote: {e}")
+                # Nada garante o estado da planilha após a falha: força nova leitura
+                self._cache.invalidate()
+                results.extend({"transacao": None, "erro": f"Erro ao criar transação de crédito: {str(e)}"} for _ in chunk)
+                skipped = len(transacoes) - start - len(chunk)
+                results.extend(
+                    {"transacao": None, "erro": "Não gravada: um lote anterior falhou"} for _ in range(skipped)
+                )
+                break
+            
+            # Atualiza o snapshot em cache com as linhas atribuídas pela planilha
+            if rows and rows[1] - rows[0] + 1 == len(chunk):
+                criadas = [self._row_to_entity(linha, rows[0] + i) for i, linha in enumerate(linhas)]
+                self._cache.update(lambda ledger: ledger.extend(criadas))
+                results.extend(
+                    {"transacao": replace(t, row_index=rows[0] + i), "erro": None} for i, t in enumerate(chunk)
+                )
+            else:
+                self._cache.invalidate()
+                results.extend({"transacao": t, "erro": None} for t in chunk)
+        
+        return results
     
     def update(self, row_index: int, transacao: TransacaoCredito) -> TransacaoCredito:
         """
@@ -407,7 +656,7 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             transacao: Entidade TransacaoCredito com os novos dados
             
         Returns:
-            Entidade TransacaoCredito atualizada
+            Entidade TransacaoCredito atualizada (com row_index)
         """
         try:
             if not self.spreadsheet:
@@ -416,7 +665,10 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             if row_index < 2:
                 raise ValueError("Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)")
             
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
+            if self._write_behind is not None:
+                valores = self._entity_to_row(transacao)
+                self._write_behind_apply(lambda ledger: [_pending_update(ledger, row_index, valores)])
+                return replace(transacao, row_index=row_index)
             
             # Prepara valores para atualização
             valores = [
@@ -432,13 +684,16 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             
             # Atualiza a linha inteira (colunas A até H)
             range_name = f'A{row_index}:H{row_index}'
-            worksheet.update(range_name, [valores])
+            self._write(lambda ws: ws.update(range_name, [valores]))
             
-            return transacao
+            atualizada = self._row_to_entity(valores, row_index)
+            self._cache.update(lambda ledger: ledger.replace(atualizada))
+            
+            return replace(transacao, row_index=row_index)
             
         except Exception as e:
             print(f"Erro ao atualizar transação de crédito: {e}")
-            raise Exception(f"Erro ao atualizar transação de crédito: {str(e)}")
+            raise with_context(e, "Erro ao atualizar transação de crédito")
     
     def delete(self, row_index: int) -> bool:
         """
@@ -457,11 +712,137 @@ class GoogleSheetsCreditoRepository(TransacaoCreditoRepositoryInterface):
             if row_index < 2:
                 raise ValueError("Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)")
             
-            worksheet = self.spreadsheet.worksheet(self.sheet_name)
-            worksheet.delete_rows(row_index)
+            if self._write_behind is not None:
+                self._write_behind_apply(lambda ledger: [PendingWrite(DELETE, row_index)])
+                return True
+            
+            self._write(lambda ws: ws.delete_rows(row_index))
+            
+            self._cache.update(lambda ledger: ledger.remove(row_index))
             
             return True
             
         except Exception as e:
             print(f"Erro ao deletar transação de crédito: {e}")
-            raise Exception(f"Erro ao deletar transação de crédito: {str(e)}")
+            raise with_context(e, "Erro ao deletar transação de crédito")
+    
+    def update_many(self, itens: List[Tuple[int, TransacaoCredito]]) -> List[TransacaoCredito]:
+        """
+        Atualiza várias transações com uma única chamada batch_update
+        
+        Linhas que não contêm uma transação no extrato em cache são ignoradas:
+        fora da grade, fariam o batch_update inteiro falhar.
+        
+        Args:
+            itens: Lista de tuplas (row_index, entidade com os novos dados)
+        
+        Returns:
+            Entidades atualizadas (com row_index), na ordem de entrada, sem as
+            linhas não encontradas
+        """
+        try:
+            if not self.spreadsheet:
+                self._connect()
+            
+            if any(row_index < 2 for row_index, _ in itens):
+                raise ValueError("Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)")
+            
+            linhas = {row_index: self._entity_to_row(transacao) for row_index, transacao in itens}
+            
+            if self._write_behind is not None:
+                enfileiradas = self._write_behind_apply(
+                    lambda ledger: [
+                        PendingWrite(UPDATE, row_index, valores)
+                        for row_index, valores in linhas.items() if ledger.has_row(row_index)
+                    ]
+                )
+                existentes = {write.row_index for write in enfileiradas}
+                return [replace(transacao, row_index=row_index) for row_index, transacao in itens if row_index in existentes]
+            
+            ledger = self._get_ledger()
+            linhas = {row_index: valores for row_index, valores in linhas.items() if ledger.has_row(row_index)}
+            if not linhas:
+                return []
+            
+            self._update_rows(linhas)
+            
+            atualizadas = [self._row_to_entity(valores, row_index) for row_index, valores in linhas.items()]
+            
+            def patch(ledger):
+                for transacao in atualizadas:
+                    if ledger.replace(transacao) is None:
+                        return None
+                return ledger
+            
+            self._cache.update(patch)
+            
+            return [replace(transacao, row_index=row_index) for row_index, transacao in itens if row_index in linhas]
+        
+        except Exception as e:
+            print(f"Erro ao atualizar transação de crédito em lote: {e}")
+            raise with_context(e, "Erro ao atualizar transação de crédito em lote")
+    
+    def delete_many(self, row_indexes: List[int]) -> List[int]:
+        """
+        Deleta várias transações com um único batchUpdate de deleteDimension
+        
+        As linhas são removidas de baixo para cima (ver `delete_rows_requests`),
+        então os índices informados se referem à planilha antes da remoção.
+        
+        Linhas que não contêm uma transação no extrato em cache são ignoradas:
+        fora da grade, fariam o batchUpdate inteiro falhar.
+        
+        Args:
+            row_indexes: Índices das linhas a remover
+        
+        Returns:
+            Índices removidos, em ordem decrescente (sem as linhas não encontradas)
+        """
+        try:
+            if not self.spreadsheet:
+                self._connect()
+            
+            if any(row_index < 2 for row_index in row_indexes):
+                raise ValueError("Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)")
+            
+            if self._write_behind is not None:
+                # De baixo para cima, cada índice continua válido após as remoções anteriores
+                enfileiradas = self._write_behind_apply(
+                    lambda ledger: [
+                        PendingWrite(DELETE, row_index)
+                        for row_index in sorted(set(row_indexes), reverse=True) if ledger.has_row(row_index)
+                    ]
+                )
+                return [write.row_index for write in enfileiradas]
+            
+            ledger = self._get_ledger()
+            existentes = sorted({row_index for row_index in row_indexes if ledger.has_row(row_index)}, reverse=True)
+            if not existentes:
+                return []
+            
+            self._delete_rows(existentes)
+            
+            self._cache.update(lambda ledger: ledger.remove_many(existentes))
+            
+            return existentes
+        
+        except Exception as e:
+            print(f"Erro ao deletar transação de crédito em lote: {e}")
+            raise with_context(e, "Erro ao deletar transação de crédito em lote")
+
+
+def _next_row(ledger: Ledger) -> int:
+    """Linha que o próximo append ocupará na planilha (a linha 1 é o cabeçalho)"""
+    return max(ledger.last_row, 1) + 1
+
+
+def _pending_update(ledger: Ledger, row_index: int, valores: List[str]) -> PendingWrite:
+    """
+    Monta a atualização pendente de uma linha existente
+    
+    Raises:
+        ValueError: Se a linha não contiver uma transação no snapshot
+    """
+    if not ledger.has_row(row_index):
+        raise ValueError(f"Linha {row_index} não encontrada")
+    return PendingWrite(UPDATE, row_index, valores)
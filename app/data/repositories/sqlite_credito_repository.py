@@ -0,0 +1,236 @@
+"""
+Repositório de transações de crédito com leituras servidas por um espelho SQLite local
+"""
+from typing import List, Dict, Any, Optional, Tuple
+from app.domain.entities import TransacaoCredito
+from app.data.repositories.transacao_credito_repository_interface import TransacaoCreditoRepositoryInterface
+from app.data.repositories.google_sheets_credito_repository import GoogleSheetsCreditoRepository
+from app.core.config import Settings
+from app.data.query.filters import FilterCriteria
+from app.data.sqlite_mirror import SqliteMirror
+
+
+class SqliteCreditoRepository(TransacaoCreditoRepositoryInterface):
+    """
+    Implementação do repositório de transações de crédito com leitura em SQLite
+    
+    Filtros, ordenação e paginação são consultas indexadas em um arquivo
+    SQLite local, sincronizado com a planilha em segundo plano. As escritas
+    continuam indo para o Google Sheets e, confirmadas, são aplicadas também
+    na cópia local.
+    """
+    
+    def __init__(self, settings: Settings, source: Optional[GoogleSheetsCreditoRepository] = None):
+        """
+        Inicializa o repositório e o espelho local
+        
+        Args:
+            settings: Configurações da aplicação
+            source: Repositório da planilha (criado a partir das configurações se omitido)
+        """
+        self.settings = settings
+        self.source = source or GoogleSheetsCreditoRepository(settings)
+        self.mirror = SqliteMirror(
+            settings.sqlite_path,
+            "transacoes_credito",
+            TransacaoCredito,
+            "cartao",
+            loader=self.source.load_snapshot,
+            change_token=self.source.change_token if settings.cache_revision_check else None,
+            refresh_interval_seconds=settings.sqlite_refresh_interval_seconds
+        )
+        self.mirror.start()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do cache da planilha e do espelho local"""
+        return {**self.source.cache_stats(), "sqlite": self.mirror.stats()}
+    
+    def get_all(
+        self,
+        tipo: Optional[str] = None,
+        categoria: Optional[str] = None,
+        data_inicio: Optional[str] = None,
+        data_fim: Optional[str] = None,
+        mes: Optional[str] = None,
+        situacao: Optional[str] = None,
+        cartao: Optional[str] = None,
+        order_by: str = "data"
+    ) -> List[TransacaoCredito]:
+        """
+        Obtém todas as transações com filtros opcionais
+        
+        Args:
+            tipo: Filtro por tipo (RECEITA ou DESPESA)
+            categoria: Filtro por categoria/descritivo
+            data_inicio: Data inicial (DD/MM/YYYY)
+            data_fim: Data final (DD/MM/YYYY)
+            mes: Filtro por mês
+            situacao: Filtro por situação
+            cartao: Filtro por cartão
+            order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, cartao)
+        
+        Returns:
+            Lista de entidades TransacaoCredito
+        """
+        criteria = FilterCriteria(
+            tipo=tipo,
+            categoria=categoria,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            mes=mes,
+            situacao=situacao,
+            conta=cartao
+        )
+        return self.mirror.query(criteria, order_by)
+    
+    def get_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        tipo: Optional[str] = None,
+        categoria: Optional[str] = None,
+        data_inicio: Optional[str] = None,
+        data_fim: Optional[str] = None,
+        mes: Optional[str] = None,
+        situacao: Optional[str] = None,
+        cartao: Optional[str] = None,
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtém transações paginadas com filtros opcionais
+        
+        Args:
+            page: Número da página (começa em 1)
+            page_size: Quantidade de itens por página
+            tipo: Filtro por tipo (RECEITA ou DESPESA)
+            categoria: Filtro por categoria/descritivo
+            data_inicio: Data inicial (DD/MM/YYYY)
+            data_fim: Data final (DD/MM/YYYY)
+            mes: Filtro por mês
+            situacao: Filtro por situação
+            cartao: Filtro por cartão
+            order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, cartao)
+            usar_cursor: Se True, pagina por cursor (ignora `page`)
+            cursor: Cursor retornado em `next_cursor` pela página anterior
+        
+        Returns:
+            Dicionário com dados paginados e lista de entidades
+        """
+        criteria = FilterCriteria(
+            tipo=tipo,
+            categoria=categoria,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            mes=mes,
+            situacao=situacao,
+            conta=cartao
+        )
+        
+        next_cursor = None
+        if usar_cursor or cursor:
+            total, start_idx, page_transacoes, next_cursor = self.mirror.paginate_cursor(
+                criteria, order_by, cursor, page_size
+            )
+            page = start_idx // page_size + 1
+        else:
+            start_idx = (page - 1) * page_size
+            total, page_transacoes = self.mirror.paginate(criteria, order_by, start_idx, page_size)
+        
+        total_pages = (total + page_size - 1) // page_size
+        
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages if total > 0 else 1,
+            "items": page_transacoes,
+            "next_cursor": next_cursor
+        }
+    
+    def create(self, transacao: TransacaoCredito) -> TransacaoCredito:
+        """
+        Cria uma nova transação na planilha e na cópia local
+        
+        Args:
+            transacao: Entidade TransacaoCredito
+        
+        Returns:
+            Transação criada com row_index
+        """
+        created = self.source.create(transacao)
+        self.mirror.upsert([created])
+        return created
+    
+    def create_many(self, transacoes: List[TransacaoCredito]) -> List[Dict[str, Any]]:
+        """
+        Cria várias transações na planilha e na cópia local
+        
+        Args:
+            transacoes: Entidades TransacaoCredito na ordem de gravação
+        
+        Returns:
+            Lista na ordem de entrada com {"transacao": entidade criada ou None, "erro": mensagem ou None}
+        """
+        results = self.source.create_many(transacoes)
+        self.mirror.upsert([r["transacao"] for r in results if r["transacao"] is not None])
+        return results
+    
+    def update(self, row_index: int, transacao: TransacaoCredito) -> TransacaoCredito:
+        """
+        Atualiza uma transação na planilha e na cópia local
+        
+        Args:
+            row_index: Índice da linha
+            transacao: Entidade com os novos dados
+        
+        Returns:
+            Transação atualizada
+        """
+        updated = self.source.update(row_index, transacao)
+        self.mirror.upsert([updated])
+        return updated
+    
+    def delete(self, row_index: int) -> bool:
+        """
+        Deleta uma transação da planilha e da cópia local
+        
+        Args:
+            row_index: Índice da linha
+        
+        Returns:
+            True se deletado com sucesso
+        """
+        deleted = self.source.delete(row_index)
+        if deleted:
+            self.mirror.remove([row_index])
+        return deleted
+    
+    def update_many(self, itens: List[Tuple[int, TransacaoCredito]]) -> List[TransacaoCredito]:
+        """
+        Atualiza várias transações na planilha e na cópia local
+        
+        Args:
+            itens: Pares (row_index, entidade com os novos dados)
+        
+        Returns:
+            Transações atualizadas, na ordem de entrada
+        """
+        updated = self.source.update_many(itens)
+        self.mirror.upsert(updated)
+        return updated
+    
+    def delete_many(self, row_indexes: List[int]) -> List[int]:
+        """
+        Deleta várias transações da planilha e da cópia local
+        
+        Args:
+            row_indexes: Índices das linhas (antes da exclusão)
+        
+        Returns:
+            Índices das linhas deletadas
+        """
+        deleted = self.source.delete_many(row_indexes)
+        self.mirror.remove(deleted)
+        return deleted
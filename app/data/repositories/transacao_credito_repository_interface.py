@@ -2,7 +2,7 @@
 Interface do repositório de transações de crédito
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from app.domain.entities import TransacaoCredito
 
 
@@ -38,7 +38,9 @@ class TransacaoCreditoRepositoryInterface(ABC):
         mes: Optional[str] = None,
         situacao: Optional[str] = None,
         cartao: Optional[str] = None,
-        order_by: str = "data"
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Obtém transações de crédito de forma paginada com filtros opcionais"""
         pass
@@ -48,6 +50,16 @@ class TransacaoCreditoRepositoryInterface(ABC):
         """Cria uma nova transação de crédito"""
         pass
     
+    @abstractmethod
+    def create_many(self, transacoes: List[TransacaoCredito]) -> List[Dict[str, Any]]:
+        """
+        Cria várias transações em uma única operação (em lotes)
+        
+        Returns:
+            Lista na ordem de entrada com {"transacao": entidade criada ou None, "erro": mensagem ou None}
+        """
+        pass
+    
     @abstractmethod
     def update(self, row_index: int, transacao: TransacaoCredito) -> TransacaoCredito:
         """Atualiza uma transação de crédito existente pelo índice da linha"""
@@ -57,3 +69,13 @@ class TransacaoCreditoRepositoryInterface(ABC):
     def delete(self, row_index: int) -> bool:
         """Deleta uma transação de crédito pelo índice da linha"""
         pass
+    
+    @abstractmethod
+    def update_many(self, itens: List[Tuple[int, TransacaoCredito]]) -> List[TransacaoCredito]:
+        """Atualiza várias transações (row_index, entidade) em uma única operação; retorna só as linhas existentes"""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, row_indexes: List[int]) -> List[int]:
+        """Deleta várias transações pelos índices das linhas em uma única operação; retorna os índices removidos"""
+        pass
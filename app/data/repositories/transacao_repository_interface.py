@@ -2,7 +2,7 @@
 Interface do repositório de transações
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from app.domain.entities import Transacao
 
 
@@ -38,7 +38,9 @@ class TransacaoRepositoryInterface(ABC):
         mes: Optional[str] = None,
         situacao: Optional[str] = None,
         conta: Optional[str] = None,
-        order_by: str = "data"
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Obtém transações paginadas com filtros opcionais"""
         pass
@@ -48,6 +50,16 @@ class TransacaoRepositoryInterface(ABC):
         """Cria uma nova transação"""
         pass
     
+    @abstractmethod
+    def create_many(self, transacoes: List[Transacao]) -> List[Dict[str, Any]]:
+        """
+        Cria várias transações em uma única operação (em lotes)
+        
+        Returns:
+            Lista na ordem de entrada com {"transacao": entidade criada ou None, "erro": mensagem ou None}
+        """
+        pass
+    
     @abstractmethod
     def update(self, row_index: int, transacao: Transacao) -> Transacao:
         """Atualiza uma transação existente pelo índice da linha"""
@@ -57,3 +69,23 @@ class TransacaoRepositoryInterface(ABC):
     def delete(self, row_index: int) -> bool:
         """Deleta uma transação pelo índice da linha"""
         pass
+    
+    @abstractmethod
+    def update_many(self, itens: List[Tuple[int, Transacao]]) -> List[Transacao]:
+        """Atualiza várias transações (row_index, entidade) em uma única operação; retorna só as linhas existentes"""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, row_indexes: List[int]) -> List[int]:
+        """Deleta várias transações pelos índices das linhas em uma única operação; retorna os índices removidos"""
+        pass
+    
+    @abstractmethod
+    def health_check(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Verifica a conexão com a fonte de dados
+        
+        Args:
+            deep: Se True, também lê todos os registros da fonte (sem cache)
+        """
+        pass
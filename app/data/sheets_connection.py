@@ -0,0 +1,322 @@
+"""
+Conexão compartilhada com o Google Sheets
+"""
+import datetime
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import gspread
+from google.auth.transport.requests import Request
+from oauth2client.service_account import ServiceAccountCredentials
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import Settings
+from app.core.metrics import get_metrics_registry
+from app.core.single_flight import SingleFlight
+from app.data.drive_revision import DriveRevisionToken
+from app.data.fake_sheets import build_fake_spreadsheet
+from app.data.instrumented_sheets import InstrumentedSpreadsheet, observe_call
+from app.data.sheets_resilience import CircuitBreaker, ResilientSheetsCaller
+from app.data.sheets_scheduler import BACKGROUND, BULK, INTERACTIVE, READ, SheetsScheduler
+from app.data.worksheet_registry import WorksheetRegistry
+
+
+T = TypeVar("T")
+
+SCOPES = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+class SheetsConnectionManager:
+    """
+    Cliente autorizado único do processo para a planilha
+    
+    Todos os repositórios usam a mesma credencial, o mesmo cliente gspread
+    (uma sessão HTTP com conexões keep-alive reaproveitadas), a mesma
+    planilha aberta (uma única busca de metadados), o mesmo registro de abas
+    e o mesmo token de revisão do Drive. O token de acesso é renovado em
+    segundo plano antes de expirar, fora do caminho das requisições.
+    """
+    
+    def __init__(self, settings: Settings, refresh_margin_seconds: float = 300.0):
+        """
+        Inicializa o gerenciador (a conexão é aberta no primeiro uso)
+        
+        Args:
+            settings: Configurações da aplicação
+            refresh_margin_seconds: Antecedência da renovação do token de acesso
+        """
+        self.settings = settings
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        # Sessão própria para o endpoint de token (a sessão da API é autenticada por ele)
+        self._token_session = requests.Session()
+        self._client: Optional[gspread.Client] = None
+        self._spreadsheet: Optional[InstrumentedSpreadsheet] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._last_refresh_error: Optional[str] = None
+        # Todas as chamadas à API de planilhas passam pelo agendador de cota,
+        # pelas retentativas e pelo circuit breaker
+        self.scheduler = SheetsScheduler(
+            settings.sheets_read_quota_per_minute,
+            settings.sheets_write_quota_per_minute,
+            timeouts={
+                INTERACTIVE: settings.sheets_quota_timeout_seconds,
+                BACKGROUND: settings.sheets_background_quota_timeout_seconds,
+                BULK: settings.sheets_background_quota_timeout_seconds
+            }
+        )
+        self.caller = ResilientSheetsCaller(
+            self.scheduler,
+            CircuitBreaker(
+                "sheets",
+                settings.sheets_circuit_failure_threshold,
+                settings.sheets_circuit_reset_seconds
+            ),
+            max_attempts=settings.sheets_retry_attempts,
+            base_delay_seconds=settings.sheets_retry_base_delay_seconds,
+            max_delay_seconds=settings.sheets_retry_max_delay_seconds
+        )
+        self.worksheets = WorksheetRegistry(self.spreadsheet, self.caller)
+        self.revision = DriveRevisionToken(self.spreadsheet, self.caller)
+        # Leituras concorrentes da mesma aba compartilham uma única chamada (chave: nome da aba)
+        self.reads = SingleFlight("sheets_reads")
+        
+        registry = get_metrics_registry()
+        self._connections = registry.counter(
+            "sheets_connections_opened_total",
+            "Autorizações do cliente e aberturas da planilha"
+        )
+        self._reuses = registry.counter(
+            "sheets_connection_reuses_total",
+            "Usos da conexão já aberta (sem nova autorização nem busca de metadados)"
+        )
+        self._token_refreshes = registry.counter(
+            "sheets_token_refreshes_total",
+            "Renovações antecipadas do token de acesso"
+        )
+        self._token_refresh_failures = registry.counter(
+            "sheets_token_refresh_failures_total",
+            "Renovações do token de acesso que falharam"
+        )
+        registry.gauge(
+            "sheets_http_connections",
+            "Conexões HTTP abertas pela sessão compartilhada desde o início",
+            reader=lambda: self._pool_stats()["connections"]
+        )
+        registry.gauge(
+            "sheets_http_requests",
+            "Requisições HTTP feitas pela sessão compartilhada desde o início",
+            reader=lambda: self._pool_stats()["requests"]
+        )
+    
+    def _credentials(self) -> ServiceAccountCredentials:
+        """Monta a credencial da conta de serviço a partir das configurações"""
+        return ServiceAccountCredentials.from_json_keyfile_dict(
+            {
+                "type": "service_account",
+                "project_id": "controle-financeiro-450717",
+                "private_key_id": "dummy_key_id",  # Não é necessário para autenticação
+                "private_key": self.settings.google_private_key.replace('\\n', '\n'),
+                "client_email": self.settings.google_service_account_email,
+                "client_id": "",
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+                "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{self.settings.google_service_account_email.replace('@', '%40')}"
+            },
+            SCOPES
+        )
+    
+    def client(self) -> gspread.Client:
+        """
+        Retorna o cliente autorizado, criando-o no primeiro uso
+        
+        Returns:
+            gspread.Client com a sessão HTTP compartilhada
+        """
+        with self._lock:
+            if self._client is None:
+                client = gspread.authorize(self._credentials())
+                # Pool do tamanho do executor: cada thread reaproveita uma conexão keep-alive
+                pool_size = max(self.settings.sheets_max_workers, 1)
+                self._adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+                client.http_client.session.mount("https://", self._adapter)
+                self._client = client
+                self._start_refresher()
+            return self._client
+    
+    def spreadsheet(self) -> gspread.Spreadsheet:
+        """
+        Retorna a planilha aberta, abrindo-a no primeiro uso
+        
+        Returns:
+            gspread.Spreadsheet (instrumentada) compartilhada por todos os repositórios
+        
+        Raises:
+            SheetsError: Se a abertura da planilha falhar (classificada)
+            Exception: Se a autorização falhar
+        """
+        with self._lock:
+            if self._spreadsheet is not None:
+                self._reuses.inc()
+                return self._spreadsheet
+            if self.settings.sheets_backend == "fake":
+                # Planilha em memória: sem credencial, cliente nem renovação de token
+                opener = lambda: build_fake_spreadsheet(self.settings)
+            else:
+                client = self.client()
+                opener = lambda: client.open_by_key(self.settings.google_sheets_id)
+            spreadsheet = self.caller.run(READ, lambda: observe_call("open_by_key", opener))
+            # As chamadas feitas pela planilha e pelas suas abas são medidas por operação
+            self._spreadsheet = InstrumentedSpreadsheet(spreadsheet)
+            self._connections.inc()
+            return self._spreadsheet
+    
+    def run(self, title: str, operation: Callable[[Any], T], write: bool = False) -> T:
+        """
+        Executa uma operação sobre uma aba (handle resolvido uma única vez)
+        
+        Args:
+            title: Nome da aba
+            operation: Função que recebe o Worksheet e executa a chamada à API
+            write: Se True, a chamada consome a cota de escrita
+        
+        Returns:
+            Resultado da operação
+        """
+        return self.worksheets.run(title, operation, write=write)
+    
+    def read(self, title: str, loader: Callable[[], T]) -> T:
+        """
+        Executa a leitura de uma aba, compartilhando-a com leituras concorrentes
+        
+        Chamadas simultâneas para a mesma aba aguardam a leitura já em
+        andamento e recebem o mesmo resultado (já convertido pelo `loader`),
+        que portanto não deve ser alterado por quem o recebe.
+        
+        Args:
+            title: Nome da aba (chave do compartilhamento)
+            loader: Função que lê a aba e converte os dados
+        
+        Returns:
+            Resultado da leitura
+        """
+        return self.reads.do(title, loader)
+    
+    def written(self, title: str):
+        """
+        Registra uma escrita na aba: leituras iniciadas depois não reaproveitam as anteriores
+        
+        Args:
+            title: Nome da aba
+        """
+        self.reads.forget(title)
+    
+    # ==================== TOKEN DE ACESSO ====================
+    
+    def _auth(self) -> Any:
+        """Credencial google-auth usada pela sessão (convertida pelo gspread)"""
+        return getattr(self._client.http_client, "auth", None) if self._client else None
+    
+    def _seconds_to_expiry(self) -> Optional[float]:
+        """Segundos até o token de acesso expirar (None se ainda não há token)"""
+        auth = self._auth()
+        expiry = getattr(auth, "expiry", None)
+        if not getattr(auth, "token", None) or expiry is None:
+            return None
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds()
+    
+    def refresh_token(self, force: bool = False) -> bool:
+        """
+        Renova o token de acesso se estiver perto de expirar
+        
+        Args:
+            force: Se True, renova mesmo que o token ainda seja válido
+        
+        Returns:
+            True se o token foi renovado
+        """
+        with self._refresh_lock:
+            auth = self._auth()
+            if auth is None:
+                return False
+            remaining = self._seconds_to_expiry()
+            if not force and remaining is not None and remaining > self.refresh_margin_seconds:
+                return False
+            try:
+                auth.refresh(Request(session=self._token_session))
+            except Exception as e:
+                self._token_refresh_failures.inc()
+                self._last_refresh_error = str(e)
+                raise
+            self._token_refreshes.inc()
+            self._last_refresh_error = None
+            return True
+    
+    def _start_refresher(self):
+        """Inicia a thread que renova o token antes de expirar (uma por processo)"""
+        if self._refresher is not None:
+            return
+        self._refresher = threading.Thread(target=self._refresh_loop, name="sheets-token-refresher", daemon=True)
+        self._refresher.start()
+    
+    def _refresh_loop(self):
+        """Laço da thread: dorme até a margem de renovação e renova o token"""
+        while True:
+            remaining = self._seconds_to_expiry()
+            if remaining is None:
+                # Sem token ainda: a primeira requisição obtém um; verifica depois
+                time.sleep(60)
+                continue
+            wait = remaining - self.refresh_margin_seconds
+            if wait > 0:
+                time.sleep(min(wait, 600))
+                continue
+            try:
+                self.refresh_token()
+            except Exception as e:
+                print(f"Erro ao renovar o token do Google Sheets: {e}")
+                time.sleep(30)
+    
+    # ==================== ESTATÍSTICAS ====================
+    
+    def _pool_stats(self) -> Dict[str, int]:
+        """Conexões abertas e requisições feitas pelos pools da sessão"""
+        connections = request_count = 0
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+                    request_count += pool.num_requests
+        return {"connections": connections, "requests": request_count}
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas da conexão compartilhada"""
+        pool = self._pool_stats()
+        return {
+            "backend": self.settings.sheets_backend,
+            "connected": self._spreadsheet is not None,
+            "token_valid": getattr(self._auth(), "valid", None),
+            "connections_opened": int(self._connections.value),
+            "connection_reuses": int(self._reuses.value),
+            "token_refreshes": int(self._token_refreshes.value),
+            "token_refresh_failures": int(self._token_refresh_failures.value),
+            "token_expires_in_seconds": self._seconds_to_expiry(),
+            "last_token_refresh_error": self._last_refresh_error,
+            "http_connections": pool["connections"],
+            "http_requests": pool["requests"],
+            "reads": self.reads.stats(),
+            "quota": self.scheduler.stats(),
+            "resilience": self.caller.stats(),
+            "worksheets": self.worksheets.stats()
+        }
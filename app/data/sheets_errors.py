@@ -0,0 +1,127 @@
+"""
+Classificação dos erros das chamadas ao Google Sheets
+"""
+from typing import Optional
+
+import requests
+from google.auth.exceptions import RefreshError, TransportError
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+
+
+class SheetsError(Exception):
+    """
+    Falha de uma chamada ao Google Sheets, já classificada
+    
+    Attributes:
+        retry_after: Segundos sugeridos antes de tentar novamente (None se não se aplica)
+    """
+    
+    # Indica falha do serviço (conta para o circuit breaker e permite servir o último snapshot)
+    upstream_failure = True
+    # Tipo usado nas métricas
+    kind = "error"
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SheetsQuotaError(SheetsError):
+    """Cota da API esgotada (429 do Google ou espera máxima no agendador)"""
+    kind = "quota"
+
+
+class SheetsTransientError(SheetsError):
+    """Falha temporária: 5xx, timeout ou erro de conexão"""
+    kind = "transient"
+
+
+class SheetsAuthError(SheetsError):
+    """Credencial inválida, token não renovado ou sem permissão na planilha"""
+    kind = "auth"
+
+
+class SheetsNotFoundError(SheetsError):
+    """Planilha, aba ou intervalo inexistente"""
+    kind = "not_found"
+    upstream_failure = False
+
+
+class SheetsUnavailableError(SheetsError):
+    """Chamada recusada sem ir ao Google: o circuit breaker está aberto"""
+    kind = "circuit_open"
+
+
+_TRANSIENT_STATUS = {500, 502, 503, 504}
+_AUTH_STATUS = {401, 403}
+
+
+def _status_code(error: APIError) -> Optional[int]:
+    """Código HTTP de um APIError do gspread"""
+    code = getattr(error, "code", None)
+    if isinstance(code, int) and code > 0:
+        return code
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after(error: APIError) -> Optional[float]:
+    """Valor do cabeçalho Retry-After da resposta, se houver"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: BaseException) -> Optional[SheetsError]:
+    """
+    Converte uma exceção de uma chamada ao Google Sheets em um SheetsError
+    
+    Args:
+        error: Exceção lançada pelo gspread, google-auth ou requests
+    
+    Returns:
+        SheetsError correspondente, ou None se o erro não vier da API
+        (ex: ValueError de validação, que deve seguir como está)
+    """
+    if isinstance(error, SheetsError):
+        return error
+    if isinstance(error, (WorksheetNotFound, SpreadsheetNotFound)):
+        return SheetsNotFoundError(f"Não encontrado no Google Sheets: {error}")
+    if isinstance(error, APIError):
+        status = _status_code(error)
+        if status == 429:
+            return SheetsQuotaError(f"Cota do Google Sheets esgotada: {error}", _retry_after(error))
+        if status in _TRANSIENT_STATUS:
+            return SheetsTransientError(f"Google Sheets indisponível ({status}): {error}", _retry_after(error))
+        if status in _AUTH_STATUS:
+            return SheetsAuthError(f"Acesso negado pelo Google Sheets ({status}): {error}")
+        if status == 404:
+            return SheetsNotFoundError(f"Não encontrado no Google Sheets: {error}")
+        return None
+    if isinstance(error, RefreshError):
+        return SheetsAuthError(f"Falha ao renovar o token de acesso: {error}")
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, TransportError)):
+        return SheetsTransientError(f"Falha de conexão com o Google Sheets: {error}")
+    return None
+
+
+def with_context(error: BaseException, message: str) -> Exception:
+    """
+    Acrescenta contexto à mensagem de um erro sem perder a sua classificação
+    
+    Args:
+        error: Exceção original
+        message: Contexto (ex: "Erro ao criar transação")
+    
+    Returns:
+        Exceção do mesmo tipo de SheetsError (ou Exception genérica se o erro
+        não for do Google Sheets) com a mensagem "contexto: erro original"
+    """
+    classified = classify_error(error)
+    if classified is None:
+        return Exception(f"{message}: {str(error)}")
+    return type(classified)(f"{message}: {str(classified)}", classified.retry_after)
@@ -0,0 +1,306 @@
+"""
+Retentativas com backoff e circuit breaker para as chamadas ao Google Sheets
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_errors import (
+    SheetsError, SheetsQuotaError, SheetsTransientError, SheetsUnavailableError, classify_error
+)
+from app.data.sheets_scheduler import WRITE, SheetsScheduler
+
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Tipos de erro contados nas métricas
+_ERROR_KINDS = ("quota", "transient", "auth", "not_found", "circuit_open", "error")
+
+
+class CircuitBreaker:
+    """
+    Interrompe as chamadas ao Google Sheets após falhas consecutivas
+    
+    Fechado: as chamadas passam. Após `failure_threshold` falhas seguidas do
+    serviço (5xx, 429, timeout, autenticação) o circuito abre e as chamadas
+    falham na hora com `SheetsUnavailableError`, sem ocupar threads nem cota.
+    Passado `reset_timeout_seconds`, uma única chamada de teste é liberada
+    (meio aberto): se der certo o circuito fecha, senão abre novamente.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o circuit breaker
+        
+        Args:
+            name: Nome (usado nas métricas)
+            failure_threshold: Falhas consecutivas que abrem o circuito (0 desabilita)
+            reset_timeout_seconds: Tempo aberto antes da chamada de teste
+            clock: Função que retorna o tempo atual (injetável para testes)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        
+        registry = get_metrics_registry()
+        labels = {"circuit": name}
+        registry.gauge(
+            "sheets_circuit_state",
+            "Estado do circuit breaker (0 fechado, 1 meio aberto, 2 aberto)",
+            labels,
+            reader=lambda: _STATE_VALUES[self.state]
+        )
+        self._opened = registry.counter("sheets_circuit_opened_total", "Aberturas do circuit breaker", labels)
+        self._rejected = registry.counter(
+            "sheets_circuit_rejected_total",
+            "Chamadas recusadas com o circuito aberto",
+            labels
+        )
+        self._open_seconds = registry.counter(
+            "sheets_circuit_open_seconds_total",
+            "Tempo total com o circuito aberto ou meio aberto",
+            labels
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """Indica se o circuit breaker está habilitado"""
+        return self.failure_threshold > 0
+    
+    @property
+    def state(self) -> str:
+        """Estado atual (o circuito aberto passa a meio aberto após o tempo de espera)"""
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        """Estado atual (chamado com o lock)"""
+        if (
+            self._state == OPEN
+            and self._opened_at is not None
+            and self._clock() - self._opened_at >= self.reset_timeout_seconds
+        ):
+            self._state = HALF_OPEN
+        return self._state
+    
+    def before_call(self):
+        """
+        Verifica se a chamada pode ser feita
+        
+        Raises:
+            SheetsUnavailableError: Se o circuito estiver aberto (ou meio aberto com o teste em andamento)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._rejected.inc()
+            remaining = max(0.0, self.reset_timeout_seconds - (self._clock() - (self._opened_at or 0.0)))
+        raise SheetsUnavailableError(
+            "Google Sheets indisponível: chamadas suspensas após falhas consecutivas",
+            retry_after=remaining or 1.0
+        )
+    
+    def release_probe(self):
+        """Libera a chamada de teste que não chegou a ser feita (ex: sem cota)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_success(self):
+        """Registra uma chamada que chegou ao serviço e foi respondida"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._state != CLOSED and self._opened_at is not None:
+                self._open_seconds.inc(self._clock() - self._opened_at)
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        """Registra uma falha do serviço"""
+        if not self.enabled:
+            return
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                now = self._clock()
+                if state == CLOSED:
+                    self._opened.inc()
+                elif self._opened_at is not None:
+                    self._open_seconds.inc(now - self._opened_at)
+                self._state = OPEN
+                self._opened_at = now
+                self._probe_in_flight = False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna o estado do circuit breaker"""
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "opened": int(self._opened.value),
+                "rejected": int(self._rejected.value)
+            }
+
+
+class ResilientSheetsCaller:
+    """
+    Executa as chamadas ao Google Sheets com cota, retentativas e circuit breaker
+    
+    Cada tentativa aguarda a cota no agendador, passa pelo circuit breaker e,
+    se falhar, tem o erro classificado (ver `classify_error`). Leituras são
+    repetidas em falhas temporárias e de cota; escritas só em falhas de cota
+    (um 429 garante que nada foi gravado, enquanto um 5xx ou timeout pode ter
+    gravado e a repetição duplicaria a linha). A espera entre tentativas é
+    exponencial com jitter completo, ou o Retry-After informado pela API.
+    """
+    
+    def __init__(
+        self,
+        scheduler: SheetsScheduler,
+        breaker: CircuitBreaker,
+        max_attempts: int = 3,
+        base_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 8.0,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random
+    ):
+        """
+        Inicializa o executor
+        
+        Args:
+            scheduler: Agendador de cota
+            breaker: Circuit breaker do serviço
+            max_attempts: Tentativas por chamada (1 = sem retentativa)
+            base_delay_seconds: Espera base antes da segunda tentativa
+            max_delay_seconds: Espera máxima entre tentativas
+            sleep: Função de espera (injetável para testes)
+            jitter: Função que retorna um número em [0, 1) (injetável para testes)
+        """
+        self.scheduler = scheduler
+        self.breaker = breaker
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._sleep = sleep
+        self._jitter = jitter
+        
+        registry = get_metrics_registry()
+        self._calls = registry.counter("sheets_calls_total", "Chamadas ao Google Sheets concluídas com sucesso")
+        self._call_seconds = registry.counter(
+            "sheets_call_seconds_total",
+            "Tempo total das chamadas ao Google Sheets (sem a espera por cota)"
+        )
+        self._retries = registry.counter("sheets_retries_total", "Novas tentativas após falhas")
+        self._errors = {
+            kind: registry.counter("sheets_errors_total", "Falhas das chamadas ao Google Sheets", {"type": kind})
+            for kind in _ERROR_KINDS
+        }
+    
+    def _delay(self, attempt: int, error: SheetsError) -> float:
+        """Espera antes da próxima tentativa (attempt = tentativas já feitas)"""
+        if error.retry_after is not None:
+            return min(error.retry_after, self.max_delay_seconds)
+        return self._jitter() * min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempt - 1)))
+    
+    @staticmethod
+    def _retryable(error: SheetsError, kind: str) -> bool:
+        """Indica se a falha pode ser repetida com segurança"""
+        if isinstance(error, SheetsQuotaError):
+            return True
+        return kind != WRITE and isinstance(error, SheetsTransientError)
+    
+    def run(self, kind: str, operation: Callable[[], T], quota: bool = True) -> T:
+        """
+        Executa uma chamada ao Google Sheets
+        
+        Args:
+            kind: READ ou WRITE
+            operation: Função que faz a chamada à API
+            quota: Se False, a chamada não consome a cota do Google Sheets
+                (chamadas a outra API da mesma conta, como o Drive)
+        
+        Returns:
+            Resultado da chamada
+        
+        Raises:
+            SheetsError: Falha classificada, após esgotar as tentativas
+            Exception: Erros que não vêm da API, sem alteração
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.before_call()
+            except SheetsUnavailableError as e:
+                self._errors[e.kind].inc()
+                raise
+            try:
+                if quota:
+                    self.scheduler.acquire(kind)
+            except SheetsError as e:
+                # Prazo de espera por cota esgotado localmente: o serviço não foi chamado
+                self.breaker.release_probe()
+                self._errors[e.kind].inc()
+                raise
+            started = time.perf_counter()
+            try:
+                result = operation()
+            except Exception as e:
+                error = classify_error(e)
+                if error is None:
+                    # Resposta da API a um pedido inválido: o serviço está de pé
+                    self.breaker.record_success()
+                    self._errors["error"].inc()
+                    raise
+                if error.upstream_failure:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+                self._errors[error.kind].inc()
+                if attempt >= self.max_attempts or not self._retryable(error, kind):
+                    raise error from e
+                self._retries.inc()
+                self._sleep(self._delay(attempt, error))
+                continue
+            self.breaker.record_success()
+            self._calls.inc()
+            self._call_seconds.inc(time.perf_counter() - started)
+            return result
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas das chamadas e do circuit breaker"""
+        return {
+            "circuit": self.breaker.stats(),
+            "calls": int(self._calls.value),
+            "retries": int(self._retries.value),
+            "errors": {kind: int(counter.value) for kind, counter in self._errors.items() if counter.value}
+        }
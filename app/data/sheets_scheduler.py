@@ -0,0 +1,301 @@
+"""
+Agendamento das chamadas ao Google Sheets respeitando as cotas por minuto
+"""
+import contextvars
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_errors import SheetsQuotaError
+
+
+T = TypeVar("T")
+
+# Tipos de chamada: cada um tem a sua cota na API do Google Sheets
+READ = "read"
+WRITE = "write"
+
+# Prioridades (menor = atendida primeiro quando há fila)
+INTERACTIVE = 0  # requisições de usuários
+BACKGROUND = 1   # revalidação de caches e sincronização do espelho local
+BULK = 2         # gravações em lote e write-behind
+
+LANE_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background", BULK: "bulk"}
+
+_current_lane: contextvars.ContextVar[int] = contextvars.ContextVar("sheets_lane", default=INTERACTIVE)
+
+
+@contextmanager
+def sheets_lane(lane: int) -> Iterator[None]:
+    """
+    Define a prioridade das chamadas ao Google Sheets feitas dentro do bloco
+    
+    Args:
+        lane: INTERACTIVE, BACKGROUND ou BULK
+    """
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def in_lane(lane: int, func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Envolve uma função para que as suas chamadas ao Google Sheets usem a prioridade informada
+    
+    Útil como `target` de threads em segundo plano.
+    
+    Args:
+        lane: INTERACTIVE, BACKGROUND ou BULK
+        func: Função a envolver
+    
+    Returns:
+        Função que executa `func` dentro de `sheets_lane(lane)`
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with sheets_lane(lane):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def current_lane() -> int:
+    """Prioridade das chamadas feitas no contexto atual (INTERACTIVE por padrão)"""
+    return _current_lane.get()
+
+
+class QuotaExceededError(SheetsQuotaError):
+    """A chamada não obteve cota da API dentro do prazo de espera"""
+
+
+class TokenBucket:
+    """
+    Balde de fichas com reposição contínua
+    
+    Começa cheio (permite uma rajada do tamanho da cota) e repõe
+    `per_minute` fichas por minuto. Não é thread-safe: o acesso é protegido
+    pelo `SheetsScheduler`.
+    """
+    
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa o balde
+        
+        Args:
+            per_minute: Fichas repostas por minuto (0 = sem limite)
+            clock: Função que retorna o tempo atual
+        """
+        self.per_minute = per_minute
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+    
+    @property
+    def unlimited(self) -> bool:
+        """Indica se o balde não limita as chamadas"""
+        return self.per_minute <= 0
+    
+    def _refill(self):
+        """Repõe as fichas acumuladas desde a última consulta"""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+    
+    def try_take(self) -> bool:
+        """Retira uma ficha se houver"""
+        if self.unlimited:
+            return True
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+    
+    def seconds_until_token(self) -> float:
+        """Tempo até a próxima ficha ficar disponível"""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        return max(0.0, (1.0 - self._tokens) / self._rate)
+    
+    @property
+    def tokens(self) -> float:
+        """Fichas disponíveis agora"""
+        if self.unlimited:
+            return float("inf")
+        self._refill()
+        return self._tokens
+
+
+class SheetsScheduler:
+    """
+    Fila única das chamadas ao Google Sheets com cotas de leitura e escrita
+    
+    Cada chamada retira uma ficha do balde do seu tipo (leitura ou escrita)
+    antes de ser enviada. Sem fichas, a chamada espera na fila do seu tipo,
+    ordenada pela prioridade (interativa > segundo plano > lote) e, dentro
+    da mesma prioridade, pela ordem de chegada. Se o prazo de espera da
+    prioridade acabar, a chamada falha com `QuotaExceededError` em vez de
+    ser enviada e receber um 429 da API.
+    """
+    
+    def __init__(
+        self,
+        read_per_minute: float,
+        write_per_minute: float,
+        timeouts: Dict[int, float],
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o agendador
+        
+        Args:
+            read_per_minute: Cota de leituras por minuto (0 = sem limite)
+            write_per_minute: Cota de escritas por minuto (0 = sem limite)
+            timeouts: Prazo máximo de espera (segundos) por prioridade
+            clock: Função que retorna o tempo atual (injetável para testes)
+        """
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._buckets = {
+            READ: TokenBucket(read_per_minute, clock),
+            WRITE: TokenBucket(write_per_minute, clock)
+        }
+        self._timeouts = timeouts
+        self._queues: Dict[str, List[Tuple[int, int]]] = {READ: [], WRITE: []}
+        self._sequence = itertools.count()
+        
+        registry = get_metrics_registry()
+        self._acquired: Dict[Tuple[str, int], Any] = {}
+        self._wait_seconds: Dict[Tuple[str, int], Any] = {}
+        self._timeouts_total: Dict[Tuple[str, int], Any] = {}
+        for kind in (READ, WRITE):
+            registry.gauge(
+                "sheets_quota_tokens",
+                "Fichas de cota disponíveis",
+                {"kind": kind},
+                reader=lambda kind=kind: self._tokens(kind)
+            )
+            for lane, lane_name in LANE_NAMES.items():
+                labels = {"kind": kind, "lane": lane_name}
+                key = (kind, lane)
+                self._acquired[key] = registry.counter(
+                    "sheets_quota_acquired_total", "Chamadas liberadas pelo agendador", labels
+                )
+                self._wait_seconds[key] = registry.counter(
+                    "sheets_quota_wait_seconds_total", "Tempo total de espera por cota", labels
+                )
+                self._timeouts_total[key] = registry.counter(
+                    "sheets_quota_timeouts_total", "Chamadas que desistiram após o prazo de espera", labels
+                )
+                registry.gauge(
+                    "sheets_quota_queue_depth",
+                    "Chamadas aguardando cota",
+                    labels,
+                    reader=lambda kind=kind, lane=lane: self._depth(kind, lane)
+                )
+    
+    def _tokens(self, kind: str) -> float:
+        """Fichas disponíveis de um tipo (-1 se sem limite)"""
+        with self._cond:
+            bucket = self._buckets[kind]
+            return -1.0 if bucket.unlimited else bucket.tokens
+    
+    def _depth(self, kind: str, lane: int) -> int:
+        """Chamadas de uma prioridade aguardando na fila de um tipo"""
+        with self._cond:
+            return sum(1 for entry_lane, _ in self._queues[kind] if entry_lane == lane)
+    
+    def acquire(self, kind: str = READ, lane: Optional[int] = None) -> float:
+        """
+        Aguarda a vez e a cota para uma chamada
+        
+        Args:
+            kind: READ ou WRITE
+            lane: Prioridade (a do contexto atual se omitida, ver `sheets_lane`)
+        
+        Returns:
+            Tempo de espera em segundos
+        
+        Raises:
+            QuotaExceededError: Se o prazo de espera da prioridade acabar
+        """
+        lane = current_lane() if lane is None else lane
+        bucket = self._buckets[kind]
+        queue = self._queues[kind]
+        start = self._clock()
+        deadline = start + self._timeouts.get(lane, 0.0)
+        
+        with self._cond:
+            # Caminho rápido: ninguém na fila e há ficha
+            if not queue and bucket.try_take():
+                self._acquired[(kind, lane)].inc()
+                return 0.0
+            
+            entry = (lane, next(self._sequence))
+            heapq.heappush(queue, entry)
+            try:
+                while True:
+                    if queue[0] == entry and bucket.try_take():
+                        heapq.heappop(queue)
+                        break
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        self._timeouts_total[(kind, lane)].inc()
+                        raise QuotaExceededError(
+                            f"Cota de {'leitura' if kind == READ else 'escrita'} do Google Sheets esgotada: "
+                            f"chamada não liberada em {self._timeouts.get(lane, 0.0):.0f}s"
+                        )
+                    # Só o primeiro da fila espera pela ficha; os demais esperam a vez
+                    wait = min(remaining, bucket.seconds_until_token()) if queue[0] == entry else remaining
+                    self._cond.wait(max(wait, 0.001))
+            except BaseException:
+                if entry in queue:
+                    queue.remove(entry)
+                    heapq.heapify(queue)
+                raise
+            finally:
+                # O próximo da fila (ou quem ficou à frente) reavalia a sua vez
+                self._cond.notify_all()
+        
+        waited = self._clock() - start
+        self._acquired[(kind, lane)].inc()
+        self._wait_seconds[(kind, lane)].inc(waited)
+        return waited
+    
+    def run(self, kind: str, operation: Callable[[], T]) -> T:
+        """
+        Executa uma chamada depois de obter a cota
+        
+        Args:
+            kind: READ ou WRITE
+            operation: Função que faz a chamada à API
+        
+        Returns:
+            Resultado da chamada
+        """
+        self.acquire(kind)
+        return operation()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as fichas disponíveis e a fila de cada tipo"""
+        with self._cond:
+            return {
+                kind: {
+                    "per_minute": bucket.per_minute,
+                    "tokens": None if bucket.unlimited else round(bucket.tokens, 2),
+                    "queued": {
+                        name: sum(1 for entry_lane, _ in self._queues[kind] if entry_lane == lane)
+                        for lane, name in LANE_NAMES.items()
+                    }
+                }
+                for kind, bucket in self._buckets.items()
+            }
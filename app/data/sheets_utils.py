@@ -0,0 +1,78 @@
+"""
+Utilitários para interpretar respostas da API do Google Sheets
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+_A1_RANGE_RE = re.compile(r"!?[A-Z]+(\d+)(?::[A-Z]+(\d+))?$")
+
+
+def parse_updated_rows(response: Any) -> Optional[Tuple[int, int]]:
+    """
+    Extrai o intervalo de linhas afetado por um append/update
+    
+    Args:
+        response: Resposta JSON da API (ex: {"updates": {"updatedRange": "Extrato!A120:H121"}})
+    
+    Returns:
+        Tupla (primeira_linha, ultima_linha) ou None se não for possível determinar
+    """
+    if not isinstance(response, dict):
+        return None
+    
+    updates = response.get("updates") or {}
+    updated_range = updates.get("updatedRange") or response.get("updatedRange")
+    if not updated_range:
+        return None
+    
+    match = _A1_RANGE_RE.search(updated_range.split("!")[-1])
+    if not match:
+        return None
+    
+    first = int(match.group(1))
+    last = int(match.group(2)) if match.group(2) else first
+    return first, last
+
+
+def delete_rows_requests(sheet_id: int, row_indexes: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Monta as requisições deleteDimension para remover várias linhas em um único batchUpdate
+    
+    Linhas consecutivas viram um único intervalo e os intervalos são ordenados
+    de baixo para cima: cada remoção só desloca linhas que já foram tratadas,
+    então os índices informados continuam válidos até o fim do lote.
+    
+    Args:
+        sheet_id: ID (gid) da aba
+        row_indexes: Índices das linhas (1 = primeira linha da planilha)
+    
+    Returns:
+        Lista de requisições para `spreadsheet.batch_update({"requests": ...})`
+    """
+    requests: List[Dict[str, Any]] = []
+    end = start = None
+    for row in sorted(set(row_indexes), reverse=True):
+        if start is not None and row == start - 1:
+            start = row
+            continue
+        if start is not None:
+            requests.append(_delete_dimension(sheet_id, start, end))
+        start = end = row
+    if start is not None:
+        requests.append(_delete_dimension(sheet_id, start, end))
+    return requests
+
+
+def _delete_dimension(sheet_id: int, first_row: int, last_row: int) -> Dict[str, Any]:
+    """Requisição deleteDimension para as linhas [first_row, last_row] (índices da planilha)"""
+    return {
+        "deleteDimension": {
+            "range": {
+                "sheetId": sheet_id,
+                "dimension": "ROWS",
+                "startIndex": first_row - 1,
+                "endIndex": last_row
+            }
+        }
+    }
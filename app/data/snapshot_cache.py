@@ -0,0 +1,386 @@
+"""
+Cache em memória de snapshots das planilhas com TTL
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_errors import SheetsError
+from app.data.sheets_scheduler import BACKGROUND, in_lane
+
+
+T = TypeVar("T")
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Mantém o último snapshot carregado de uma aba da planilha
+    
+    O snapshot é recarregado quando expira o TTL ou quando é invalidado
+    explicitamente. Operações de escrita podem corrigir o snapshot em memória
+    (write-through) através de `update`, evitando uma nova leitura completa.
+    
+    Se um `change_token` for informado, ao expirar o TTL o cache consulta
+    primeiro esse token (ex: revisão do arquivo no Drive) e só recarrega os
+    dados quando ele mudou; caso contrário apenas renova a validade do snapshot.
+    
+    Um snapshot restaurado de disco (ver `restore`) é servido imediatamente
+    enquanto é revalidado em segundo plano (stale-while-revalidate).
+    
+    O último snapshot válido é mantido mesmo após uma invalidação: se a
+    carga falhar por indisponibilidade do Google Sheets (cota, 5xx, circuit
+    breaker aberto), ele é servido no lugar do erro (stale-if-error).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        change_token: Optional[Callable[[], Optional[str]]] = None,
+        max_age_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o cache
+        
+        Args:
+            name: Nome do cache (usado nas métricas)
+            ttl_seconds: Tempo de vida do snapshot em segundos (0 desabilita o cache)
+            change_token: Função que retorna o token de alteração atual da fonte
+            max_age_seconds: Idade máxima do snapshot antes de um recarregamento
+                completo, mesmo que o token não tenha mudado (None = sem limite)
+            clock: Função que retorna o tempo atual (injetável para testes)
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self._change_token = change_token
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._value: Optional[T] = None
+        self._loaded_at: Optional[float] = None
+        self._fetched_at: Optional[float] = None
+        self._token: Optional[str] = None
+        self._version = 0
+        self._restored = False
+        self._refreshing = False
+        self._retry_at: Optional[float] = None
+        # Último snapshot válido, servido se a planilha estiver indisponível
+        self._fallback: Optional[T] = None
+        
+        registry = get_metrics_registry()
+        labels = {"cache": name}
+        self._hits = registry.counter("sheets_cache_hits_total", "Leituras servidas pelo cache", labels)
+        self._misses = registry.counter("sheets_cache_misses_total", "Leituras que exigiram carregar a planilha", labels)
+        self._invalidations = registry.counter("sheets_cache_invalidations_total", "Invalidações do snapshot", labels)
+        self._patches = registry.counter("sheets_cache_patches_total", "Correções write-through do snapshot", labels)
+        self._revalidations = registry.counter(
+            "sheets_cache_revalidations_total",
+            "Snapshots revalidados pelo token de alteração sem baixar os dados",
+            labels
+        )
+        self._stale_hits = registry.counter(
+            "sheets_cache_stale_hits_total",
+            "Leituras servidas por um snapshot restaurado de disco ainda não revalidado",
+            labels
+        )
+        self._fallback_hits = registry.counter(
+            "sheets_cache_fallback_hits_total",
+            "Leituras servidas pelo último snapshot válido porque a planilha estava indisponível",
+            labels
+        )
+        registry.gauge(
+            "sheets_cache_hit_ratio",
+            "Fração das leituras servidas sem carregar a planilha",
+            labels,
+            reader=self._hit_ratio
+        )
+    
+    def _hit_ratio(self) -> float:
+        """Fração das leituras servidas pelo snapshot (incluindo os restaurados de disco)"""
+        served = self._hits.value + self._stale_hits.value
+        total = served + self._misses.value
+        return served / total if total else 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        """Indica se o cache está habilitado"""
+        return self.ttl_seconds > 0
+    
+    @property
+    def version(self) -> int:
+        """Versão do snapshot (incrementada a cada carga ou alteração)"""
+        return self._version
+    
+    @property
+    def is_stale(self) -> bool:
+        """Indica se o snapshot foi restaurado de disco e ainda não foi revalidado"""
+        return self._restored
+    
+    def _is_fresh(self) -> bool:
+        """Verifica se o snapshot atual ainda está dentro do TTL"""
+        if self._loaded_at is None:
+            return False
+        return (self._clock() - self._loaded_at) < self.ttl_seconds
+    
+    def _fetch_token(self) -> Optional[str]:
+        """Consulta o token de alteração (None se indisponível)"""
+        if self._change_token is None:
+            return None
+        try:
+            return self._change_token()
+        except Exception as e:
+            print(f"Erro ao consultar token de alteração ({self.name}): {e}")
+            return None
+    
+    def _is_too_old(self, now: float) -> bool:
+        """Verifica se o snapshot passou da idade máxima desde a última leitura completa"""
+        return (
+            self.max_age_seconds is not None
+            and self._fetched_at is not None
+            and (now - self._fetched_at) >= self.max_age_seconds
+        )
+    
+    def _revalidate(self) -> Optional[str]:
+        """
+        Verifica se o snapshot expirado ainda corresponde à fonte
+        
+        Returns:
+            Token atual da fonte (None se indisponível). Se for igual ao token
+            do snapshot, a validade do snapshot é renovada.
+        """
+        token = self._fetch_token()
+        if token is None or self._loaded_at is None:
+            return token
+        
+        now = self._clock()
+        if token == self._token and not self._is_too_old(now):
+            self._loaded_at = now
+            self._restored = False
+            self._revalidations.inc()
+        return token
+    
+    def get(self, loader: Callable[[], T], allow_stale: bool = True) -> T:
+        """
+        Obtém o snapshot, carregando-o se necessário
+        
+        Chamadas concorrentes aguardam a mesma carga, de modo que apenas uma
+        leitura da planilha é feita por expiração.
+        
+        Args:
+            loader: Função que lê e converte os dados da planilha
+            allow_stale: Se True, um snapshot restaurado de disco é retornado
+                imediatamente e revalidado em segundo plano, e o último snapshot
+                válido é retornado se a planilha estiver indisponível; se False,
+                o snapshot restaurado é revalidado antes de retornar e as falhas
+                da planilha são repassadas (ex: antes de calcular posições de escrita)
+        
+        Returns:
+            Snapshot atual
+        
+        Raises:
+            SheetsError: Se a planilha estiver indisponível e não houver snapshot para servir
+        """
+        if not self.enabled:
+            self._misses.inc()
+            return loader()
+        
+        with self._lock:
+            if self._is_fresh():
+                self._hits.inc()
+                return self._value
+            
+            if self._restored and allow_stale:
+                self._stale_hits.inc()
+                self._refresh_in_background(loader)
+                return self._value
+            
+            # O token é lido antes dos dados: uma edição durante a leitura
+            # gera um token diferente e força nova carga na próxima expiração
+            token = self._revalidate()
+            if self._is_fresh():
+                self._hits.inc()
+                return self._value
+            
+            self._misses.inc()
+            try:
+                value = loader()
+            except SheetsError as e:
+                if not (allow_stale and e.upstream_failure and self._fallback is not None):
+                    raise
+                # Sem renovar a validade: a próxima leitura tenta a planilha de novo
+                # (com o circuit breaker aberto, a tentativa falha na hora)
+                print(f"Servindo o último snapshot válido ({self.name}): {e}")
+                self._fallback_hits.inc()
+                return self._fallback
+            self._value = value
+            self._fallback = value
+            self._loaded_at = self._clock()
+            self._fetched_at = self._loaded_at
+            self._token = token
+            self._restored = False
+            self._version += 1
+            return value
+    
+    def _refresh_in_background(self, loader: Callable[[], T]):
+        """Inicia a revalidação do snapshot restaurado (uma por vez, com espera após falhas)"""
+        if self._refreshing or (self._retry_at is not None and self._clock() < self._retry_at):
+            return
+        self._refreshing = True
+        threading.Thread(
+            target=in_lane(BACKGROUND, self._refresh),
+            args=(loader,),
+            name=f"cache-refresh-{self.name}",
+            daemon=True
+        ).start()
+    
+    def _refresh(self, loader: Callable[[], T]):
+        """
+        Revalida o snapshot restaurado sem bloquear as leituras
+        
+        Se o token não mudou, apenas confirma o snapshot; caso contrário
+        carrega os dados. Se o snapshot for alterado durante a carga (correção
+        de uma escrita ou invalidação), o resultado é descartado e a próxima
+        leitura inicia nova revalidação.
+        """
+        try:
+            with self._lock:
+                version = self._version
+                restored_token = self._token
+            
+            token = self._fetch_token()
+            now = self._clock()
+            if token is not None and token == restored_token and not self._is_too_old(now):
+                with self._lock:
+                    if self._version == version and self._restored:
+                        self._loaded_at = now
+                        self._restored = False
+                        self._revalidations.inc()
+                return
+            
+            value = loader()
+            with self._lock:
+                if self._version == version and self._restored:
+                    self._misses.inc()
+                    self._value = value
+                    self._fallback = value
+                    self._loaded_at = self._clock()
+                    self._fetched_at = self._loaded_at
+                    self._token = token
+                    self._restored = False
+                    self._version += 1
+            self._retry_at = None
+        except Exception as e:
+            print(f"Erro ao revalidar o snapshot restaurado ({self.name}): {e}")
+            self._retry_at = self._clock() + max(self.ttl_seconds, 1.0)
+        finally:
+            self._refreshing = False
+    
+    def restore(self, value: T, token: Optional[str], age_seconds: float) -> bool:
+        """
+        Restaura um snapshot salvo em disco (ex: após um reinício)
+        
+        O snapshot fica expirado: é servido enquanto é revalidado em segundo
+        plano pela próxima leitura (ver `get`).
+        
+        Args:
+            value: Snapshot salvo
+            token: Token de alteração da fonte quando o snapshot foi lido
+            age_seconds: Tempo desde a leitura completa que gerou o snapshot
+        
+        Returns:
+            True se restaurado, False se já havia um snapshot carregado
+        """
+        with self._lock:
+            if self._loaded_at is not None:
+                return False
+            now = self._clock()
+            self._value = value
+            self._fallback = value
+            self._loaded_at = now - self.ttl_seconds
+            self._fetched_at = now - max(age_seconds, 0.0)
+            self._token = token
+            self._restored = True
+            self._version += 1
+            return True
+    
+    def snapshot(self) -> Optional[Tuple[T, Optional[str], float]]:
+        """
+        Retorna o snapshot carregado para ser salvo em disco
+        
+        Returns:
+            Tupla (snapshot, token, idade desde a leitura completa), ou None se não houver snapshot
+        """
+        with self._lock:
+            if self._loaded_at is None or self._value is None:
+                return None
+            return self._value, self._token, self._clock() - (self._fetched_at or self._loaded_at)
+    
+    def update(self, patch: Callable[[T], Optional[T]], allow_stale: bool = True) -> bool:
+        """
+        Aplica uma correção ao snapshot carregado (write-through)
+        
+        Args:
+            patch: Função que recebe o snapshot atual e retorna o novo snapshot.
+                Se retornar None, o snapshot é invalidado.
+            allow_stale: Se False, não corrige um snapshot restaurado ainda não revalidado
+        
+        Returns:
+            True se o snapshot foi corrigido, False se não havia snapshot carregado
+            (ou apenas um restaurado, com `allow_stale=False`) ou se a correção
+            resultou em invalidação
+        """
+        with self._lock:
+            if self._loaded_at is None or (self._restored and not allow_stale):
+                return False
+            
+            new_value = patch(self._value)
+            if new_value is None:
+                self.invalidate()
+                return False
+            
+            self._value = new_value
+            self._fallback = new_value
+            self._version += 1
+            self._patches.inc()
+            return True
+    
+    def invalidate(self):
+        """Descarta o snapshot atual, forçando uma nova leitura (o último válido fica como reserva)"""
+        with self._lock:
+            self._value = None
+            self._loaded_at = None
+            self._fetched_at = None
+            self._token = None
+            self._restored = False
+            self._version += 1
+            self._invalidations.inc()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do cache
+        
+        Returns:
+            Dicionário com hits, misses, versão e idade do snapshot
+        """
+        age = None
+        if self._loaded_at is not None:
+            age = self._clock() - self._loaded_at
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": int(self._hits.value),
+            "misses": int(self._misses.value),
+            "invalidations": int(self._invalidations.value),
+            "patches": int(self._patches.value),
+            "revalidations": int(self._revalidations.value),
+            "stale_hits": int(self._stale_hits.value),
+            "fallback_hits": int(self._fallback_hits.value),
+            "hit_ratio": round(self._hit_ratio(), 4),
+            "restored": self._restored,
+            "token": self._token,
+            "version": self._version,
+            "age_seconds": age
+        }
@@ -0,0 +1,258 @@
+"""
+Persistência dos snapshots em disco para inicialização rápida
+"""
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.metrics import get_metrics_registry
+from app.data.snapshot_cache import SnapshotCache
+
+
+# Versão do formato dos arquivos (arquivos de outra versão são ignorados)
+FORMAT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    Arquivos de snapshot em disco, um por cache
+    
+    Cada arquivo é um JSON compactado com gzip (sem pickle: o conteúdo é
+    apenas dados) com o token de alteração e o momento da leitura completa
+    que gerou o snapshot. A gravação é atômica (arquivo temporário + troca).
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Inicializa o armazenamento
+        
+        Args:
+            directory: Diretório dos arquivos (criado se necessário)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, name: str) -> str:
+        """Caminho do arquivo de um snapshot"""
+        return os.path.join(self.directory, f"{name}.json.gz")
+    
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Lê um snapshot salvo
+        
+        Args:
+            name: Nome do cache
+        
+        Returns:
+            Dicionário com "token", "fetched_at" (epoch) e "data", ou None se
+            não houver arquivo válido
+        """
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Snapshot inválido em {path}: {e}")
+            return None
+        if not isinstance(payload, dict) or payload.get("format") != FORMAT_VERSION:
+            return None
+        return payload
+    
+    def save(self, name: str, token: Optional[str], fetched_at: float, data: Any):
+        """
+        Grava um snapshot (troca atômica do arquivo)
+        
+        Args:
+            name: Nome do cache
+            token: Token de alteração da fonte quando o snapshot foi lido
+            fetched_at: Momento (epoch) da leitura completa que gerou o snapshot
+            data: Conteúdo serializável em JSON
+        """
+        payload = {
+            "format": FORMAT_VERSION,
+            "name": name,
+            "token": token,
+            "fetched_at": fetched_at,
+            "saved_at": time.time(),
+            "data": data
+        }
+        path = self._path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as f:
+                f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, path)
+
+
+class _PersistedCache:
+    """Cache registrado para persistência e suas funções de conversão"""
+    
+    def __init__(self, cache: SnapshotCache, dump: Callable[[Any], Any]):
+        self.cache = cache
+        self.dump = dump
+        self.saved_version: Optional[int] = None
+
+
+class SnapshotPersistence:
+    """
+    Salva periodicamente os snapshots dos caches registrados e os restaura na inicialização
+    
+    Um cache registrado é restaurado do disco imediatamente (ver
+    `SnapshotCache.restore`), de modo que a primeira requisição após um
+    reinício é respondida sem acessar o Google. A cada `interval_seconds` os
+    snapshots que mudaram desde a última gravação são salvos; `stop` salva
+    todos antes do encerramento.
+    """
+    
+    def __init__(self, store: SnapshotStore, interval_seconds: float = 300.0):
+        """
+        Inicializa a persistência
+        
+        Args:
+            store: Armazenamento dos arquivos
+            interval_seconds: Intervalo entre as gravações periódicas
+        """
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._caches: Dict[str, _PersistedCache] = {}
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        
+        registry = get_metrics_registry()
+        self._restores = registry.counter("snapshot_restores_total", "Snapshots restaurados do disco")
+        self._saves = registry.counter("snapshot_saves_total", "Snapshots salvos em disco")
+        self._failures = registry.counter("snapshot_save_failures_total", "Gravações de snapshot que falharam")
+    
+    def register(
+        self,
+        cache: SnapshotCache,
+        dump: Callable[[Any], Any],
+        load: Callable[[Any], Any]
+    ) -> bool:
+        """
+        Registra um cache e restaura seu snapshot salvo, se houver
+        
+        Args:
+            cache: Cache a persistir (pelo nome)
+            dump: Converte o snapshot em dados serializáveis em JSON
+            load: Converte os dados salvos de volta no snapshot
+        
+        Returns:
+            True se um snapshot foi restaurado
+        """
+        entry = _PersistedCache(cache, dump)
+        with self._lock:
+            self._caches[cache.name] = entry
+        
+        payload = self.store.load(cache.name)
+        if payload is None:
+            return False
+        try:
+            value = load(payload["data"])
+        except Exception as e:
+            print(f"Erro ao restaurar o snapshot {cache.name}: {e}")
+            return False
+        age = time.time() - float(payload.get("fetched_at") or 0)
+        if not cache.restore(value, payload.get("token"), age):
+            return False
+        entry.saved_version = cache.version
+        self._restores.inc()
+        return True
+    
+    def start(self):
+        """Inicia a thread de gravação periódica (idempotente)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="snapshot-persistence", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Encerra a thread e salva os snapshots alterados"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+        self._wakeup.set()
+        if thread is not None:
+            thread.join()
+        self.save()
+    
+    def _run(self):
+        """Laço da thread: salva os snapshots alterados a cada intervalo"""
+        while not self._stopping:
+            self._wakeup.wait(self.interval_seconds)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            self.save()
+    
+    def save(self) -> List[str]:
+        """
+        Salva os snapshots que mudaram desde a última gravação
+        
+        Returns:
+            Nomes dos caches salvos
+        """
+        with self._lock:
+            entries = list(self._caches.values())
+        
+        saved = []
+        for entry in entries:
+            version = entry.cache.version
+            if version == entry.saved_version:
+                continue
+            current = entry.cache.snapshot()
+            if current is None:
+                continue
+            value, token, age = current
+            try:
+                self.store.save(entry.cache.name, token, time.time() - age, entry.dump(value))
+            except Exception as e:
+                self._failures.inc()
+                print(f"Erro ao salvar o snapshot {entry.cache.name}: {e}")
+                continue
+            entry.saved_version = version
+            self._saves.inc()
+            saved.append(entry.cache.name)
+        return saved
+
+
+_persistence: Optional[SnapshotPersistence] = None
+_persistence_lock = threading.Lock()
+
+
+def get_snapshot_persistence(directory: str, interval_seconds: float) -> SnapshotPersistence:
+    """
+    Retorna a persistência de snapshots do processo, iniciando-a na primeira chamada
+    
+    Args:
+        directory: Diretório dos arquivos
+        interval_seconds: Intervalo entre as gravações periódicas
+    
+    Returns:
+        Instância compartilhada por todos os repositórios
+    """
+    global _persistence
+    with _persistence_lock:
+        if _persistence is None:
+            _persistence = SnapshotPersistence(SnapshotStore(directory), interval_seconds)
+            _persistence.start()
+        return _persistence
+
+
+def stop_snapshot_persistence():
+    """Salva os snapshots alterados e encerra a gravação periódica (se iniciada)"""
+    with _persistence_lock:
+        persistence = _persistence
+    if persistence is not None:
+        persistence.stop()
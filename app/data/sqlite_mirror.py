@@ -0,0 +1,513 @@
+"""
+Espelho local (SQLite) de uma aba de transações
+"""
+import bisect
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_scheduler import BACKGROUND, in_lane
+from app.data.query.cursor import decode_cursor, encode_cursor, query_fingerprint
+from app.data.query.filters import FilterCriteria
+from app.domain.entities import normalizar_busca, parse_data
+
+
+# Colunas com os valores exatamente como na planilha (colunas A:H)
+_VALUE_COLUMNS = ("tipo", "descritivo", "valor", "data", "mes", "detalhes", "situacao")
+
+# Colunas de ordenação: todas crescentes, com as ordens decrescentes (data e
+# valor) armazenadas negadas, como em `position_key`
+_SORT_COLUMNS = {
+    "tipo": "tipo_lower",
+    "categoria": "descritivo_lower",
+    "valor": "valor_chave",
+    "situacao": "situacao_lower"
+}
+
+_IDENTIFIER_RE = re.compile(r"^[a-z_]+$")
+
+
+class SqliteMirror:
+    """
+    Cópia indexada de uma aba da planilha em um arquivo SQLite
+    
+    As leituras (filtros, ordenação e paginação) viram consultas SQL sobre
+    índices e nunca acessam o Google: a cópia é importada por completo na
+    primeira vez e atualizada em segundo plano quando o token de alteração da
+    planilha muda, gravando apenas as linhas que mudaram. Se o Google estiver
+    lento ou fora do ar, as leituras continuam servidas pela última cópia.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        entity_class: type,
+        account_field: str,
+        loader: Callable[[], Sequence[Any]],
+        change_token: Optional[Callable[[], Optional[str]]] = None,
+        refresh_interval_seconds: float = 30.0
+    ):
+        """
+        Inicializa o espelho e faz a importação inicial, se necessário
+        
+        Args:
+            path: Caminho do arquivo SQLite (o diretório é criado se necessário)
+            table: Nome da tabela
+            entity_class: Classe da entidade (Transacao ou TransacaoCredito)
+            account_field: Campo de conta da entidade ("conta" ou "cartao")
+            loader: Lê todas as transações da planilha (sem cache)
+            change_token: Retorna o token de alteração atual da planilha
+            refresh_interval_seconds: Intervalo entre as verificações do token
+        """
+        if not _IDENTIFIER_RE.match(table) or account_field not in ("conta", "cartao"):
+            raise ValueError(f"Tabela ou campo de conta inválido: {table}, {account_field}")
+        
+        self.table = table
+        self.entity_class = entity_class
+        self.account_field = account_field
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._loader = loader
+        self._change_token = change_token
+        self._columns = _VALUE_COLUMNS + (account_field,)
+        self._lock = threading.RLock()
+        self._distinct: Dict[str, List[str]] = {}
+        self._token: Optional[str] = None
+        self._synced_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        
+        registry = get_metrics_registry()
+        labels = {"table": table}
+        self._queries = registry.counter("sqlite_queries_total", "Consultas servidas pelo espelho SQLite", labels)
+        self._refreshes = registry.counter(
+            "sqlite_refreshes_total",
+            "Sincronizações do espelho SQLite que leram a planilha",
+            labels
+        )
+        self._rows_written = registry.counter(
+            "sqlite_rows_written_total",
+            "Linhas gravadas ou removidas no espelho SQLite pelas sincronizações",
+            labels
+        )
+        self._refresh_failures = registry.counter(
+            "sqlite_refresh_failures_total",
+            "Sincronizações do espelho SQLite que falharam",
+            labels
+        )
+        registry.gauge(
+            "sqlite_staleness_seconds",
+            "Tempo desde a última sincronização confirmada do espelho SQLite",
+            labels,
+            reader=lambda: time.time() - self._synced_at if self._synced_at else 0.0
+        )
+        
+        row = self._conn.execute("SELECT token, synced_at FROM sync_state WHERE name = ?", (table,)).fetchone()
+        if row is None:
+            # Primeira execução: importação completa antes de servir leituras
+            try:
+                self.refresh(force=True)
+            except Exception as e:
+                self._record_failure(e)
+        else:
+            # Cópia de uma execução anterior: serve já e sincroniza em segundo plano
+            self._token, self._synced_at = row
+            self._wakeup.set()
+    
+    def _create_schema(self):
+        """Cria a tabela, os índices e a tabela de estado da sincronização"""
+        acc = self.account_field
+        t = self.table
+        columns = ", ".join(f"{c} TEXT NOT NULL" for c in self._columns)
+        with self._lock, self._conn:
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS {t} (
+                    row_index INTEGER PRIMARY KEY,
+                    {columns},
+                    data_ordinal INTEGER,
+                    data_chave INTEGER NOT NULL,
+                    valor_chave INTEGER NOT NULL,
+                    tipo_lower TEXT NOT NULL,
+                    descritivo_lower TEXT NOT NULL,
+                    descritivo_busca TEXT NOT NULL,
+                    mes_lower TEXT NOT NULL,
+                    situacao_lower TEXT NOT NULL,
+                    {acc}_lower TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_{t}_data ON {t} (data_chave, row_index, data_ordinal);
+                CREATE INDEX IF NOT EXISTS idx_{t}_valor ON {t} (valor_chave, row_index);
+                CREATE INDEX IF NOT EXISTS idx_{t}_tipo ON {t} (tipo_lower, row_index);
+                CREATE INDEX IF NOT EXISTS idx_{t}_descritivo ON {t} (descritivo_lower, row_index);
+                CREATE INDEX IF NOT EXISTS idx_{t}_situacao ON {t} (situacao_lower, row_index);
+                CREATE INDEX IF NOT EXISTS idx_{t}_{acc} ON {t} ({acc}_lower, row_index);
+                CREATE INDEX IF NOT EXISTS idx_{t}_mes ON {t} (mes_lower, {acc}_lower, tipo_lower, situacao_lower, data_chave);
+                CREATE INDEX IF NOT EXISTS idx_{t}_busca ON {t} (descritivo_busca);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    name TEXT PRIMARY KEY,
+                    token TEXT,
+                    synced_at REAL,
+                    rows INTEGER
+                );
+            """)
+    
+    # ==================== SINCRONIZAÇÃO ====================
+    
+    def start(self):
+        """Inicia a thread de sincronização em segundo plano (idempotente)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=in_lane(BACKGROUND, self._run),
+                name=f"sqlite-{self.table}",
+                daemon=True
+            )
+            self._thread.start()
+    
+    def _run(self):
+        """Laço da thread: verifica o token a cada intervalo"""
+        while True:
+            self._wakeup.wait(self.refresh_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                self._record_failure(e)
+    
+    def _record_failure(self, error: Exception):
+        """Registra uma sincronização que falhou (as leituras seguem na cópia atual)"""
+        self._refresh_failures.inc()
+        self._last_error = str(error)
+        print(f"Erro ao sincronizar o espelho SQLite ({self.table}): {error}")
+    
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Sincroniza a cópia com a planilha se o token de alteração mudou
+        
+        Args:
+            force: Se True, lê a planilha mesmo que o token não tenha mudado
+        
+        Returns:
+            True se a planilha foi lida
+        """
+        # O token é lido antes dos dados: uma edição durante a leitura gera
+        # um token diferente e força nova sincronização no próximo ciclo
+        token = self._change_token() if self._change_token else None
+        if not force and token is not None and token == self._token:
+            self._synced_at = time.time()
+            return False
+        
+        items = self._loader()
+        self._apply_snapshot(items, token)
+        self._refreshes.inc()
+        self._last_error = None
+        return True
+    
+    def _apply_snapshot(self, items: Sequence[Any], token: Optional[str]):
+        """Grava apenas as linhas novas ou alteradas e remove as que sumiram da planilha"""
+        select = f"SELECT row_index, {', '.join(self._columns)} FROM {self.table}"
+        with self._lock:
+            current = {row[0]: row[1:] for row in self._conn.execute(select)}
+            
+            changed = []
+            for item in items:
+                if current.pop(item.row_index, None) != self._values(item):
+                    changed.append(self._to_row(item))
+            removed = [(row_index,) for row_index in current]
+            
+            now = time.time()
+            with self._conn:
+                if changed:
+                    self._conn.executemany(self._upsert_sql(), changed)
+                if removed:
+                    self._conn.executemany(f"DELETE FROM {self.table} WHERE row_index = ?", removed)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (name, token, synced_at, rows) VALUES (?, ?, ?, ?)",
+                    (self.table, token, now, len(items))
+                )
+            if changed or removed:
+                self._distinct.clear()
+                # Atualiza as estatísticas do planejador quando o volume mudou bastante
+                self._conn.execute("PRAGMA optimize")
+            self._token = token
+            self._synced_at = now
+        self._rows_written.inc(len(changed) + len(removed))
+    
+    # ==================== ESCRITAS ESPELHADAS ====================
+    
+    def upsert(self, items: Sequence[Any]):
+        """
+        Grava na cópia transações já gravadas na planilha (criação/atualização)
+        
+        Args:
+            items: Entidades com row_index
+        """
+        rows = [self._to_row(item) for item in items if item.row_index is not None]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(self._upsert_sql(), rows)
+            self._distinct.clear()
+    
+    def remove(self, row_indexes: Sequence[int]):
+        """
+        Remove linhas da cópia e desloca o row_index das seguintes, como na planilha
+        
+        Args:
+            row_indexes: Índices das linhas antes da remoção
+        """
+        removed = sorted(set(row_indexes))
+        if not removed:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"DELETE FROM {self.table} WHERE row_index = ?",
+                    [(row_index,) for row_index in removed]
+                )
+                following = self._conn.execute(
+                    f"SELECT row_index FROM {self.table} WHERE row_index > ? ORDER BY row_index",
+                    (removed[0],)
+                ).fetchall()
+                # Em ordem crescente cada destino já está livre (a linha anterior já foi movida)
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET row_index = ? WHERE row_index = ?",
+                    [(row - bisect.bisect_left(removed, row), row) for (row,) in following]
+                )
+            self._distinct.clear()
+    
+    def _upsert_sql(self) -> str:
+        """Comando de inclusão/substituição de uma linha completa"""
+        columns = (
+            ("row_index",) + self._columns
+            + ("data_ordinal", "data_chave", "valor_chave", "tipo_lower", "descritivo_lower",
+               "descritivo_busca", "mes_lower", "situacao_lower", f"{self.account_field}_lower")
+        )
+        placeholders = ", ".join("?" * len(columns))
+        return f"INSERT OR REPLACE INTO {self.table} ({', '.join(columns)}) VALUES ({placeholders})"
+    
+    def _values(self, item: Any) -> Tuple[str, ...]:
+        """Valores das colunas da planilha de uma entidade"""
+        return (
+            item.tipo, item.descritivo, item.valor, item.data, item.mes,
+            item.detalhes or "", item.situacao, getattr(item, self.account_field)
+        )
+    
+    def _to_row(self, item: Any) -> Tuple[Any, ...]:
+        """Linha completa da tabela (valores + chaves de filtro e ordenação)"""
+        ordinal = item.data_ordenacao.toordinal() if item.data_ordenacao else None
+        return (item.row_index,) + self._values(item) + (
+            ordinal,
+            -(ordinal or 1),
+            -item.valor_centavos,
+            item.tipo_lower,
+            item.descritivo_lower,
+            item.descritivo_busca,
+            item.mes_lower,
+            item.situacao_lower,
+            getattr(item, f"{self.account_field}_lower")
+        )
+    
+    def _to_entity(self, row: Sequence[Any]) -> Any:
+        """Converte (row_index, colunas da planilha...) na entidade"""
+        values = dict(zip(self._columns, row[1:]))
+        return self.entity_class(row_index=row[0], **values)
+    
+    # ==================== CONSULTAS ====================
+    
+    def _distinct_keys(self, column: str) -> List[str]:
+        """Valores distintos de uma coluna normalizada (lidos do índice e guardados até a próxima escrita)"""
+        keys = self._distinct.get(column)
+        if keys is None:
+            keys = [row[0] for row in self._conn.execute(f"SELECT DISTINCT {column} FROM {self.table}")]
+            self._distinct[column] = keys
+        return keys
+    
+    def _where(self, criteria: FilterCriteria) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Traduz os filtros em uma cláusula WHERE com a mesma semântica de `compile_filter`
+        
+        Os filtros "contém" de mês, situação e conta são resolvidos contra os
+        valores distintos da coluna (poucos), virando um IN que usa o índice.
+        
+        Returns:
+            Tupla (cláusula, parâmetros), ou None se nenhum registro pode atender
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        
+        if criteria.tipo:
+            clauses.append("tipo_lower = ?")
+            params.append(criteria.tipo.lower())
+        
+        if criteria.data_inicio or criteria.data_fim:
+            # Intervalo sobre a chave de ordenação por data (negada): o índice
+            # já entrega o período na ordem padrão da listagem
+            clauses.append("data_ordinal IS NOT NULL")
+            dt_inicio = parse_data(criteria.data_inicio)
+            dt_fim = parse_data(criteria.data_fim)
+            if dt_inicio:
+                clauses.append("data_chave <= ?")
+                params.append(-dt_inicio.toordinal())
+            if dt_fim:
+                clauses.append("data_chave >= ?")
+                params.append(-dt_fim.toordinal())
+        
+        for column, value in (
+            ("mes_lower", criteria.mes),
+            ("situacao_lower", criteria.situacao),
+            (f"{self.account_field}_lower", criteria.conta)
+        ):
+            if value:
+                needle = value.lower()
+                keys = [key for key in self._distinct_keys(column) if needle in key]
+                if not keys:
+                    return None
+                clauses.append(f"{column} IN ({', '.join('?' * len(keys))})")
+                params.extend(keys)
+        
+        if criteria.categoria:
+            clauses.append("instr(descritivo_busca, ?) > 0")
+            params.append(normalizar_busca(criteria.categoria))
+        
+        return (" AND ".join(clauses) if clauses else "1"), params
+    
+    def _sort_column(self, order_by: str) -> str:
+        """Coluna de ordenação (crescente, desempate por row_index) de um campo"""
+        if order_by == self.account_field:
+            return f"{self.account_field}_lower"
+        return _SORT_COLUMNS.get(order_by, "data_chave")
+    
+    def query(self, criteria: FilterCriteria, order_by: str) -> List[Any]:
+        """
+        Retorna as transações filtradas e ordenadas (mesma ordem de `sort_items`)
+        
+        Args:
+            criteria: Filtros da listagem
+            order_by: Campo para ordenação
+        
+        Returns:
+            Lista de entidades
+        """
+        with self._lock:
+            self._queries.inc()
+            where = self._where(criteria)
+            if where is None:
+                return []
+            clause, params = where
+            sort = self._sort_column(order_by)
+            rows = self._conn.execute(
+                f"SELECT row_index, {', '.join(self._columns)} FROM {self.table} "
+                f"WHERE {clause} ORDER BY {sort}, row_index",
+                params
+            ).fetchall()
+        return [self._to_entity(row) for row in rows]
+    
+    def paginate(
+        self,
+        criteria: FilterCriteria,
+        order_by: str,
+        start: int,
+        count: int
+    ) -> Tuple[int, List[Any]]:
+        """
+        Retorna o total filtrado e uma página (LIMIT/OFFSET sobre o índice de ordenação)
+        
+        Returns:
+            Tupla (total, itens da página)
+        """
+        with self._lock:
+            self._queries.inc()
+            where = self._where(criteria)
+            if where is None:
+                return 0, []
+            clause, params = where
+            total = self._conn.execute(f"SELECT COUNT(*) FROM {self.table} WHERE {clause}", params).fetchone()[0]
+            sort = self._sort_column(order_by)
+            rows = self._conn.execute(
+                f"SELECT row_index, {', '.join(self._columns)} FROM {self.table} "
+                f"WHERE {clause} ORDER BY {sort}, row_index LIMIT ? OFFSET ?",
+                params + [count, max(0, start)]
+            ).fetchall()
+        return total, [self._to_entity(row) for row in rows]
+    
+    def paginate_cursor(
+        self,
+        criteria: FilterCriteria,
+        order_by: str,
+        cursor: Optional[str],
+        count: int
+    ) -> Tuple[int, int, List[Any], Optional[str]]:
+        """
+        Retorna a página seguinte ao cursor (keyset sobre (chave de ordenação, row_index))
+        
+        Returns:
+            Tupla (total, posição inicial da página, itens, próximo cursor ou None na última página)
+        
+        Raises:
+            ValueError: Se o cursor for inválido ou de outra combinação de filtros
+        """
+        fingerprint = query_fingerprint(criteria, order_by)
+        after: Optional[List[Any]] = None
+        start = 0
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("q") != fingerprint:
+                raise ValueError("Cursor não corresponde aos filtros e à ordenação informados")
+            after, start = payload.get("k"), payload.get("o")
+            if not isinstance(after, list) or len(after) != 2 or not isinstance(start, int):
+                raise ValueError("Cursor inválido")
+        
+        with self._lock:
+            self._queries.inc()
+            where = self._where(criteria)
+            if where is None:
+                return 0, 0, [], None
+            clause, params = where
+            total = self._conn.execute(f"SELECT COUNT(*) FROM {self.table} WHERE {clause}", params).fetchone()[0]
+            sort = self._sort_column(order_by)
+            if after is not None:
+                clause = f"{clause} AND ({sort}, row_index) > (?, ?)"
+                params = params + after
+            rows = self._conn.execute(
+                f"SELECT row_index, {', '.join(self._columns)}, {sort} FROM {self.table} "
+                f"WHERE {clause} ORDER BY {sort}, row_index LIMIT ?",
+                params + [count + 1]
+            ).fetchall()
+        
+        next_cursor = None
+        if len(rows) > count:
+            rows = rows[:count]
+            last = rows[-1]
+            next_cursor = encode_cursor({"q": fingerprint, "k": [last[-1], last[0]], "o": start + count})
+        return total, start, [self._to_entity(row[:-1]) for row in rows], next_cursor
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do espelho"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return {
+            "table": self.table,
+            "rows": rows,
+            "token": self._token,
+            "synced_at": self._synced_at,
+            "queries": int(self._queries.value),
+            "refreshes": int(self._refreshes.value),
+            "rows_written": int(self._rows_written.value),
+            "refresh_failures": int(self._refresh_failures.value),
+            "last_error": self._last_error
+        }
@@ -0,0 +1,154 @@
+"""
+Registro de handles de worksheets por planilha
+"""
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from gspread.exceptions import APIError, WorksheetNotFound
+
+from app.core.metrics import get_metrics_registry
+from app.data.sheets_errors import SheetsNotFoundError
+from app.data.sheets_scheduler import READ, WRITE
+
+
+T = TypeVar("T")
+
+# Mensagens da API que indicam que o handle em cache aponta para uma aba
+# renomeada, removida ou recriada (gid diferente)
+_STALE_HANDLE_MESSAGES = ("Unable to parse range", "No grid with id")
+
+
+class WorksheetRegistry:
+    """
+    Mantém os objetos Worksheet já resolvidos de uma planilha
+    
+    `spreadsheet.worksheet(nome)` busca os metadados da planilha a cada chamada.
+    O registro resolve cada aba uma única vez (sob demanda) e reutiliza o handle,
+    descartando-o quando a API indica que a aba mudou.
+    """
+    
+    def __init__(self, spreadsheet_getter: Callable[[], Any], caller: Optional[Any] = None):
+        """
+        Inicializa o registro
+        
+        Args:
+            spreadsheet_getter: Função que retorna a planilha conectada (gspread.Spreadsheet)
+            caller: Objeto com `run(kind, call)` por onde passa cada chamada à API
+                (ex: ResilientSheetsCaller ou SheetsScheduler; None = chamada direta)
+        """
+        self._get_spreadsheet = spreadsheet_getter
+        self._caller = caller
+        self._lock = threading.Lock()
+        self._spreadsheet: Optional[Any] = None
+        self._worksheets: Dict[str, Any] = {}
+        
+        registry = get_metrics_registry()
+        self._resolutions = registry.counter(
+            "sheets_worksheet_resolutions_total",
+            "Buscas de metadados para resolver uma aba"
+        )
+        self._saved = registry.counter(
+            "sheets_worksheet_metadata_calls_saved_total",
+            "Buscas de metadados evitadas pelo reuso do handle da aba"
+        )
+        self._invalidations = registry.counter(
+            "sheets_worksheet_invalidations_total",
+            "Handles de abas descartados por mudança na planilha"
+        )
+    
+    def get(self, title: str) -> Any:
+        """
+        Obtém o handle da aba, resolvendo-o apenas na primeira vez
+        
+        Args:
+            title: Nome da aba
+        
+        Returns:
+            gspread.Worksheet
+        
+        Raises:
+            WorksheetNotFound: Se a aba não existir
+        """
+        spreadsheet = self._get_spreadsheet()
+        with self._lock:
+            # Reconexões criam outro objeto Spreadsheet: os handles antigos são descartados
+            if spreadsheet is not self._spreadsheet:
+                self._spreadsheet = spreadsheet
+                self._worksheets.clear()
+            
+            worksheet = self._worksheets.get(title)
+            if worksheet is not None:
+                self._saved.inc()
+                return worksheet
+        
+        self._resolutions.inc()
+        worksheet = self._call(READ, lambda: spreadsheet.worksheet(title))
+        with self._lock:
+            if spreadsheet is self._spreadsheet:
+                self._worksheets[title] = worksheet
+        return worksheet
+    
+    def invalidate(self, title: Optional[str] = None):
+        """
+        Descarta o handle de uma aba (ou de todas)
+        
+        Args:
+            title: Nome da aba; None descarta todas
+        """
+        with self._lock:
+            if title is None:
+                self._worksheets.clear()
+            else:
+                self._worksheets.pop(title, None)
+            self._invalidations.inc()
+    
+    def _call(self, kind: str, call: Callable[[], T]) -> T:
+        """Executa uma chamada à API passando pelo controle de cota e falhas (se houver)"""
+        if self._caller is None:
+            return call()
+        return self._caller.run(kind, call)
+    
+    def run(self, title: str, operation: Callable[[Any], T], write: bool = False) -> T:
+        """
+        Executa uma operação sobre a aba, re-resolvendo o handle se ele estiver obsoleto
+        
+        Args:
+            title: Nome da aba
+            operation: Função que recebe o Worksheet e executa a chamada à API
+            write: Se True, a chamada consome a cota de escrita (senão, a de leitura)
+        
+        Returns:
+            Resultado da operação
+        
+        Raises:
+            SheetsError: Falha classificada da API (cota, temporária, autenticação, circuito aberto)
+        """
+        kind = WRITE if write else READ
+        worksheet = self.get(title)
+        try:
+            return self._call(kind, lambda: operation(worksheet))
+        except Exception as e:
+            if not _is_stale_handle_error(e):
+                raise
+            self.invalidate(title)
+            worksheet = self.get(title)
+            return self._call(kind, lambda: operation(worksheet))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas do registro"""
+        return {
+            "worksheets": sorted(self._worksheets),
+            "resolutions": int(self._resolutions.value),
+            "metadata_calls_saved": int(self._saved.value),
+            "invalidations": int(self._invalidations.value)
+        }
+
+
+def _is_stale_handle_error(error: Exception) -> bool:
+    """Verifica se o erro indica que o handle da aba não é mais válido"""
+    if isinstance(error, (WorksheetNotFound, SheetsNotFoundError)):
+        return True
+    if isinstance(error, APIError):
+        message = str(error)
+        return any(m in message for m in _STALE_HANDLE_MESSAGES)
+    return False
@@ -0,0 +1,564 @@
+"""
+Fila de gravação posterior (write-behind) das transações
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.metrics import get_metrics_registry
+
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class PendingWrite:
+    """
+    Alteração já aplicada ao snapshot em memória e ainda não gravada na planilha
+    
+    O row_index se refere à planilha após todas as alterações anteriores da
+    fila, ou seja, as alterações devem ser aplicadas na ordem em que entraram.
+    """
+    op: str
+    row_index: int
+    values: Optional[List[str]] = None
+    enqueued_at: float = field(default_factory=time.time)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PendingWrite":
+        """Reconstrói a alteração a partir de uma linha do journal"""
+        return cls(
+            op=data["op"],
+            row_index=int(data["row_index"]),
+            values=data.get("values"),
+            enqueued_at=float(data.get("enqueued_at") or time.time())
+        )
+
+
+@dataclass
+class FlushBatch:
+    """
+    Chamada à API montada a partir de uma sequência de alterações
+    
+    Attributes:
+        op: CREATE (append_rows), UPDATE (batch_update) ou DELETE (batchUpdate com deleteDimension)
+        rows: Linhas novas (CREATE), {row_index: valores} (UPDATE) ou índices originais (DELETE)
+        first_row: Linha esperada para a primeira linha nova (apenas CREATE)
+        consumed: Quantidade de alterações da fila concluídas quando a chamada tiver sucesso
+    """
+    op: str
+    rows: Any
+    first_row: Optional[int] = None
+    consumed: int = 0
+
+
+def plan_flush(writes: List[PendingWrite]) -> Tuple[List[FlushBatch], int]:
+    """
+    Agrupa as alterações pendentes no menor número de chamadas à API
+    
+    Inclusões e atualizações não deslocam linhas existentes, então uma
+    sequência delas vira no máximo um batch_update (edições da mesma linha
+    são combinadas, vale a última) e um append_rows (edições de linhas
+    recém-incluídas são aplicadas à própria inclusão). Remoções consecutivas
+    viram um único batchUpdate, com os índices convertidos para a planilha
+    anterior à primeira remoção.
+    
+    Args:
+        writes: Alterações na ordem da fila
+    
+    Returns:
+        Tupla (chamadas na ordem de execução, quantidade de alterações combinadas)
+    """
+    batches: List[FlushBatch] = []
+    coalesced = 0
+    updates: Dict[int, List[str]] = {}
+    creates: List[List[str]] = []
+    first_row: Optional[int] = None
+    deletes: List[int] = []
+    segment = 0
+    
+    def close_segment():
+        nonlocal updates, creates, first_row, segment
+        if updates:
+            batches.append(FlushBatch(UPDATE, updates))
+        if creates:
+            batches.append(FlushBatch(CREATE, creates, first_row=first_row))
+        if batches and segment:
+            # Todas as chamadas do segmento só liberam as alterações ao final
+            batches[-1].consumed = segment
+        updates, creates, first_row, segment = {}, [], None, 0
+    
+    def close_deletes():
+        nonlocal deletes, segment
+        if deletes:
+            batches.append(FlushBatch(DELETE, deletes, consumed=segment))
+        deletes, segment = [], 0
+    
+    for write in writes:
+        if write.op == DELETE:
+            if updates or creates:
+                close_segment()
+            # Converte para o índice da planilha antes das remoções anteriores do grupo
+            original = write.row_index
+            for removed in sorted(deletes):
+                if removed <= original:
+                    original += 1
+            deletes.append(original)
+            segment += 1
+            continue
+        
+        if deletes:
+            close_deletes()
+        if write.op == CREATE and creates and write.row_index != first_row + len(creates):
+            close_segment()
+        segment += 1
+        if write.op == CREATE:
+            if not creates:
+                first_row = write.row_index
+            creates.append(list(write.values))
+        elif creates and first_row <= write.row_index < first_row + len(creates):
+            creates[write.row_index - first_row] = list(write.values)
+            coalesced += 1
+        else:
+            if write.row_index in updates:
+                coalesced += 1
+            updates[write.row_index] = list(write.values)
+    
+    if deletes:
+        close_deletes()
+    else:
+        close_segment()
+    return batches, coalesced
+
+
+class WriteJournal:
+    """
+    Journal em arquivo (JSON lines) com as alterações pendentes
+    
+    Cada alteração é gravada (com fsync) antes de ser confirmada ao cliente;
+    após cada chamada bem-sucedida à API o arquivo é reescrito apenas com as
+    alterações restantes.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Inicializa o journal
+        
+        Args:
+            path: Caminho do arquivo (o diretório é criado se necessário)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def load(self) -> List[PendingWrite]:
+        """
+        Lê as alterações pendentes (ex: após um reinício)
+        
+        Uma última linha incompleta (gravação interrompida) é ignorada.
+        """
+        if not os.path.exists(self.path):
+            return []
+        writes = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    writes.append(PendingWrite.from_dict(json.loads(line)))
+                except (ValueError, KeyError) as e:
+                    print(f"Linha inválida no journal {self.path}: {e}")
+        return writes
+    
+    def append(self, writes: List[PendingWrite]):
+        """Acrescenta alterações ao final do journal"""
+        with open(self.path, "a", encoding="utf-8") as f:
+            for write in writes:
+                f.write(json.dumps(asdict(write), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def rewrite(self, writes: List[PendingWrite]):
+        """Substitui o journal pelas alterações restantes (troca atômica do arquivo)"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for write in writes:
+                f.write(json.dumps(asdict(write), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class WriteBehindQueue:
+    """
+    Fila de alterações gravadas na planilha por uma thread em segundo plano
+    
+    As alterações entram na fila já aplicadas ao snapshot em memória. A cada
+    `flush_interval_seconds` a thread agrupa as pendentes (ver `plan_flush`) e
+    as grava com uma chamada por grupo. Em caso de erro as alterações
+    permanecem na fila (e no journal) e são tentadas novamente no próximo ciclo.
+    
+    Se a planilha divergir do snapshot (linhas incluídas em outra posição), a
+    gravação para na primeira divergência: as alterações seguintes usam
+    índices previstos a partir do snapshot e poderiam atingir as linhas
+    erradas. Elas são deslocadas para a posição real das inclusões e ficam
+    retidas até que `on_conflict` releia a planilha e as confirme ou descarte
+    (ver `resolve`).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        append_rows: Callable[[List[List[str]]], Optional[Tuple[int, int]]],
+        update_rows: Callable[[Dict[int, List[str]]], Any],
+        delete_rows: Callable[[List[int]], Any],
+        journal_path: str,
+        flush_interval_seconds: float = 2.0,
+        on_conflict: Optional[Callable[[], None]] = None
+    ):
+        """
+        Inicializa a fila e recupera as alterações do journal
+        
+        Args:
+            name: Nome da fila (usado nas métricas)
+            append_rows: Inclui linhas no final da aba e retorna (primeira, última) linha gravada
+            update_rows: Grava os valores de várias linhas ({row_index: valores})
+            delete_rows: Remove várias linhas (índices da planilha antes da remoção)
+            journal_path: Caminho do journal em arquivo
+            flush_interval_seconds: Intervalo entre as gravações em segundo plano
+            on_conflict: Chamada quando a planilha diverge do snapshot; deve reler a
+                planilha e chamar `resolve` com as alterações pendentes compatíveis
+        """
+        self.name = name
+        self.flush_interval_seconds = flush_interval_seconds
+        self._append_rows = append_rows
+        self._update_rows = update_rows
+        self._delete_rows = delete_rows
+        self._on_conflict = on_conflict
+        self._journal = WriteJournal(journal_path)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.RLock()
+        self._pending: List[PendingWrite] = self._journal.load()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_flush_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        # Após uma divergência, nada é gravado até as pendentes serem revistas (ver `resolve`)
+        self._resolve_required = False
+        
+        registry = get_metrics_registry()
+        labels = {"queue": name}
+        self._enqueued = registry.counter("write_behind_enqueued_total", "Alterações enfileiradas", labels)
+        self._flushed = registry.counter("write_behind_flushed_total", "Alterações gravadas na planilha", labels)
+        self._coalesced = registry.counter(
+            "write_behind_coalesced_total",
+            "Alterações combinadas com outra da mesma linha antes da gravação",
+            labels
+        )
+        self._api_calls = registry.counter("write_behind_api_calls_total", "Chamadas de gravação à API", labels)
+        self._failures = registry.counter("write_behind_flush_failures_total", "Gravações que falharam", labels)
+        self._conflicts = registry.counter(
+            "write_behind_conflicts_total",
+            "Gravações interrompidas porque a planilha divergiu do snapshot",
+            labels
+        )
+        self._rejected = registry.counter(
+            "write_behind_rejected_total",
+            "Alterações descartadas por serem incompatíveis com a planilha relida",
+            labels
+        )
+        registry.gauge("write_behind_pending", "Alterações aguardando gravação", labels, reader=lambda: len(self._pending))
+        registry.gauge(
+            "write_behind_lag_seconds",
+            "Idade da alteração pendente mais antiga",
+            labels,
+            reader=self.lag_seconds
+        )
+        if self._pending:
+            print(f"Write-behind ({name}): {len(self._pending)} alterações recuperadas do journal")
+    
+    def start(self):
+        """Inicia a thread de gravação (idempotente)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"write-behind-{self.name}", daemon=True)
+            self._thread.start()
+    
+    def stop(self, flush: bool = True):
+        """
+        Encerra a thread de gravação
+        
+        Args:
+            flush: Se True, grava as alterações pendentes antes de retornar
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+        self._wakeup.set()
+        if thread is not None:
+            thread.join()
+        if flush:
+            self.flush()
+    
+    def _run(self):
+        """Laço da thread: grava as pendentes a cada intervalo"""
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            if self._pending:
+                self.flush()
+    
+    def enqueue(self, writes: List[PendingWrite]):
+        """
+        Registra alterações no journal e na fila
+        
+        Args:
+            writes: Alterações já aplicadas ao snapshot, na ordem de aplicação
+        """
+        if not writes:
+            return
+        with self._lock:
+            self._journal.append(writes)
+            self._pending.extend(writes)
+        self._enqueued.inc(len(writes))
+    
+    def pending(self) -> List[PendingWrite]:
+        """Cópia das alterações ainda não gravadas, na ordem da fila"""
+        with self._lock:
+            return list(self._pending)
+    
+    def paused(self):
+        """
+        Impede gravações enquanto o bloco executa (ex: recarregar o snapshot)
+        
+        Garante que a leitura da planilha e as alterações pendentes reaplicadas
+        sobre ela correspondem ao mesmo momento.
+        """
+        return self._flush_lock
+    
+    def lag_seconds(self) -> float:
+        """Idade da alteração pendente mais antiga (0 se a fila estiver vazia)"""
+        pending = self._pending
+        if not pending:
+            return 0.0
+        return max(0.0, time.time() - pending[0].enqueued_at)
+    
+    def flush(self) -> Dict[str, Any]:
+        """
+        Grava as alterações pendentes na planilha
+        
+        Returns:
+            Estatísticas da fila após a gravação
+        """
+        with self._flush_lock:
+            writes = self.pending()
+            if not writes:
+                return self.stats()
+            
+            conflict = self._resolve_required
+            if not conflict:
+                conflict = self._flush_batches(writes)
+        
+        # Fora do lock de gravação: o callback pode precisar do lock do cache,
+        # que é mantido durante o recarregamento (que por sua vez pausa as gravações)
+        if conflict and self._on_conflict is not None:
+            self._on_conflict()
+        return self.stats()
+    
+    def _flush_batches(self, writes: List[PendingWrite]) -> bool:
+        """
+        Executa as chamadas das alterações pendentes até a primeira divergência
+        
+        Args:
+            writes: Alterações pendentes, na ordem da fila
+        
+        Returns:
+            True se a planilha divergiu do snapshot
+        """
+        batches, coalesced = plan_flush(writes)
+        self._coalesced.inc(coalesced)
+        done = 0
+        try:
+            for batch in batches:
+                shift = self._execute(batch)
+                self._api_calls.inc()
+                if batch.consumed:
+                    done += batch.consumed
+                    self._release(batch.consumed)
+                if shift != 0:
+                    # As chamadas seguintes usam posições previstas a partir do
+                    # snapshot: não são feitas antes de as pendentes serem revistas
+                    self._conflicts.inc()
+                    self._hold_after_conflict(batch.first_row, shift)
+                    return True
+            self._last_error = None
+        except Exception as e:
+            self._failures.inc()
+            self._last_error = str(e)
+            print(f"Erro ao gravar alterações pendentes ({self.name}): {e}")
+        finally:
+            self._flushed.inc(done)
+            self._last_flush_at = time.time()
+        return False
+    
+    def _execute(self, batch: FlushBatch) -> Optional[int]:
+        """
+        Executa a chamada à API de um grupo
+        
+        Returns:
+            Deslocamento das linhas incluídas em relação à posição prevista: 0
+            se a planilha corresponde ao snapshot, None se a posição é desconhecida
+        """
+        if batch.op == UPDATE:
+            self._update_rows(batch.rows)
+        elif batch.op == DELETE:
+            self._delete_rows(batch.rows)
+        else:
+            rows = self._append_rows(batch.rows)
+            if rows is None or rows[0] != batch.first_row:
+                # Ex: linhas incluídas manualmente na planilha enquanto havia pendências
+                print(f"Write-behind ({self.name}): linhas incluídas em {rows}, esperado a partir de {batch.first_row}")
+                return None if rows is None else rows[0] - batch.first_row
+        return 0
+    
+    def _hold_after_conflict(self, first_row: int, shift: Optional[int]):
+        """
+        Retém as alterações restantes após uma divergência
+        
+        As linhas a partir de `first_row` só existiam no snapshot por causa das
+        inclusões pendentes. Com o deslocamento conhecido, as alterações que as
+        referenciam passam a apontar para a posição em que foram gravadas (o
+        limite acompanha as remoções anteriores da fila); sem ele, as que não
+        são inclusões são descartadas.
+        
+        Args:
+            first_row: Linha prevista para a primeira inclusão
+            shift: Diferença entre a linha real e a prevista (None se desconhecida)
+        """
+        with self._lock:
+            boundary = first_row
+            rebased: List[PendingWrite] = []
+            for write in self._pending:
+                row_index = write.row_index
+                if row_index >= boundary:
+                    if shift is None and write.op != CREATE:
+                        self._rejected.inc()
+                        print(f"Write-behind ({self.name}): alteração descartada após divergência: {write}")
+                        continue
+                    write = replace(write, row_index=row_index + (shift or 0))
+                elif write.op == DELETE:
+                    boundary -= 1
+                rebased.append(write)
+            if rebased != self._pending:
+                self._pending = rebased
+                self._journal.rewrite(self._pending)
+            self._resolve_required = self._on_conflict is not None
+    
+    def resolve(self, reviewed: List[PendingWrite], kept: List[PendingWrite]):
+        """
+        Confirma as alterações pendentes revistas contra uma leitura nova da planilha
+        
+        Chamado após reaplicar as pendentes sobre a planilha relida (com as
+        gravações pausadas): as incompatíveis são descartadas e, após uma
+        divergência, as gravações são liberadas.
+        
+        Args:
+            reviewed: Alterações pendentes no momento da leitura (`pending()`)
+            kept: As que puderam ser aplicadas, na mesma ordem
+        """
+        with self._lock:
+            if self._pending[:len(reviewed)] != reviewed:
+                # A fila mudou durante a revisão: a próxima leitura revê de novo
+                return
+            rejected = len(reviewed) - len(kept)
+            if rejected:
+                self._pending = list(kept) + self._pending[len(reviewed):]
+                self._journal.rewrite(self._pending)
+                self._rejected.inc(rejected)
+            self._resolve_required = False
+    
+    def _release(self, count: int):
+        """Remove da fila e do journal as alterações já gravadas"""
+        with self._lock:
+            del self._pending[:count]
+            self._journal.rewrite(self._pending)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas da fila"""
+        return {
+            "pending": len(self._pending),
+            "lag_seconds": round(self.lag_seconds(), 3),
+            "enqueued": int(self._enqueued.value),
+            "flushed": int(self._flushed.value),
+            "coalesced": int(self._coalesced.value),
+            "api_calls": int(self._api_calls.value),
+            "failures": int(self._failures.value),
+            "conflicts": int(self._conflicts.value),
+            "rejected": int(self._rejected.value),
+            "held": self._resolve_required,
+            "last_flush_at": self._last_flush_at,
+            "last_error": self._last_error
+        }
+
+
+_queues: Dict[str, WriteBehindQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def register_write_behind_queue(queue: WriteBehindQueue) -> WriteBehindQueue:
+    """Registra a fila para `flush_write_behind_queues` e inicia sua thread"""
+    with _queues_lock:
+        _queues[queue.name] = queue
+    queue.start()
+    return queue
+
+
+def flush_write_behind_queues() -> Dict[str, Dict[str, Any]]:
+    """
+    Grava imediatamente as alterações pendentes de todas as filas
+    
+    Returns:
+        Estatísticas de cada fila após a gravação
+    """
+    with _queues_lock:
+        queues = list(_queues.values())
+    return {queue.name: queue.flush() for queue in queues}
+
+
+def stop_write_behind_queues():
+    """Encerra as threads de gravação gravando as alterações pendentes"""
+    with _queues_lock:
+        queues = list(_queues.values())
+    for queue in queues:
+        queue.stop(flush=True)
+
+
+def apply_write(ledger, write: PendingWrite, to_entity: Callable[[List[str], int], Any]):
+    """
+    Aplica uma alteração pendente a um extrato (Ledger)
+    
+    Args:
+        ledger: Extrato indexado
+        write: Alteração a aplicar
+        to_entity: Converte (valores, row_index) na entidade do extrato
+    
+    Returns:
+        O extrato, ou None se ele não estiver em um estado compatível
+    """
+    if write.op == CREATE:
+        return ledger.append(to_entity(write.values, write.row_index))
+    if write.op == UPDATE:
+        return ledger.replace(to_entity(write.values, write.row_index))
+    return ledger.remove(write.row_index)
@@ -1,9 +1,73 @@
 """
 Entidades de domínio - Representam os conceitos de negócio
 """
-from dataclasses import dataclass
-from typing import Optional
-from datetime import datetime
+import unicodedata
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import List, Optional
+from datetime import date
+
+
+def parse_data(data_str: Optional[str]) -> Optional[date]:
+    """
+    Converte uma data no formato DD/MM/YYYY
+    
+    Args:
+        data_str: String da data
+    
+    Returns:
+        Objeto date ou None se a data for inválida
+    """
+    if not data_str:
+        return None
+    partes = data_str.strip().split("/")
+    if len(partes) != 3 or not all(p.isdigit() for p in partes) or len(partes[2]) != 4:
+        return None
+    try:
+        return date(int(partes[2]), int(partes[1]), int(partes[0]))
+    except ValueError:
+        return None
+
+
+def parse_valor_centavos(valor_str: Optional[str]) -> int:
+    """
+    Converte um valor monetário formatado (ex: "R$ 1.234,56") em centavos
+    
+    Args:
+        valor_str: String do valor
+    
+    Returns:
+        Valor em centavos (0 se o valor for inválido)
+    """
+    if not valor_str:
+        return 0
+    # Remove R$, espaços e separador de milhar; vírgula vira ponto decimal
+    clean = (
+        valor_str.replace("R$", "").replace(" ", "").replace("\xa0", "")
+        .replace(".", "").replace(",", ".")
+    )
+    try:
+        return int((Decimal(clean) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError, OverflowError):
+        return 0
+
+
+def normalizar_busca(texto: Optional[str]) -> str:
+    """
+    Normaliza um texto para buscas sem diferenciar maiúsculas nem acentos
+    
+    Args:
+        texto: Texto original (ex: "Alimentação")
+    
+    Returns:
+        Texto em minúsculas e sem acentos (ex: "alimentacao")
+    """
+    if not texto:
+        return ""
+    if texto.isascii():
+        return texto.lower()
+    decomposto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
 
 
 @dataclass
@@ -20,12 +84,29 @@ class Transacao:
     conta: str
     detalhes: Optional[str] = None
     row_index: Optional[int] = None  # Índice da linha na planilha (>= 2)
+    # Chaves tipadas para filtro/ordenação, calculadas uma única vez na criação
+    data_ordenacao: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    valor_centavos: int = field(default=0, init=False, repr=False, compare=False)
+    # Campos de texto normalizados (minúsculas) usados pelos filtros e ordenações
+    tipo_lower: str = field(default="", init=False, repr=False, compare=False)
+    descritivo_lower: str = field(default="", init=False, repr=False, compare=False)
+    descritivo_busca: str = field(default="", init=False, repr=False, compare=False)
+    mes_lower: str = field(default="", init=False, repr=False, compare=False)
+    situacao_lower: str = field(default="", init=False, repr=False, compare=False)
+    conta_lower: str = field(default="", init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validações básicas da entidade"""
         # Remove validações muito restritivas - permitir dados vazios da planilha
         # Se precisar de validação, fazer na camada de API/Use Cases
-        pass
+        self.data_ordenacao = parse_data(self.data)
+        self.valor_centavos = parse_valor_centavos(self.valor)
+        self.tipo_lower = (self.tipo or "").lower()
+        self.descritivo_lower = (self.descritivo or "").lower()
+        self.descritivo_busca = normalizar_busca(self.descritivo)
+        self.mes_lower = (self.mes or "").lower()
+        self.situacao_lower = (self.situacao or "").lower()
+        self.conta_lower = (self.conta or "").lower()
     
     def is_valid(self) -> bool:
         """Verifica se a transação tem os dados mínimos necessários"""
@@ -112,6 +193,28 @@ class Mes:
         return {"nome": self.nome}
 
 
+@dataclass
+class Configuracoes:
+    """
+    Entidade que agrega todas as listas da aba de configurações
+    """
+    categorias: List[Categoria] = field(default_factory=list)
+    status: List[Status] = field(default_factory=list)
+    meses: List[Mes] = field(default_factory=list)
+    contas: List[Conta] = field(default_factory=list)
+    cartoes: List[Cartao] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """Converte a entidade para dicionário"""
+        return {
+            "categorias": [c.to_dict() for c in self.categorias],
+            "status": [s.to_dict() for s in self.status],
+            "meses": [m.to_dict() for m in self.meses],
+            "contas": [c.to_dict() for c in self.contas],
+            "cartoes": [c.to_dict() for c in self.cartoes]
+        }
+
+
 @dataclass
 class TransacaoCredito:
     """
@@ -126,10 +229,27 @@ class TransacaoCredito:
     cartao: str
     detalhes: Optional[str] = None
     row_index: Optional[int] = None  # Índice da linha na planilha (>= 2)
+    # Chaves tipadas para filtro/ordenação, calculadas uma única vez na criação
+    data_ordenacao: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    valor_centavos: int = field(default=0, init=False, repr=False, compare=False)
+    # Campos de texto normalizados (minúsculas) usados pelos filtros e ordenações
+    tipo_lower: str = field(default="", init=False, repr=False, compare=False)
+    descritivo_lower: str = field(default="", init=False, repr=False, compare=False)
+    descritivo_busca: str = field(default="", init=False, repr=False, compare=False)
+    mes_lower: str = field(default="", init=False, repr=False, compare=False)
+    situacao_lower: str = field(default="", init=False, repr=False, compare=False)
+    cartao_lower: str = field(default="", init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validações básicas da entidade"""
-        pass
+        self.data_ordenacao = parse_data(self.data)
+        self.valor_centavos = parse_valor_centavos(self.valor)
+        self.tipo_lower = (self.tipo or "").lower()
+        self.descritivo_lower = (self.descritivo or "").lower()
+        self.descritivo_busca = normalizar_busca(self.descritivo)
+        self.mes_lower = (self.mes or "").lower()
+        self.situacao_lower = (self.situacao or "").lower()
+        self.cartao_lower = (self.cartao or "").lower()
     
     def is_valid(self) -> bool:
         """Verifica se a transação tem os dados mínimos necessários"""
@@ -153,28 +273,32 @@ class TransacaoCredito:
 
 
 @dataclass
-class Saldo:
+class SaldoConta:
     """
-    Entidade que representa o saldo geral
+    Entidade que representa o saldo de uma conta
     """
-    valor: str
+    conta: str
+    saldo: str
     
     def to_dict(self) -> dict:
         """Converte a entidade para dicionário"""
-        return {"valor": self.valor}
+        return {
+            "conta": self.conta,
+            "saldo": self.saldo
+        }
 
 
 @dataclass
-class SaldoConta:
+class Saldos:
     """
-    Entidade que representa o saldo de uma conta
+    Entidade que agrega o saldo geral e o saldo de cada conta
     """
-    conta: str
-    saldo: str
+    valor: str
+    contas: List[SaldoConta] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         """Converte a entidade para dicionário"""
         return {
-            "conta": self.conta,
-            "saldo": self.saldo
+            "valor": self.valor,
+            "contas": [c.to_dict() for c in self.contas]
         }
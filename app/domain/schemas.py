@@ -2,7 +2,7 @@
 Schemas - Modelos de entrada/saída da API (DTOs)
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 
 class TransacaoSchema(BaseModel):
@@ -124,6 +124,7 @@ class PaginatedResponse(BaseModel):
     page_size: int = Field(..., description="Tamanho da página")
     total_pages: int = Field(..., description="Total de páginas")
     items: List[TransacaoSchema] = Field(..., description="Lista de transações")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (apenas no modo cursor; nulo na última página)")
 
     class Config:
         json_schema_extra = {
@@ -132,16 +133,108 @@ class PaginatedResponse(BaseModel):
                 "page": 1,
                 "page_size": 10,
                 "total_pages": 10,
-                "items": []
+                "items": [],
+                "next_cursor": None
             }
         }
 
 
+class BatchCreateTransacaoRequest(BaseModel):
+    """Schema para criar várias transações em lote"""
+    itens: List[CreateTransacaoRequest] = Field(..., min_length=1, max_length=1000, description="Transações a criar (máximo 1000)")
+
+
+class BatchTransacaoResultado(BaseModel):
+    """Resultado de um item de uma criação/atualização em lote"""
+    index: int = Field(..., description="Posição do item na requisição")
+    sucesso: bool = Field(..., description="Se o item foi gravado")
+    row_index: Optional[int] = Field(None, description="Linha gravada na planilha")
+    transacao: Optional[TransacaoSchema] = Field(None, description="Transação criada")
+    erro: Optional[str] = Field(None, description="Motivo da falha")
+
+
+class BatchCreateTransacaoResponse(BaseModel):
+    """Resposta da criação em lote"""
+    total: int = Field(..., description="Total de itens recebidos")
+    criadas: int = Field(..., description="Itens gravados")
+    falhas: int = Field(..., description="Itens rejeitados ou não gravados")
+    resultados: List[BatchTransacaoResultado] = Field(..., description="Resultado de cada item, na ordem da requisição")
+
+
+class BatchUpdateTransacaoItem(UpdateTransacaoRequest):
+    """Item de uma atualização em lote"""
+    row_index: int = Field(..., description="Índice da linha na planilha (>= 2)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "row_index": 2,
+                "tipo": "Despesa",
+                "descritivo": "Supermercado",
+                "valor": "R$ 150,00",
+                "data": "31/12/2025",
+                "mes": "Dezembro",
+                "detalhes": "Compras mensais",
+                "situacao": "Pago",
+                "conta": "Conta Corrente"
+            }
+        }
+
+
+class BatchUpdateTransacaoRequest(BaseModel):
+    """Schema para atualizar várias transações em lote"""
+    itens: List[BatchUpdateTransacaoItem] = Field(..., min_length=1, max_length=1000, description="Transações a atualizar (máximo 1000)")
+
+
+class BatchUpdateTransacaoResponse(BaseModel):
+    """Resposta da atualização em lote"""
+    total: int = Field(..., description="Total de itens recebidos")
+    atualizadas: int = Field(..., description="Itens gravados")
+    falhas: int = Field(..., description="Itens rejeitados")
+    resultados: List[BatchTransacaoResultado] = Field(..., description="Resultado de cada item, na ordem da requisição")
+
+
+class BatchDeleteRequest(BaseModel):
+    """Schema para deletar várias linhas em lote"""
+    row_indexes: List[int] = Field(..., min_length=1, max_length=1000, description="Índices das linhas a deletar (máximo 1000)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "row_indexes": [12, 5, 13]
+            }
+        }
+
+
+class BatchDeleteResultado(BaseModel):
+    """Resultado de uma linha da remoção em lote"""
+    row_index: int = Field(..., description="Índice da linha informada")
+    sucesso: bool = Field(..., description="Se a linha foi deletada")
+    erro: Optional[str] = Field(None, description="Motivo da falha")
+
+
+class BatchDeleteResponse(BaseModel):
+    """Resposta da remoção em lote"""
+    total: int = Field(..., description="Total de linhas recebidas")
+    deletadas: int = Field(..., description="Linhas deletadas")
+    falhas: int = Field(..., description="Linhas rejeitadas")
+    resultados: List[BatchDeleteResultado] = Field(..., description="Resultado de cada linha, na ordem da requisição")
+
+
 class HealthCheckResponse(BaseModel):
     """Resposta do health check"""
     status: str = Field(..., description="Status da API")
     google_sheets: str = Field(..., description="Status da conexão com Google Sheets")
     error: Optional[str] = Field(None, description="Mensagem de erro, se houver")
+    checks: Optional[Dict[str, Any]] = Field(None, description="Detalhes da verificação")
+    checked_at: Optional[str] = Field(None, description="Momento da última verificação (UTC)")
+    cached: Optional[bool] = Field(None, description="Indica se o resultado veio da última verificação em cache")
+
+
+class LivenessResponse(BaseModel):
+    """Resposta do liveness check"""
+    status: str = Field(..., description="Status do processo")
+    version: str = Field(..., description="Versão da API")
 
 
 # ==================== SCHEMAS DE TRANSAÇÕES DE CRÉDITO ====================
@@ -259,6 +352,7 @@ class PaginatedCreditoResponse(BaseModel):
     page_size: int = Field(..., description="Tamanho da página")
     total_pages: int = Field(..., description="Total de páginas")
     items: List[TransacaoCreditoSchema] = Field(..., description="Lista de transações de crédito")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (apenas no modo cursor; nulo na última página)")
 
     class Config:
         json_schema_extra = {
@@ -267,11 +361,67 @@ class PaginatedCreditoResponse(BaseModel):
                 "page": 1,
                 "page_size": 10,
                 "total_pages": 10,
-                "items": []
+                "items": [],
+                "next_cursor": None
             }
         }
 
 
+class BatchCreateTransacaoCreditoRequest(BaseModel):
+    """Schema para criar várias transações de crédito em lote"""
+    itens: List[CreateTransacaoCreditoRequest] = Field(..., min_length=1, max_length=1000, description="Transações de crédito a criar (máximo 1000)")
+
+
+class BatchTransacaoCreditoResultado(BaseModel):
+    """Resultado de um item de uma criação/atualização em lote"""
+    index: int = Field(..., description="Posição do item na requisição")
+    sucesso: bool = Field(..., description="Se o item foi gravado")
+    row_index: Optional[int] = Field(None, description="Linha gravada na planilha")
+    transacao: Optional[TransacaoCreditoSchema] = Field(None, description="Transação criada")
+    erro: Optional[str] = Field(None, description="Motivo da falha")
+
+
+class BatchCreateTransacaoCreditoResponse(BaseModel):
+    """Resposta da criação em lote"""
+    total: int = Field(..., description="Total de itens recebidos")
+    criadas: int = Field(..., description="Itens gravados")
+    falhas: int = Field(..., description="Itens rejeitados ou não gravados")
+    resultados: List[BatchTransacaoCreditoResultado] = Field(..., description="Resultado de cada item, na ordem da requisição")
+
+
+class BatchUpdateTransacaoCreditoItem(UpdateTransacaoCreditoRequest):
+    """Item de uma atualização em lote"""
+    row_index: int = Field(..., description="Índice da linha na planilha (>= 2)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "row_index": 2,
+                "tipo": "Despesa",
+                "descritivo": "Restaurante",
+                "valor": "R$ 85,00",
+                "data": "31/12/2025",
+                "mes": "Dezembro",
+                "detalhes": "Almoço",
+                "situacao": "Pago",
+                "cartao": "Nubank"
+            }
+        }
+
+
+class BatchUpdateTransacaoCreditoRequest(BaseModel):
+    """Schema para atualizar várias transações de crédito em lote"""
+    itens: List[BatchUpdateTransacaoCreditoItem] = Field(..., min_length=1, max_length=1000, description="Transações de crédito a atualizar (máximo 1000)")
+
+
+class BatchUpdateTransacaoCreditoResponse(BaseModel):
+    """Resposta da atualização em lote"""
+    total: int = Field(..., description="Total de itens recebidos")
+    atualizadas: int = Field(..., description="Itens gravados")
+    falhas: int = Field(..., description="Itens rejeitados")
+    resultados: List[BatchTransacaoCreditoResultado] = Field(..., description="Resultado de cada item, na ordem da requisição")
+
+
 # ==================== SCHEMAS DE CONFIGURAÇÕES ====================
 
 class CategoriaSchema(BaseModel):
@@ -355,6 +505,15 @@ class UpdateCartaoRequest(BaseModel):
     nome: str = Field(..., min_length=1, description="Novo nome do cartão")
 
 
+class ConfiguracoesResponse(BaseModel):
+    """Resposta com todas as configurações"""
+    categorias: List[CategoriaSchema] = Field(..., description="Categorias (coluna A)")
+    status: List[StatusSchema] = Field(..., description="Status de receita (coluna B) e de despesa (coluna C)")
+    meses: List[MesSchema] = Field(..., description="Meses (coluna G)")
+    contas: List[ContaSchema] = Field(..., description="Contas (coluna D)")
+    cartoes: List[CartaoSchema] = Field(..., description="Cartões (coluna E)")
+
+
 class SuccessResponse(BaseModel):
     """Resposta de sucesso genérica"""
     message: str = Field(..., description="Mensagem de sucesso")
@@ -367,25 +526,57 @@ class SuccessResponse(BaseModel):
 
 # ==================== SCHEMAS DE SALDOS ====================
 
-class SaldoSchema(BaseModel):
-    """Schema do saldo geral"""
+class SaldoContaSchema(BaseModel):
+    """Schema do saldo por conta"""
+    conta: str = Field(..., description="Nome da conta")
+    saldo: str = Field(..., description="Saldo da conta")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "conta": "Conta Corrente",
+                "saldo": "R$ 2.543,50"
+            }
+        }
+
+
+class SaldosResponse(BaseModel):
+    """Resposta com o saldo geral e o saldo de cada conta"""
     valor: str = Field(..., description="Valor do saldo geral")
+    contas: List[SaldoContaSchema] = Field(..., description="Saldo de cada conta")
     
     class Config:
         json_schema_extra = {
-            "example": {"valor": "R$ 5.432,10"}
+            "example": {
+                "valor": "R$ 5.432,10",
+                "contas": [{"conta": "Conta Corrente", "saldo": "R$ 2.543,50"}]
+            }
         }
 
 
-class SaldoContaSchema(BaseModel):
-    """Schema do saldo por conta"""
-    conta: str = Field(..., description="Nome da conta")
-    saldo: str = Field(..., description="Saldo da conta")
+# ==================== SCHEMAS DE ADMINISTRAÇÃO ====================
+
+class WriteBehindFlushResponse(BaseModel):
+    """Resposta da gravação das alterações pendentes"""
+    enabled: bool = Field(..., description="Se o modo write-behind está habilitado")
+    queues: Dict[str, Dict[str, Any]] = Field(..., description="Estatísticas de cada fila após a gravação")
     
     class Config:
         json_schema_extra = {
             "example": {
-                "conta": "Conta Corrente",
-                "saldo": "R$ 2.543,50"
+                "enabled": True,
+                "queues": {
+                    "transacoes": {
+                        "pending": 0,
+                        "lag_seconds": 0.0,
+                        "enqueued": 12,
+                        "flushed": 12,
+                        "coalesced": 5,
+                        "api_calls": 3,
+                        "failures": 0,
+                        "last_flush_at": 1767225600.0,
+                        "last_error": None
+                    }
+                }
             }
         }
@@ -11,9 +11,8 @@ class AtualizarTransacaoCredito:
     def __init__(self, repository: TransacaoCreditoRepositoryInterface):
         self.repository = repository
     
-    def execute(
+    def build_transacao(
         self,
-        row_index: int,
         tipo: str,
         descritivo: str,
         valor: str,
@@ -24,10 +23,9 @@ class AtualizarTransacaoCredito:
         cartao: str
     ) -> TransacaoCredito:
         """
-        Atualiza uma transação de crédito
+        Valida os novos dados e monta a entidade, sem gravá-la
         
         Args:
-            row_index: Índice da linha na planilha (>= 2)
             tipo: Tipo da transação (RECEITA ou DESPESA)
             descritivo: Descrição/categoria da transação
             valor: Valor formatado (ex: R$ 85,00)
@@ -38,7 +36,10 @@ class AtualizarTransacaoCredito:
             cartao: Cartão relacionado
             
         Returns:
-            TransacaoCredito: Entidade atualizada
+            TransacaoCredito: Entidade validada
+        
+        Raises:
+            ValueError: Se algum campo obrigatório estiver vazio
         """
         # Validações básicas
         if not tipo or tipo.strip() == "":
@@ -74,5 +75,47 @@ class AtualizarTransacaoCredito:
             cartao=cartao
         )
         
+        return transacao
+    
+    def execute(
+        self,
+        row_index: int,
+        tipo: str,
+        descritivo: str,
+        valor: str,
+        data: str,
+        mes: str,
+        detalhes: str,
+        situacao: str,
+        cartao: str
+    ) -> TransacaoCredito:
+        """
+        Atualiza uma transação de crédito
+        
+        Args:
+            row_index: Índice da linha na planilha (>= 2)
+            tipo: Tipo da transação (RECEITA ou DESPESA)
+            descritivo: Descrição/categoria da transação
+            valor: Valor formatado (ex: R$ 85,00)
+            data: Data no formato DD/MM/YYYY
+            mes: Mês por extenso (ex: Janeiro, Dezembro)
+            detalhes: Detalhes adicionais
+            situacao: Situação da transação
+            cartao: Cartão relacionado
+        
+        Returns:
+            TransacaoCredito: Entidade atualizada
+        """
+        transacao = self.build_transacao(
+            tipo=tipo,
+            descritivo=descritivo,
+            valor=valor,
+            data=data,
+            mes=mes,
+            detalhes=detalhes,
+            situacao=situacao,
+            cartao=cartao
+        )
+        
         # Delega para o repositório
         return self.repository.update(row_index, transacao)
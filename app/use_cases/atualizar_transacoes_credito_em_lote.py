@@ -0,0 +1,87 @@
+"""
+Use Case: Atualizar várias transações de crédito em lote
+"""
+from typing import Any, Dict, List
+from app.data.repositories.transacao_credito_repository_interface import TransacaoCreditoRepositoryInterface
+from app.use_cases.atualizar_transacao_credito import AtualizarTransacaoCredito
+
+
+class AtualizarTransacoesCreditoEmLote:
+    """
+    Caso de uso para atualizar várias transações de crédito com uma única gravação
+    """
+    
+    def __init__(self, repository: TransacaoCreditoRepositoryInterface):
+        """
+        Inicializa o caso de uso com um repositório
+        
+        Args:
+            repository: Repositório de transações de crédito
+        """
+        self.repository = repository
+        self._atualizar = AtualizarTransacaoCredito(repository)
+    
+    def execute(self, itens: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Executa o caso de uso
+        
+        Cada item é validado pelas mesmas regras da atualização individual.
+        Itens inválidos, com linha repetida ou com linha inexistente são
+        reportados sem impedir a gravação dos demais.
+        
+        Args:
+            itens: Lista de dicionários com row_index e os campos da atualização individual
+        
+        Returns:
+            Dicionário com os totais e o resultado de cada item (na ordem de entrada)
+        """
+        if not itens:
+            raise ValueError("Informe ao menos uma transação")
+        
+        resultados: List[Dict[str, Any]] = [None] * len(itens)
+        validas = []
+        posicoes = []
+        linhas = set()
+        for index, item in enumerate(itens):
+            dados = dict(item)
+            row_index = dados.pop("row_index")
+            try:
+                if row_index < 2:
+                    raise ValueError("Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)")
+                if row_index in linhas:
+                    raise ValueError(f"Linha {row_index} repetida no lote")
+                validas.append((row_index, self._atualizar.build_transacao(**dados)))
+                linhas.add(row_index)
+                posicoes.append(index)
+            except ValueError as e:
+                resultados[index] = _resultado(index, row_index, erro=str(e))
+        
+        # Todas as linhas válidas seguem em uma única operação do repositório;
+        # as que não existem no extrato não são gravadas e viram falhas do item
+        if validas:
+            atualizadas = {transacao.row_index: transacao for transacao in self.repository.update_many(validas)}
+            for index, (row_index, _) in zip(posicoes, validas):
+                transacao = atualizadas.get(row_index)
+                if transacao is None:
+                    resultados[index] = _resultado(index, row_index, erro=f"Linha {row_index} não encontrada")
+                else:
+                    resultados[index] = _resultado(index, row_index, transacao=transacao)
+        
+        atualizadas_total = sum(1 for r in resultados if r["sucesso"])
+        return {
+            "total": len(itens),
+            "atualizadas": atualizadas_total,
+            "falhas": len(itens) - atualizadas_total,
+            "resultados": resultados
+        }
+
+
+def _resultado(index: int, row_index: int, transacao=None, erro: str = None) -> Dict[str, Any]:
+    """Monta o resultado de um item do lote"""
+    return {
+        "index": index,
+        "sucesso": erro is None,
+        "row_index": row_index,
+        "transacao": transacao,
+        "erro": erro
+    }
@@ -3,7 +3,20 @@ Use Cases para gerenciamento de configurações
 """
 from typing import List
 from app.data.repositories.configuracao_repository_interface import ConfiguracaoRepositoryInterface
-from app.domain.entities import Categoria, Status, Conta, Cartao, Mes
+from app.domain.entities import Categoria, Status, Conta, Cartao, Mes, Configuracoes
+
+
+# ==================== TODAS AS CONFIGURAÇÕES ====================
+
+class ListarConfiguracoes:
+    """Caso de uso para listar todas as configurações de uma só vez"""
+    
+    def __init__(self, repository: ConfiguracaoRepositoryInterface):
+        self.repository = repository
+    
+    def execute(self) -> Configuracoes:
+        """Executa o caso de uso"""
+        return self.repository.get_all_configuracoes()
 
 
 # ==================== CATEGORIAS ====================
@@ -19,7 +19,7 @@ class CriarTransacao:
         """
         self.repository = repository
     
-    def execute(
+    def build_transacao(
         self,
         tipo: str,
         descritivo: str,
@@ -31,7 +31,7 @@ class CriarTransacao:
         detalhes: str = ""
     ) -> Transacao:
         """
-        Executa o caso de uso
+        Valida os dados e monta a entidade, sem gravá-la
         
         Args:
             tipo: Tipo da transação
@@ -44,7 +44,10 @@ class CriarTransacao:
             detalhes: Detalhes adicionais
             
         Returns:
-            Transacao criada
+            Transacao validada (ainda sem row_index)
+        
+        Raises:
+            ValueError: Se algum campo obrigatório estiver vazio
         """
         # Validações de negócio
         if not tipo or not tipo.strip():
@@ -80,5 +83,43 @@ class CriarTransacao:
             detalhes=detalhes.strip() if detalhes else ""
         )
         
-        # Delega ao repositório
-        return self.repository.create(transacao)
+        return transacao
+    
+    def execute(
+        self,
+        tipo: str,
+        descritivo: str,
+        valor: str,
+        data: str,
+        mes: str,
+        situacao: str,
+        conta: str,
+        detalhes: str = ""
+    ) -> Transacao:
+        """
+        Executa o caso de uso
+        
+        Args:
+            tipo: Tipo da transação
+            descritivo: Descrição da transação
+            valor: Valor da transação
+            data: Data da transação (DD/MM/YYYY)
+            mes: Mês da transação
+            situacao: Situação da transação
+            conta: Conta relacionada
+            detalhes: Detalhes adicionais
+        
+        Returns:
+            Transacao criada
+        """
+        # Valida, monta a entidade e delega ao repositório
+        return self.repository.create(self.build_transacao(
+            tipo=tipo,
+            descritivo=descritivo,
+            valor=valor,
+            data=data,
+            mes=mes,
+            situacao=situacao,
+            conta=conta,
+            detalhes=detalhes
+        ))
@@ -19,7 +19,7 @@ class CriarTransacaoCredito:
         """
         self.repository = repository
     
-    def execute(
+    def build_transacao(
         self,
         tipo: str,
         descritivo: str,
@@ -31,7 +31,7 @@ class CriarTransacaoCredito:
         detalhes: str = ""
     ) -> TransacaoCredito:
         """
-        Executa o caso de uso
+        Valida os dados e monta a entidade, sem gravá-la
         
         Args:
             tipo: Tipo da transação
@@ -44,7 +44,10 @@ class CriarTransacaoCredito:
             detalhes: Detalhes adicionais
             
         Returns:
-            TransacaoCredito criada
+            TransacaoCredito validada (ainda sem row_index)
+        
+        Raises:
+            ValueError: Se algum campo obrigatório estiver vazio
         """
         # Validações de negócio
         if not tipo or not tipo.strip():
@@ -80,5 +83,43 @@ class CriarTransacaoCredito:
             detalhes=detalhes.strip() if detalhes else ""
         )
         
-        # Delega ao repositório
-        return self.repository.create(transacao)
+        return transacao
+    
+    def execute(
+        self,
+        tipo: str,
+        descritivo: str,
+        valor: str,
+        data: str,
+        mes: str,
+        situacao: str,
+        cartao: str,
+        detalhes: str = ""
+    ) -> TransacaoCredito:
+        """
+        Executa o caso de uso
+        
+        Args:
+            tipo: Tipo da transação
+            descritivo: Descrição da transação
+            valor: Valor da transação
+            data: Data da transação (DD/MM/YYYY)
+            mes: Mês da transação
+            situacao: Situação da transação
+            cartao: Cartão relacionado
+            detalhes: Detalhes adicionais
+        
+        Returns:
+            TransacaoCredito criada
+        """
+        # Valida, monta a entidade e delega ao repositório
+        return self.repository.create(self.build_transacao(
+            tipo=tipo,
+            descritivo=descritivo,
+            valor=valor,
+            data=data,
+            mes=mes,
+            situacao=situacao,
+            cartao=cartao,
+            detalhes=detalhes
+        ))
@@ -0,0 +1,74 @@
+"""
+Use Case: Criar várias transações em lote
+"""
+from typing import Any, Dict, List
+from app.data.repositories.transacao_repository_interface import TransacaoRepositoryInterface
+from app.use_cases.criar_transacao import CriarTransacao
+
+
+class CriarTransacoesEmLote:
+    """
+    Caso de uso para criar várias transações com uma única gravação
+    """
+    
+    def __init__(self, repository: TransacaoRepositoryInterface):
+        """
+        Inicializa o caso de uso com um repositório
+        
+        Args:
+            repository: Repositório de transações
+        """
+        self.repository = repository
+        self._criar = CriarTransacao(repository)
+    
+    def execute(self, itens: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Executa o caso de uso
+        
+        Cada item é validado pelas mesmas regras da criação individual. Os
+        itens inválidos são reportados sem impedir a gravação dos demais.
+        
+        Args:
+            itens: Lista de dicionários com os campos da criação individual
+        
+        Returns:
+            Dicionário com os totais e o resultado de cada item (na ordem de entrada)
+        """
+        if not itens:
+            raise ValueError("Informe ao menos uma transação")
+        
+        resultados: List[Dict[str, Any]] = [None] * len(itens)
+        validas = []
+        posicoes = []
+        for index, item in enumerate(itens):
+            try:
+                validas.append(self._criar.build_transacao(**item))
+                posicoes.append(index)
+            except ValueError as e:
+                resultados[index] = _resultado(index, erro=str(e))
+        
+        # Delega ao repositório apenas os itens válidos, em uma única operação
+        if validas:
+            gravadas = self.repository.create_many(validas)
+            for index, gravada in zip(posicoes, gravadas):
+                resultados[index] = _resultado(index, transacao=gravada["transacao"], erro=gravada["erro"])
+        
+        criadas = sum(1 for r in resultados if r["sucesso"])
+        return {
+            "total": len(itens),
+            "criadas": criadas,
+            "falhas": len(itens) - criadas,
+            "resultados": resultados
+        }
+
+
+def _resultado(index: int, transacao=None, erro: str = None) -> Dict[str, Any]:
+    """Monta o resultado de um item do lote"""
+    sucesso = erro is None
+    return {
+        "index": index,
+        "sucesso": sucesso,
+        "row_index": transacao.row_index if sucesso and transacao else None,
+        "transacao": transacao if sucesso else None,
+        "erro": erro
+    }
@@ -0,0 +1,68 @@
+"""
+Use Case: Deletar várias transações em lote
+"""
+from typing import Any, Dict, List
+from app.data.repositories.transacao_repository_interface import TransacaoRepositoryInterface
+
+
+class DeletarTransacoesEmLote:
+    """
+    Caso de uso para deletar várias transações com uma única operação
+    """
+    
+    def __init__(self, repository: TransacaoRepositoryInterface):
+        """
+        Inicializa o caso de uso com um repositório
+        
+        Args:
+            repository: Repositório de transações
+        """
+        self.repository = repository
+    
+    def execute(self, row_indexes: List[int]) -> Dict[str, Any]:
+        """
+        Executa o caso de uso
+        
+        Os índices se referem à planilha antes da remoção (como retornados
+        pela listagem), independentemente da ordem em que são informados.
+        Linhas inexistentes são reportadas como falha sem impedir as demais.
+        
+        Args:
+            row_indexes: Índices das linhas a deletar
+        
+        Returns:
+            Dicionário com os totais e o resultado de cada linha (na ordem de entrada)
+        """
+        if not row_indexes:
+            raise ValueError("Informe ao menos uma linha")
+        
+        resultados: List[Dict[str, Any]] = []
+        validas = []
+        vistas = set()
+        for row_index in row_indexes:
+            erro = None
+            if row_index < 2:
+                erro = "Índice da linha deve ser >= 2 (linha 1 é o cabeçalho)"
+            elif row_index in vistas:
+                erro = f"Linha {row_index} repetida no lote"
+            else:
+                validas.append(row_index)
+                vistas.add(row_index)
+            resultados.append({"row_index": row_index, "sucesso": erro is None, "erro": erro})
+        
+        # Delega ao repositório todas as remoções válidas de uma vez; as linhas
+        # que não existem no extrato não são enviadas e viram falhas do item
+        if validas:
+            removidas = set(self.repository.delete_many(validas))
+            for resultado in resultados:
+                if resultado["sucesso"] and resultado["row_index"] not in removidas:
+                    resultado["sucesso"] = False
+                    resultado["erro"] = f"Linha {resultado['row_index']} não encontrada"
+        
+        deletadas = sum(1 for r in resultados if r["sucesso"])
+        return {
+            "total": len(row_indexes),
+            "deletadas": deletadas,
+            "falhas": len(row_indexes) - deletadas,
+            "resultados": resultados
+        }
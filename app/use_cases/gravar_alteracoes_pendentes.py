@@ -0,0 +1,33 @@
+"""
+Use Case: Gravar as alterações pendentes do write-behind
+"""
+from typing import Any, Callable, Dict
+
+
+class GravarAlteracoesPendentes:
+    """
+    Caso de uso para forçar a gravação imediata das alterações em fila
+    """
+    
+    def __init__(self, enabled: bool, flush: Callable[[], Dict[str, Dict[str, Any]]]):
+        """
+        Inicializa o caso de uso
+        
+        Args:
+            enabled: Se o modo write-behind está habilitado
+            flush: Função que grava as filas e retorna as estatísticas de cada uma
+        """
+        self.enabled = enabled
+        self.flush = flush
+    
+    def execute(self) -> Dict[str, Any]:
+        """
+        Grava na planilha todas as alterações pendentes
+        
+        Returns:
+            Dicionário com o status do modo e as estatísticas de cada fila
+        """
+        return {
+            "enabled": self.enabled,
+            "queues": self.flush() if self.enabled else {}
+        }
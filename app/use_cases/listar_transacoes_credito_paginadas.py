@@ -31,7 +31,9 @@ class ListarTransacoesCreditoPaginadas:
         mes: Optional[str] = None,
         situacao: Optional[str] = None,
         cartao: Optional[str] = None,
-        order_by: str = "data"
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Executa o caso de uso
@@ -47,6 +49,8 @@ class ListarTransacoesCreditoPaginadas:
             situacao: Filtro por situação
             cartao: Filtro por cartão
             order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, cartao)
+            usar_cursor: Se True, pagina por cursor (retorna next_cursor)
+            cursor: Cursor retornado pela página anterior
             
         Returns:
             Dicionário com dados paginados
@@ -81,5 +85,7 @@ class ListarTransacoesCreditoPaginadas:
             mes=mes,
             situacao=situacao,
             cartao=cartao,
-            order_by=order_by
+            order_by=order_by,
+            usar_cursor=usar_cursor,
+            cursor=cursor
         )
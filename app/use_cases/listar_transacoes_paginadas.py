@@ -31,7 +31,9 @@ class ListarTransacoesPaginadas:
         mes: Optional[str] = None,
         situacao: Optional[str] = None,
         conta: Optional[str] = None,
-        order_by: str = "data"
+        order_by: str = "data",
+        usar_cursor: bool = False,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Executa o caso de uso
@@ -47,6 +49,8 @@ class ListarTransacoesPaginadas:
             situacao: Filtro por situação
             conta: Filtro por conta
             order_by: Campo para ordenação (data, tipo, categoria, valor, situacao, conta)
+            usar_cursor: Se True, pagina por cursor (retorna next_cursor)
+            cursor: Cursor retornado pela página anterior
             
         Returns:
             Dicionário com dados paginados
@@ -81,5 +85,7 @@ class ListarTransacoesPaginadas:
             mes=mes,
             situacao=situacao,
             conta=conta,
-            order_by=order_by
+            order_by=order_by,
+            usar_cursor=usar_cursor,
+            cursor=cursor
         )
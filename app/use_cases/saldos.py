@@ -2,24 +2,24 @@
 Casos de Uso para Saldos
 """
 from typing import List
-from app.domain.entities import Saldo, SaldoConta
+from app.domain.entities import SaldoConta, Saldos
 from app.data.repositories.google_sheets_api_repository import GoogleSheetsAPIRepository
 
 
-class ObterSaldoGeral:
-    """Caso de uso para obter o saldo geral"""
+class ObterSaldos:
+    """Caso de uso para obter o saldo geral e o saldo por conta juntos"""
     
     def __init__(self, repository: GoogleSheetsAPIRepository):
         self.repository = repository
     
-    def execute(self) -> Saldo:
+    def execute(self) -> Saldos:
         """
-        Obtém o saldo geral
+        Obtém o saldo geral e o saldo de cada conta (uma única leitura)
         
         Returns:
-            Entidade Saldo
+            Entidade Saldos
         """
-        return self.repository.get_saldo_geral()
+        return self.repository.get_saldos()
 
 
 class ObterSaldoPorConta:
@@ -1,12 +1,17 @@
 """
 Use Case: Verificar saúde da aplicação
 """
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from app.core.config import Settings
 from app.data.repositories.transacao_repository_interface import TransacaoRepositoryInterface
 
 
 class VerificarSaude:
     """
-    Caso de uso para verificar a saúde da aplicação
+    Caso de uso para a verificação completa (deep) da saúde da aplicação
     """
     
     def __init__(self, repository: TransacaoRepositoryInterface):
@@ -20,18 +25,18 @@ class VerificarSaude:
     
     def execute(self) -> dict:
         """
-        Verifica a conexão com o Google Sheets
+        Verifica a conexão com o Google Sheets lendo a aba de transações inteira
         
         Returns:
             Dicionário com status da aplicação
         """
         try:
-            # Tenta obter dados para verificar a conexão
-            self.repository.get_all()
+            checks = self.repository.health_check(deep=True)
             return {
                 "status": "ok",
                 "google_sheets": "connected",
-                "error": None
+                "error": None,
+                "checks": checks
             }
         except Exception as e:
             return {
@@ -39,3 +44,89 @@ class VerificarSaude:
                 "google_sheets": "disconnected",
                 "error": str(e)
             }
+
+
+class VerificarProntidao:
+    """
+    Caso de uso para a verificação de prontidão (readiness)
+    
+    Consulta apenas metadados da planilha e reaproveita o último resultado
+    durante `health_check_interval_seconds`, de modo que health checks
+    frequentes não consomem a cota de leitura do Google Sheets.
+    """
+    
+    def __init__(
+        self,
+        repository_provider: Callable[[], TransacaoRepositoryInterface],
+        settings: Settings,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o caso de uso
+        
+        Args:
+            repository_provider: Função que retorna o repositório de transações
+                (a conexão é feita dentro da verificação para que falhas sejam reportadas)
+            settings: Configurações da aplicação
+            clock: Função que retorna o tempo atual (injetável para testes)
+        """
+        self.repository_provider = repository_provider
+        self.settings = settings
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_result: Optional[dict] = None
+        self._last_checked_at: Optional[float] = None
+    
+    def execute(self) -> dict:
+        """
+        Verifica credenciais e acesso à planilha (com resultado em cache)
+        
+        Returns:
+            Dicionário com status da aplicação
+        """
+        with self._lock:
+            now = self._clock()
+            if (
+                self._last_result is not None
+                and (now - self._last_checked_at) < self.settings.health_check_interval_seconds
+            ):
+                return {**self._last_result, "cached": True}
+            
+            result = self._check()
+            self._last_result = result
+            self._last_checked_at = now
+            return {**result, "cached": False}
+    
+    def _check(self) -> dict:
+        """Executa a verificação de prontidão"""
+        checked_at = datetime.now(timezone.utc).isoformat()
+        
+        # A planilha falsa (SHEETS_BACKEND=fake) não usa credenciais
+        if self.settings.sheets_backend != "fake" and not (
+            self.settings.google_sheets_id
+            and self.settings.google_service_account_email
+            and self.settings.google_private_key
+        ):
+            return {
+                "status": "error",
+                "google_sheets": "not_configured",
+                "error": "Credenciais do Google Sheets não configuradas",
+                "checked_at": checked_at
+            }
+        
+        try:
+            checks = self.repository_provider().health_check(deep=False)
+            return {
+                "status": "ok",
+                "google_sheets": "connected",
+                "error": None,
+                "checks": checks,
+                "checked_at": checked_at
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "google_sheets": "disconnected",
+                "error": str(e),
+                "checked_at": checked_at
+            }
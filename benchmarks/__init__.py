@@ -0,0 +1,3 @@
+"""
+Benchmarks de desempenho da API (executar a partir da raiz do projeto)
+"""
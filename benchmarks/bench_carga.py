@@ -0,0 +1,123 @@
+"""
+Benchmark: carga na API completa com a planilha falsa em memória
+
+Sobe a aplicação real (rotas, middleware, cache, agendador de cota,
+retentativas) com `SHEETS_BACKEND=fake` e dispara N clientes concorrentes
+contra uma mistura de leituras e escritas, sem acesso ao Google. Latência,
+jitter e 429 simulados vêm das opções abaixo (ver `FakeSheetsBackend`).
+
+Uso:
+    python -m benchmarks.bench_carga --clientes 16 --requisicoes 50 --linhas 5000 --latencia 0.15 --jitter 0.1
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+
+TRANSACAO = {
+    "tipo": "DESPESA", "descritivo": "Carga", "valor": "R$ 10,00", "data": "01/01/2025",
+    "mes": "01-Janeiro", "detalhes": "", "situacao": "Pago", "conta": "Nubank"
+}
+
+# (método, caminho, query string, corpo, peso)
+MISTURA: List[Tuple[str, str, bytes, Any, int]] = [
+    ("GET", "/api/transacoes", b"page=1&page_size=20", None, 6),
+    ("GET", "/api/transacoes", b"page=1&page_size=20&mes=mar%C3%A7o&conta=nubank", None, 3),
+    ("GET", "/api/transacoes-credito", b"page=1&page_size=20", None, 2),
+    ("GET", "/api/configuracoes", b"", None, 2),
+    ("GET", "/api/saldos", b"", None, 2),
+    ("POST", "/api/transacoes", b"", TRANSACAO, 1),
+]
+
+
+async def _chamar(app: Any, metodo: str, caminho: str, query: bytes, corpo: Any) -> int:
+    """Executa uma requisição ASGI na aplicação e retorna o status"""
+    dados = json.dumps(corpo).encode() if corpo is not None else b""
+    status = 0
+    
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": dados, "more_body": False}
+    
+    async def send(mensagem: Dict[str, Any]):
+        nonlocal status
+        if mensagem["type"] == "http.response.start":
+            status = mensagem["status"]
+    
+    scope = {
+        "type": "http", "method": metodo, "path": caminho, "raw_path": caminho.encode(),
+        "query_string": query, "headers": [(b"content-type", b"application/json")],
+        "http_version": "1.1", "scheme": "http", "server": ("bench", 80), "client": ("bench", 1),
+        "root_path": "", "app": app
+    }
+    await app(scope, receive, send)
+    return status
+
+
+async def _rodar(app: Any, clientes: int, requisicoes: int) -> Tuple[float, Dict[str, List[float]], Counter]:
+    """Dispara os clientes concorrentes e coleta latências por rota e status"""
+    roteiro = [item for item in MISTURA for _ in range(item[4])]
+    latencias: Dict[str, List[float]] = {}
+    status: Counter = Counter()
+    
+    async def cliente(numero: int):
+        for i in range(requisicoes):
+            metodo, caminho, query, corpo, _ = roteiro[(numero + i) % len(roteiro)]
+            inicio = time.perf_counter()
+            status[await _chamar(app, metodo, caminho, query, corpo)] += 1
+            latencias.setdefault(f"{metodo} {caminho}", []).append(time.perf_counter() - inicio)
+    
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(n) for n in range(clientes)))
+    return time.perf_counter() - inicio, latencias, status
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    """Percentil (ms) de uma lista de latências"""
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--requisicoes", type=int, default=50)
+    parser.add_argument("--linhas", type=int, default=5000)
+    parser.add_argument("--latencia", type=float, default=0.15)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--taxa-429", type=float, default=0.0)
+    parser.add_argument("--cota-por-minuto", type=float, default=0.0)
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+    
+    # As configurações são lidas na importação da aplicação
+    os.environ.update({
+        "SHEETS_BACKEND": "fake",
+        "FAKE_SHEETS_ROWS": str(args.linhas),
+        "FAKE_SHEETS_LATENCY_SECONDS": str(args.latencia),
+        "FAKE_SHEETS_JITTER_SECONDS": str(args.jitter),
+        "FAKE_SHEETS_QUOTA_ERROR_RATE": str(args.taxa_429),
+        "FAKE_SHEETS_QUOTA_PER_MINUTE": str(args.cota_por_minuto),
+        "FAKE_SHEETS_SEED": str(args.semente),
+    })
+    from main import app
+    
+    total = args.clientes * args.requisicoes
+    print(
+        f"{args.clientes} clientes x {args.requisicoes} requisições, {args.linhas} linhas, "
+        f"latência {args.latencia}s + jitter {args.jitter}s, 429 {args.taxa_429:.0%}"
+    )
+    duracao, latencias, status = asyncio.run(_rodar(app, args.clientes, args.requisicoes))
+    print(f"total: {duracao:6.2f}s  {total / duracao:7.1f} req/s  status: {dict(sorted(status.items()))}")
+    for rota, valores in sorted(latencias.items()):
+        print(
+            f"{rota:>28}: n={len(valores):4d}  p50 {_percentil(valores, 0.5):7.1f} ms  "
+            f"p95 {_percentil(valores, 0.95):7.1f} ms  max {max(valores) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
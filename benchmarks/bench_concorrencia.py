@@ -0,0 +1,76 @@
+"""
+Benchmark: vazão da listagem de transações com N clientes concorrentes
+
+Simula um backend lento (cada leitura do Google Sheets leva `--latencia`
+segundos) e compara duas formas de executar o caso de uso dentro da rota:
+
+- bloqueante: chama `use_case.execute` diretamente no event loop (comportamento antigo)
+- executor: rota real, que delega a chamada ao pool de threads (`run_blocking`)
+
+Uso:
+    python -m benchmarks.bench_concorrencia --clientes 16 --requisicoes 4 --latencia 0.2
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from app.api.routes import transacoes
+from app.use_cases.listar_transacoes_paginadas import ListarTransacoesPaginadas
+
+
+class RepositorioLento:
+    """Repositório falso que simula a latência de uma leitura do Google Sheets"""
+    
+    def __init__(self, latencia: float):
+        self.latencia = latencia
+    
+    def get_paginated(self, page: int = 1, page_size: int = 10, **filtros) -> Dict[str, Any]:
+        time.sleep(self.latencia)
+        return {"total": 0, "page": page, "page_size": page_size, "total_pages": 1, "items": []}
+
+
+async def _listar(use_case: ListarTransacoesPaginadas):
+    """Chama a rota real de listagem"""
+    return await transacoes.listar_transacoes(
+        page=1, page_size=10, tipo=None, categoria=None, data_inicio=None,
+        data_fim=None, mes=None, situacao=None, conta=None, order_by="data",
+        usar_cursor=False, cursor=None,
+        use_case=use_case
+    )
+
+
+async def _listar_bloqueante(use_case: ListarTransacoesPaginadas):
+    """Executa o caso de uso diretamente no event loop (sem offload)"""
+    return use_case.execute(page=1, page_size=10)
+
+
+async def _rodar(handler, use_case, clientes: int, requisicoes: int) -> float:
+    """Dispara `clientes` tarefas concorrentes, cada uma com `requisicoes` chamadas"""
+    async def cliente():
+        for _ in range(requisicoes):
+            await handler(use_case)
+    
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(clientes)))
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--requisicoes", type=int, default=4)
+    parser.add_argument("--latencia", type=float, default=0.2)
+    args = parser.parse_args()
+    
+    use_case = ListarTransacoesPaginadas(RepositorioLento(args.latencia))
+    total = args.clientes * args.requisicoes
+    
+    print(f"{args.clientes} clientes x {args.requisicoes} requisições, latência do backend {args.latencia}s")
+    for nome, handler in [("bloqueante", _listar_bloqueante), ("executor", _listar)]:
+        duracao = asyncio.run(_rodar(handler, use_case, args.clientes, args.requisicoes))
+        print(f"{nome:>11}: {duracao:6.2f}s  {total / duracao:7.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
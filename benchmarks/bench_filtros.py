@@ -0,0 +1,99 @@
+"""
+Benchmark: filtros da listagem paginada sobre um extrato sintético
+
+Compara a implementação antiga (uma list comprehension por filtro, com
+`.lower()` dos campos a cada requisição, seguida de ordenação completa e
+fatiamento) com a atual: predicado único compilado sobre campos já
+normalizados, alimentando a seleção top-k da página.
+
+Uso:
+    python -m benchmarks.bench_filtros --linhas 50000 --repeticoes 5
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from app.data.query.ledger import Ledger
+from app.data.query.pagination import PaginationEngine
+from app.data.repositories.google_sheets_repository import GoogleSheetsTransacaoRepository
+from app.domain.entities import Transacao
+from benchmarks.bench_ordenacao import _parse_date_antigo, ordenar_antigo
+from benchmarks.ledger_sintetico import gerar_transacoes
+
+
+CENARIOS: Dict[str, Dict[str, Any]] = {
+    "sem filtros": {},
+    "tipo": {"tipo": "DESPESA"},
+    "tipo+conta+situação": {"tipo": "DESPESA", "conta": "nubank", "situacao": "pago"},
+    "categoria": {"categoria": "mercado"},
+    "período+mês": {"data_inicio": "01/01/2024", "data_fim": "31/12/2024", "mes": "mar"},
+}
+
+
+def filtrar_antigo(transacoes: List[Transacao], **filtros) -> List[Transacao]:
+    """Reprodução dos filtros anteriores (uma lista nova por filtro)"""
+    filtered = transacoes
+    if filtros.get("tipo"):
+        tipo_upper = filtros["tipo"].upper()
+        filtered = [t for t in filtered if t.tipo.upper() == tipo_upper]
+    if filtros.get("categoria"):
+        categoria_lower = filtros["categoria"].lower()
+        filtered = [t for t in filtered if categoria_lower in t.descritivo.lower()]
+    if filtros.get("data_inicio") or filtros.get("data_fim"):
+        dt_inicio = _parse_date_antigo(filtros.get("data_inicio") or "")
+        dt_fim = _parse_date_antigo(filtros.get("data_fim") or "")
+        date_filtered = []
+        for t in filtered:
+            dt = _parse_date_antigo(t.data)
+            if dt and not (dt_inicio and dt < dt_inicio) and not (dt_fim and dt > dt_fim):
+                date_filtered.append(t)
+        filtered = date_filtered
+    for campo in ("mes", "situacao", "conta"):
+        if filtros.get(campo):
+            valor = filtros[campo].lower()
+            filtered = [t for t in filtered if valor in getattr(t, campo).lower()]
+    return filtered
+
+
+def _medir(func: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--order-by", default="data")
+    args = parser.parse_args()
+    
+    transacoes = gerar_transacoes(args.linhas)
+    
+    # Apenas os métodos de consulta são usados: não conecta ao Google
+    repo = GoogleSheetsTransacaoRepository.__new__(GoogleSheetsTransacaoRepository)
+    ledger = Ledger(transacoes, name="benchmark")
+    repo._get_ledger = lambda: ledger
+    # Sem cache de permutações: mede sempre o caminho filtro + top-k
+    repo._pages = PaginationEngine("benchmark", max_entries=0)
+    
+    print(f"{args.linhas} transações, página 1 com 10 itens, order_by={args.order_by}\n")
+    print(f"{'cenário':<22}{'antes (ms)':>12}{'depois (ms)':>13}{'ganho':>8}")
+    for nome, filtros in CENARIOS.items():
+        antes = _medir(
+            lambda: ordenar_antigo(filtrar_antigo(transacoes, **filtros), args.order_by)[:10],
+            args.repeticoes
+        )
+        depois = _medir(
+            lambda: repo.get_paginated(page=1, page_size=10, order_by=args.order_by, **filtros),
+            args.repeticoes
+        )
+        print(f"{nome:<22}{antes:>12.1f}{depois:>13.1f}{antes / depois:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: filtros com índices secundários x varredura completa
+
+Compara o filtro compilado sobre todas as linhas (`apply_filter`) com o
+extrato indexado (`Ledger.filter`) em consultas típicas do dashboard e do
+autocomplete de categoria (índice de trigramas), e mede o custo da
+manutenção incremental dos índices.
+
+Uso:
+    python -m benchmarks.bench_indices --linhas 50000 --repeticoes 5
+"""
+import argparse
+import time
+from dataclasses import replace
+from typing import Callable, Dict
+
+from app.data.query.filters import FilterCriteria, apply_filter
+from app.data.query.ledger import Ledger
+from benchmarks.ledger_sintetico import gerar_transacoes
+
+
+CONSULTAS: Dict[str, FilterCriteria] = {
+    "mês + conta": FilterCriteria(mes="março", conta="nubank"),
+    "mês + conta + tipo": FilterCriteria(mes="março", conta="nubank", tipo="DESPESA"),
+    "período de 1 mês": FilterCriteria(data_inicio="01/03/2024", data_fim="31/03/2024"),
+    "período + situação": FilterCriteria(data_inicio="01/01/2024", data_fim="31/03/2024", situacao="pendente"),
+    "categoria (autocomplete)": FilterCriteria(categoria="farmac"),
+    "categoria sem acento": FilterCriteria(categoria="manutencao 12"),
+    "categoria curta": FilterCriteria(categoria="ag"),
+    "só tipo (pouco seletivo)": FilterCriteria(tipo="DESPESA"),
+}
+
+
+def _medir(func: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    
+    transacoes = gerar_transacoes(args.linhas)
+    inicio = time.perf_counter()
+    ledger = Ledger(transacoes, name="benchmark")
+    print(f"{args.linhas} transações; índices construídos em {(time.perf_counter() - inicio) * 1000:.0f} ms\n")
+    
+    print(f"{'consulta':<28}{'itens':>8}{'varredura (ms)':>16}{'índices (ms)':>14}{'ganho':>8}")
+    for nome, criteria in CONSULTAS.items():
+        total = len(apply_filter(transacoes, criteria))
+        varredura = _medir(lambda: apply_filter(transacoes, criteria), args.repeticoes)
+        indices = _medir(lambda: ledger.filter(criteria), args.repeticoes)
+        print(f"{nome:<28}{total:>8}{varredura:>16.2f}{indices:>14.2f}{varredura / indices:>7.1f}x")
+    
+    ultima = ledger.items[-1]
+    inicio = time.perf_counter()
+    for i in range(100):
+        ledger.append(replace(ultima, row_index=ultima.row_index + i + 1))
+    append = (time.perf_counter() - inicio) * 10
+    inicio = time.perf_counter()
+    for item in ledger.items[:100]:
+        ledger.replace(replace(item, mes="Dezembro"))
+    atualizacao = (time.perf_counter() - inicio) * 10
+    print(f"\nmanutenção: inclusão {append:.3f} ms/op, atualização {atualizacao:.3f} ms/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: ordenação e filtro por data sobre um extrato sintético
+
+Compara a implementação antiga, que convertia a data (`datetime.strptime`)
+e o valor ("R$ 1.234,56") dentro da chave de ordenação a cada requisição,
+com a atual, que usa as chaves tipadas calculadas na criação da entidade
+(`data_ordenacao` e `valor_centavos`).
+
+Uso:
+    python -m benchmarks.bench_ordenacao --linhas 50000 --repeticoes 5
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, List
+
+from app.data.query.filters import FilterCriteria, apply_filter
+from app.data.repositories.google_sheets_repository import GoogleSheetsTransacaoRepository
+from app.domain.entities import Transacao
+from benchmarks.ledger_sintetico import gerar_transacoes
+
+
+ORDER_BY = ["data", "tipo", "categoria", "valor", "situacao", "conta"]
+
+
+def _parse_date_antigo(date_str: str):
+    try:
+        return datetime.strptime(date_str.strip(), "%d/%m/%Y")
+    except Exception:
+        return None
+
+
+def _parse_valor_antigo(valor_str: str) -> float:
+    try:
+        clean = valor_str.replace("R$", "").replace(" ", "").replace(".", "").replace(",", ".")
+        return float(clean)
+    except Exception:
+        return 0.0
+
+
+def ordenar_antigo(transacoes: List[Transacao], order_by: str) -> List[Transacao]:
+    """Reprodução da ordenação anterior (conversões dentro da chave)"""
+    if order_by == "tipo":
+        return sorted(transacoes, key=lambda t: t.tipo.lower())
+    if order_by == "categoria":
+        return sorted(transacoes, key=lambda t: t.descritivo.lower())
+    if order_by == "valor":
+        return sorted(transacoes, key=lambda t: _parse_valor_antigo(t.valor), reverse=True)
+    if order_by == "situacao":
+        return sorted(transacoes, key=lambda t: t.situacao.lower())
+    if order_by == "conta":
+        return sorted(transacoes, key=lambda t: t.conta.lower())
+    return sorted(transacoes, key=lambda t: _parse_date_antigo(t.data) or datetime.min, reverse=True)
+
+
+def filtrar_data_antigo(transacoes: List[Transacao], inicio: str, fim: str) -> List[Transacao]:
+    """Reprodução do filtro de intervalo de datas anterior"""
+    dt_inicio = _parse_date_antigo(inicio)
+    dt_fim = _parse_date_antigo(fim)
+    resultado = []
+    for t in transacoes:
+        dt = _parse_date_antigo(t.data)
+        if dt and dt_inicio <= dt <= dt_fim:
+            resultado.append(t)
+    return resultado
+
+
+def _medir(func: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    
+    inicio = time.perf_counter()
+    transacoes = gerar_transacoes(args.linhas)
+    print(f"{args.linhas} transações geradas em {(time.perf_counter() - inicio) * 1000:.0f} ms "
+          f"(inclui o cálculo das chaves tipadas)")
+    
+    # Apenas os métodos de filtro/ordenação são usados: não conecta ao Google
+    repo = GoogleSheetsTransacaoRepository.__new__(GoogleSheetsTransacaoRepository)
+    
+    print(f"\n{'order_by':<12}{'antes (ms)':>12}{'depois (ms)':>13}{'ganho':>8}")
+    for order_by in ORDER_BY:
+        antes = _medir(lambda: ordenar_antigo(transacoes, order_by), args.repeticoes)
+        depois = _medir(lambda: repo._sort_transacoes(transacoes, order_by), args.repeticoes)
+        print(f"{order_by:<12}{antes:>12.1f}{depois:>13.1f}{antes / depois:>7.1f}x")
+    
+    antes = _medir(lambda: filtrar_data_antigo(transacoes, "01/03/2024", "30/09/2024"), args.repeticoes)
+    criteria = FilterCriteria(data_inicio="01/03/2024", data_fim="30/09/2024")
+    depois = _medir(lambda: apply_filter(transacoes, criteria), args.repeticoes)
+    print(f"{'filtro data':<12}{antes:>12.1f}{depois:>13.1f}{antes / depois:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
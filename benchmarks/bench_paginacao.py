@@ -0,0 +1,75 @@
+"""
+Benchmark: paginação por número de página e tamanho do extrato
+
+Compara, para cada página, três formas de obter os itens:
+
+- ordenação completa: filtra, ordena tudo e fatia (comportamento antigo)
+- primeira visita: `PaginationEngine` sem permutação em cache (top-k nas
+  páginas iniciais, ordenação completa nas demais)
+- navegação: `PaginationEngine` com a permutação ordenada já em cache
+  (usuário avançando pelas páginas da mesma listagem)
+
+Uso:
+    python -m benchmarks.bench_paginacao --tamanhos 10000 50000 200000 --paginas 1 2 10 100
+"""
+import argparse
+import time
+from typing import Callable
+
+from app.data.query.filters import FilterCriteria, apply_filter
+from app.data.query.pagination import PaginationEngine
+from app.data.query.sorting import sort_items
+from benchmarks.ledger_sintetico import gerar_transacoes
+
+
+def _medir(func: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10000, 50000, 200000])
+    parser.add_argument("--paginas", type=int, nargs="+", default=[1, 2, 10, 100])
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--order-by", default="data")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    
+    criteria = FilterCriteria(tipo="DESPESA")
+    print(f"filtro tipo=DESPESA, order_by={args.order_by}, page_size={args.page_size}\n")
+    print(f"{'linhas':>8}{'página':>8}{'ordenação (ms)':>16}{'1ª visita (ms)':>16}{'navegação (ms)':>16}")
+    
+    for tamanho in args.tamanhos:
+        transacoes = gerar_transacoes(tamanho)
+        quente = PaginationEngine("benchmark")
+        
+        for pagina in args.paginas:
+            start = (pagina - 1) * args.page_size
+            end = start + args.page_size
+            
+            completa = _medir(
+                lambda: sort_items(apply_filter(transacoes, criteria), args.order_by)[start:end],
+                args.repeticoes
+            )
+            fria = _medir(
+                lambda: PaginationEngine("benchmark", max_entries=0).paginate(
+                    transacoes, criteria, args.order_by, start, args.page_size
+                ),
+                args.repeticoes
+            )
+            quente.paginate(transacoes, criteria, args.order_by, start, args.page_size)
+            navegacao = _medir(
+                lambda: quente.paginate(transacoes, criteria, args.order_by, start, args.page_size),
+                args.repeticoes
+            )
+            print(f"{tamanho:>8}{pagina:>8}{completa:>16.2f}{fria:>16.2f}{navegacao:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
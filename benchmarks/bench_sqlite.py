@@ -0,0 +1,85 @@
+"""
+Benchmark: espelho SQLite x extrato indexado em memória
+
+Compara, em consultas típicas do dashboard, a primeira página (20 itens)
+obtida pelo caminho em memória (`Ledger.filter` + ordenação + fatia) com a
+consulta indexada no espelho SQLite (`SqliteMirror.paginate`), e mede a
+importação inicial e uma sincronização incremental.
+
+Uso:
+    python -m benchmarks.bench_sqlite --linhas 50000 --repeticoes 5
+"""
+import argparse
+import os
+import tempfile
+import time
+from dataclasses import replace
+from typing import Callable, Dict, Tuple
+
+from app.data.query.filters import FilterCriteria
+from app.data.query.ledger import Ledger
+from app.data.query.sorting import sort_items
+from app.data.sqlite_mirror import SqliteMirror
+from app.domain.entities import Transacao
+from benchmarks.ledger_sintetico import gerar_transacoes
+
+
+CONSULTAS: Dict[str, Tuple[FilterCriteria, str]] = {
+    "sem filtro, por data": (FilterCriteria(), "data"),
+    "mês + conta, por valor": (FilterCriteria(mes="março", conta="nubank"), "valor"),
+    "período de 1 mês": (FilterCriteria(data_inicio="01/03/2024", data_fim="31/03/2024"), "data"),
+    "categoria (autocomplete)": (FilterCriteria(categoria="farmac"), "data"),
+    "só tipo, por categoria": (FilterCriteria(tipo="DESPESA"), "categoria"),
+}
+
+
+def _medir(func: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=50000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    
+    transacoes = gerar_transacoes(args.linhas)
+    ledger = Ledger(transacoes, name="benchmark")
+    snapshot = {"items": transacoes, "token": "1"}
+    
+    with tempfile.TemporaryDirectory() as diretorio:
+        inicio = time.perf_counter()
+        mirror = SqliteMirror(
+            os.path.join(diretorio, "benchmark.sqlite3"),
+            "transacoes",
+            Transacao,
+            "conta",
+            loader=lambda: snapshot["items"],
+            change_token=lambda: snapshot["token"]
+        )
+        print(f"{args.linhas} transações; importação inicial em {(time.perf_counter() - inicio) * 1000:.0f} ms\n")
+        
+        print(f"{'consulta':<28}{'itens':>8}{'memória (ms)':>14}{'sqlite (ms)':>13}{'ganho':>8}")
+        for nome, (criteria, order_by) in CONSULTAS.items():
+            total, _ = mirror.paginate(criteria, order_by, 0, 20)
+            memoria = _medir(lambda: sort_items(ledger.filter(criteria), order_by)[:20], args.repeticoes)
+            sqlite = _medir(lambda: mirror.paginate(criteria, order_by, 0, 20), args.repeticoes)
+            print(f"{nome:<28}{total:>8}{memoria:>14.2f}{sqlite:>13.2f}{memoria / sqlite:>7.1f}x")
+        
+        # Sincronização após 100 linhas alteradas: só elas são gravadas
+        snapshot["items"] = [replace(t, situacao="Pago") if i % (args.linhas // 100 or 1) == 0 else t
+                             for i, t in enumerate(transacoes)]
+        snapshot["token"] = "2"
+        inicio = time.perf_counter()
+        mirror.refresh()
+        print(f"\nsincronização incremental: {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
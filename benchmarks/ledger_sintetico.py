@@ -0,0 +1,84 @@
+"""
+Gerador de extratos sintéticos para os benchmarks
+"""
+import random
+from typing import List
+
+from app.domain.entities import Transacao
+
+
+TIPOS = ["RECEITA", "DESPESA"]
+SITUACOES = ["Pago", "Pendente", "Agendado"]
+CONTAS = ["Nubank", "Itaú", "Inter", "Carteira", "Bradesco"]
+MESES = [
+    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+]
+DESCRITIVOS = [
+    "Supermercado", "Aluguel", "Salário", "Farmácia", "Restaurante",
+    "Combustível", "Academia", "Internet", "Energia", "Água",
+    "Streaming", "Padaria", "Uber", "Presente", "Manutenção"
+]
+
+
+def formatar_valor(centavos: int) -> str:
+    """Formata centavos no padrão da planilha (ex: R$ 1.234,56)"""
+    reais, cents = divmod(abs(centavos), 100)
+    inteiro = f"{reais:,}".replace(",", ".")
+    sinal = "-" if centavos < 0 else ""
+    return f"{sinal}R$ {inteiro},{cents:02d}"
+
+
+def gerar_valores(n: int, seed: int = 42) -> List[List[str]]:
+    """
+    Gera linhas no formato da aba "Extrato" (colunas A..H)
+    
+    Args:
+        n: Quantidade de linhas
+        seed: Semente do gerador aleatório
+    
+    Returns:
+        Lista de linhas com os valores em texto
+    """
+    rnd = random.Random(seed)
+    linhas = []
+    for _ in range(n):
+        mes = rnd.randrange(12)
+        linhas.append([
+            rnd.choice(TIPOS),
+            f"{rnd.choice(DESCRITIVOS)} {rnd.randrange(1000)}",
+            formatar_valor(rnd.randrange(1, 500000)),
+            f"{rnd.randrange(1, 29):02d}/{mes + 1:02d}/{rnd.choice([2023, 2024, 2025])}",
+            MESES[mes],
+            rnd.choice(["", "observação"]),
+            rnd.choice(SITUACOES),
+            rnd.choice(CONTAS)
+        ])
+    return linhas
+
+
+def gerar_transacoes(n: int, seed: int = 42) -> List[Transacao]:
+    """
+    Gera um extrato sintético de transações
+    
+    Args:
+        n: Quantidade de transações
+        seed: Semente do gerador aleatório
+    
+    Returns:
+        Lista de transações com row_index a partir de 2
+    """
+    return [
+        Transacao(
+            tipo=linha[0],
+            descritivo=linha[1],
+            valor=linha[2],
+            data=linha[3],
+            mes=linha[4],
+            detalhes=linha[5],
+            situacao=linha[6],
+            conta=linha[7],
+            row_index=i + 2
+        )
+        for i, linha in enumerate(gerar_valores(n, seed))
+    ]
@@ -1,19 +1,50 @@
 """
 API Controle Financeiro - Ponto de entrada da aplicação
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
-from app.api.routes import transacoes, transacoes_credito, health, configuracoes, saldos
+from app.core.executor import run_blocking, shutdown_executor
+from app.data.write_behind import stop_write_behind_queues
+from app.data.snapshot_store import stop_snapshot_persistence
+from app.api.dependencies import get_transacao_repository, get_transacao_credito_repository
+from app.api.middleware import MetricsMiddleware
+from app.api.routes import transacoes, transacoes_credito, health, configuracoes, saldos, metrics, admin
 
 # Configurações
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ciclo de vida da aplicação"""
+    if settings.write_behind_enabled or settings.read_backend == "sqlite" or settings.snapshot_persist_enabled:
+        # Cria os repositórios já na inicialização para que as alterações
+        # recuperadas do journal sejam gravadas, o espelho SQLite seja
+        # importado e os snapshots salvos sejam restaurados sem esperar uma requisição
+        for factory in (get_transacao_repository, get_transacao_credito_repository):
+            try:
+                await run_blocking(factory)
+            except Exception as e:
+                print(f"Erro ao iniciar os repositórios: {e}")
+    
+    yield
+    
+    # Grava as alterações pendentes antes de encerrar
+    await run_blocking(stop_write_behind_queues)
+    # Salva os snapshots (já com as alterações gravadas) para a próxima inicialização
+    await run_blocking(stop_snapshot_persistence)
+    # Aguarda as chamadas ao Google Sheets em andamento antes de encerrar
+    shutdown_executor()
+
+
 # Aplicação FastAPI
 app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
-    version=settings.app_version
+    version=settings.app_version,
+    lifespan=lifespan
 )
 
 # Configurar CORS
@@ -25,12 +56,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas por rota (latência, status e requisições em andamento)
+app.add_middleware(MetricsMiddleware)
+
 # Incluir routers
 app.include_router(transacoes.router)
 app.include_router(transacoes_credito.router)
 app.include_router(health.router)
 app.include_router(configuracoes.router)
 app.include_router(saldos.router)
+app.include_router(metrics.router)
+app.include_router(metrics.prometheus_router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -45,6 +82,8 @@ async def root():
             "configuracoes": "/api/configuracoes",
             "saldos": "/api/saldos",
             "health": "/api/health",
+            "metrics": "/api/metrics",
+            "prometheus": "/metrics",
             "docs": "/docs",
             "redoc": "/redoc"
         }
@@ -0,0 +1,80 @@
+"""
+Testes dos repositórios com leitura no espelho SQLite (planilha falsa em memória)
+"""
+import os
+import tempfile
+import unittest
+
+from app.core.config import Settings
+from app.data.repositories.google_sheets_credito_repository import GoogleSheetsCreditoRepository
+from app.data.repositories.google_sheets_repository import GoogleSheetsTransacaoRepository
+from app.data.repositories.sqlite_credito_repository import SqliteCreditoRepository
+from app.data.repositories.sqlite_transacao_repository import SqliteTransacaoRepository
+from app.data.sheets_connection import SheetsConnectionManager
+from app.domain.entities import Transacao, TransacaoCredito
+
+
+class SqliteRepositoryTestCase(unittest.TestCase):
+    """Base: planilha falsa nova e arquivo SQLite temporário por teste"""
+    
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.settings = Settings(
+            sheets_backend="fake",
+            fake_sheets_rows=30,
+            read_backend="sqlite",
+            sqlite_path=os.path.join(self._dir.name, "espelho.sqlite3"),
+            sqlite_refresh_interval_seconds=3600
+        )
+        self.connection = SheetsConnectionManager(self.settings)
+    
+    def tearDown(self):
+        self._dir.cleanup()
+
+
+class TestSqliteTransacaoRepository(SqliteRepositoryTestCase):
+
+    def test_update_is_visible_in_mirror_reads(self):
+        repository = SqliteTransacaoRepository(
+            self.settings,
+            GoogleSheetsTransacaoRepository(self.settings, self.connection)
+        )
+        antes = repository.get_paginated(page=1, page_size=100)["items"]
+        row_index = antes[0].row_index
+        
+        atualizada = repository.update(row_index, Transacao(
+            tipo="DESPESA", descritivo="Atualizada no teste", valor="R$ 12,34",
+            data="15/02/2025", mes="02-Fevereiro", situacao="Pago", conta="Nubank"
+        ))
+        
+        self.assertEqual(atualizada.row_index, row_index)
+        depois = {t.row_index: t for t in repository.get_all()}
+        self.assertEqual(depois[row_index].descritivo, "Atualizada no teste")
+        self.assertEqual(depois[row_index].valor, "R$ 12,34")
+        busca = repository.get_paginated(page=1, page_size=100, categoria="atualizada no teste")
+        self.assertEqual([t.row_index for t in busca["items"]], [row_index])
+
+
+class TestSqliteCreditoRepository(SqliteRepositoryTestCase):
+
+    def test_update_is_visible_in_mirror_reads(self):
+        repository = SqliteCreditoRepository(
+            self.settings,
+            GoogleSheetsCreditoRepository(self.settings, self.connection)
+        )
+        antes = repository.get_paginated(page=1, page_size=100)["items"]
+        row_index = antes[0].row_index
+        
+        atualizada = repository.update(row_index, TransacaoCredito(
+            tipo="DESPESA", descritivo="Atualizada no teste", valor="R$ 12,34",
+            data="15/02/2025", mes="02-Fevereiro", situacao="Pago", cartao="Nubank"
+        ))
+        
+        self.assertEqual(atualizada.row_index, row_index)
+        depois = {t.row_index: t for t in repository.get_all()}
+        self.assertEqual(depois[row_index].descritivo, "Atualizada no teste")
+        self.assertEqual(depois[row_index].valor, "R$ 12,34")
+
+
+if __name__ == "__main__":
+    unittest.main()
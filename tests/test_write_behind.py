@@ -0,0 +1,93 @@
+"""
+Testes da fila de gravação posterior (write-behind) sobre a planilha falsa em memória
+"""
+import tempfile
+import unittest
+
+from app.core.config import Settings
+from app.data.repositories.google_sheets_repository import GoogleSheetsTransacaoRepository
+from app.data.sheets_connection import SheetsConnectionManager
+from app.data.write_behind import CREATE, DELETE, UPDATE
+from app.domain.entities import Transacao
+
+
+def _transacao(descritivo: str, valor: str = "R$ 10,00") -> Transacao:
+    return Transacao(
+        tipo="DESPESA", descritivo=descritivo, valor=valor, data="15/02/2025",
+        mes="02-Fevereiro", situacao="Pago", conta="Nubank"
+    )
+
+
+class TestWriteBehindConflict(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        settings = Settings(
+            sheets_backend="fake",
+            fake_sheets_rows=20,
+            cache_revision_check=False,
+            write_behind_enabled=True,
+            write_behind_flush_interval_seconds=3600,
+            write_behind_journal_dir=self._dir.name
+        )
+        connection = SheetsConnectionManager(settings)
+        self.repository = GoogleSheetsTransacaoRepository(settings, connection)
+        self.queue = self.repository._write_behind
+        self.worksheet = connection.spreadsheet()._wrapped.worksheet(settings.google_sheet_name)
+    
+    def tearDown(self):
+        self.queue.stop(flush=False)
+        self._dir.cleanup()
+    
+    def _rows(self):
+        return self.worksheet.get_all_values()
+    
+    def test_update_after_create_at_unexpected_row_is_not_applied_blindly(self):
+        segunda_linha = self._rows()[1]
+        criada = self.repository.create(_transacao("Criada pela API"))
+        linha_prevista = criada.row_index
+        # A remoção separa a inclusão e a atualização em chamadas diferentes
+        self.repository.delete(2)
+        self.repository.update(linha_prevista - 1, _transacao("Criada pela API", valor="R$ 99,00"))
+        self.assertEqual([w.op for w in self.queue.pending()], [CREATE, DELETE, UPDATE])
+        
+        # Linha incluída na planilha por fora enquanto havia pendências
+        self.worksheet.append_row(["DESPESA", "Manual", "R$ 1,00", "01/02/2025", "02-Fevereiro", "", "Pago", "Itaú"])
+        
+        self.queue.flush()
+        stats = self.queue.flush()
+        
+        self.assertEqual(stats["pending"], 0)
+        self.assertEqual(stats["conflicts"], 1)
+        self.assertFalse(stats["held"])
+        rows = self._rows()
+        descritivos = [row[1] for row in rows]
+        self.assertNotIn(segunda_linha, rows)
+        # A linha manual continua intacta e a atualização foi para a linha incluída pela API
+        self.assertEqual(rows[descritivos.index("Manual")][2], "R$ 1,00")
+        self.assertEqual(rows[descritivos.index("Criada pela API")][2], "R$ 99,00")
+        self.assertEqual(descritivos.index("Criada pela API"), descritivos.index("Manual") + 1)
+        
+        snapshot = {t.descritivo: t.valor for t in self.repository.get_all()}
+        self.assertEqual(snapshot["Manual"], "R$ 1,00")
+        self.assertEqual(snapshot["Criada pela API"], "R$ 99,00")
+    
+    def test_writes_after_a_conflict_wait_for_the_snapshot_review(self):
+        self.queue._on_conflict = lambda: None
+        criada = self.repository.create(_transacao("Criada pela API"))
+        self.repository.delete(2)
+        self.repository.update(criada.row_index - 1, _transacao("Criada pela API", valor="R$ 99,00"))
+        self.worksheet.append_row(["DESPESA", "Manual", "R$ 1,00", "01/02/2025", "02-Fevereiro", "", "Pago", "Itaú"])
+        
+        antes = self._rows()
+        self.queue.flush()
+        self.queue.flush()
+        
+        # Só a inclusão foi gravada; a remoção e a atualização aguardam a revisão
+        self.assertEqual(self._rows()[:len(antes)], antes)
+        self.assertEqual([w.op for w in self.queue.pending()], [DELETE, UPDATE])
+        self.assertTrue(self.queue.stats()["held"])
+
+
+if __name__ == "__main__":
+    unittest.main()